@@ -1,7 +1,23 @@
 """
 This package contains a module audiofiles.py that contains classes
-and custom exceptions to handle a simulated audio file server.
+and custom exceptions to handle a simulated audio file server, a
+module schema.py that declares the fields of every audio file type,
+a module idgenerator.py that generates the IDs of new audio files,
+a module encoder.py that serializes the metadata of audio files,
+a module interning.py that pools repeated metadata strings,
+a module codec.py that encodes audio files in a compact binary format,
+a module audiotable.py that contains a columnar container for many
+audio files and a module validation.py that validates many audio
+file metadata dicts at once.
 """
 
 from audiofiles.audiofiles import Audio, Song, Podcast, Audiobook
+from audiofiles.audiofiles import Frozen, FrozenAudio, FrozenSong, FrozenPodcast, FrozenAudiobook
 from audiofiles.audiofiles import MetadataValueError, MetadataGenerationError
+from audiofiles.idgenerator import IDGenerator
+from audiofiles.encoder import set_encoder, encode
+from audiofiles.interning import StringPool, enable_interning, disable_interning
+from audiofiles.schema import Field, Schema, SCHEMAS
+from audiofiles.codec import pack, unpack, pack_batch, unpack_batch
+from audiofiles.audiotable import AudioTable
+from audiofiles.validation import validate_batch
@@ -2,23 +2,15 @@
 This module contains the base Audio class and
 the derived classes Song, Podcast and Audiobook.
 """
-import json
 import typing
 from datetime import datetime
-from dataclasses import dataclass
 
+from audiofiles.errors import MetadataValueError, MetadataGenerationError
+from audiofiles.encoder import encode
+from audiofiles.schema import SCHEMAS, compile_validator, compile_dumper, compile_loader, compile_state
+from audiofiles.schema import compile_key, compile_freezer
 
-class MetadataValueError(Exception):
-    """ Custom exception to handle invalid metadata values """
-    pass
 
-
-class MetadataGenerationError(Exception):
-    """Custom exception to handle failed metadata generation"""
-    pass
-
-
-@dataclass(repr=False)
 class Audio:
     """
     ************
@@ -26,15 +18,20 @@ class Audio:
     ************
     *The base class for all other Audio type classes.*
 
-    Accepts a metadata dictionary and stores it as an attribute.
-    The post construction initialisation runtime checks the
-    metadata for the other relevant attributes and sets them.
+    Accepts a metadata dictionary, checks it for the relevant attributes and sets them.
+    The checks are declared in the schema of the class and compiled into a validator once.
+    The attributes are stored in __slots__ and the 'metadata' dictionary is generated from
+    them on demand, so the values are not stored twice. Any other fields of the metadata
+    dictionary are kept and included in the generated 'metadata'.
 
     The 'ID' and 'uploadtime' attributes are generated if not found in the metadata (considered
     as the first initialization of the object).
-    The 'ID' is generated by taking the absolute value of the hash generated for a string that
-    contains the name, duration and uploadtime attributes.
+    The 'ID' is generated by the IDGenerator of the process, so IDs are unique across workers
+    and increase in the order the audio files were created.
     The 'uploadtime' attribute is expected as an ISO8601 string and stored as a datetime object.
+    Objects created with 'from_document' keep the string and parse it when it is first accessed.
+    The JSON string representation is serialized by the encoder of the encoder module once and
+    cached until an attribute of the object changes.
 
     *****************
     Class Attributes:
@@ -43,122 +40,106 @@ class Audio:
     - ``name``:     An str that describes the name of the audio file. Maximum length of 100.
     - ``duration``: A positive int that describes the length of the audio file. Must be positive.
     - ``uploadtime``:   A datetime object that is the time at which the audio file was uploaded.
-    - ``metadata``: A dict that contains the audio file metadata.
+    - ``type``:     An str that describes the type of the audio file. Defaults to 'Audio'.
+    - ``metadata``: A dict that contains the audio file metadata. Generated on access.
+    - ``FIELDS``:   A tuple of the names of the fields in the audio file metadata.
 
     **************
     Class Methods:
     **************
     - ``validate_string``:  A method that checks if a given object is a string under 100 characters.
     - ``validate_duration``:    A method that checks if a given object is a positive integer.
+    - ``from_document``:    A classmethod that creates an object from a trusted stored document
+                            without validating it.
+    - ``freeze``:   A method that returns a frozen and hashable copy of the object.
     """
-    metadata: dict
-
-    def __post_init__(self):
-        """ Post Construction Initialisation Runtime """
-
-        # Collect 'name' and 'duration'
-        try:
-            self.name = self.metadata['name']
-            self.duration = self.metadata['duration']
-
-        except KeyError as e:
-            raise MetadataValueError(f"metadata value is missing for {e}")
-
-        # Validate the 'name'
-        valid, error = self.validate_string(self.name)
-        if not valid:
-            raise MetadataValueError(f"metadata value is invalid for 'name' - {error}")
-
-        # Validate the 'duration'
-        valid, error = self.validate_duration(self.duration)
-        if not valid:
-            raise MetadataValueError(f"metadata value is invalid for 'duration' - {error}")
-
-        # Collect and validate 'uploadtime'. Generate if not found.
-        if 'uploadtime' not in self.metadata:
+    __slots__ = ('ID', 'name', 'duration', '_uploadtime', 'type', '_extra', '_json')
 
-            try:
-                self.uploadtime = datetime.utcnow()
-                self.metadata['uploadtime'] = self.uploadtime.isoformat()
+    FIELDS: typing.ClassVar[typing.Tuple[str, ...]] = SCHEMAS["Audio"].names
+    TYPE: typing.ClassVar[typing.Optional[str]] = None
 
-            except Exception as e:
-                raise MetadataGenerationError(f"metadata generation failed for 'uploadtime'")
-        else:
+    # The validator, the metadata generator and the trusted loader built from the schema
+    _validate = compile_validator(SCHEMAS["Audio"], "validate_audio")
+    _dump = compile_dumper(SCHEMAS["Audio"], "dump_audio")
+    from_document = classmethod(compile_loader(SCHEMAS["Audio"], "load_audio"))
+    _state = compile_state(SCHEMAS["Audio"], "state_audio")
+    _key = compile_key(SCHEMAS["Audio"], "key_audio")
+    _freeze = compile_freezer(SCHEMAS["Audio"], "freeze_audio")
 
-            try:
-                uploadtime = self.metadata['uploadtime']
-                self.uploadtime = datetime.fromisoformat(uploadtime)
+    def __init__(self, metadata: dict):
+        """ Constructor. Validates the metadata with the compiled schema validator. """
+        self._validate(metadata)
 
-            except ValueError:
-                raise MetadataValueError("metadata value is invalid for 'uploadtime' - not ISO8601")
-            except TypeError:
-                raise MetadataValueError("metadata value is invalid for 'uploadtime' - not an str")
+    @property
+    def uploadtime(self) -> datetime:
+        """ The upload time of the audio file, parsed on first access for trusted documents """
+        uploadtime = self._uploadtime
 
-        # Collect and validate 'ID'. Generate if not found.
-        if '_id' in self.metadata:
-            self.ID = self.metadata['_id']
+        if uploadtime.__class__ is str:
+            uploadtime = self._uploadtime = datetime.fromisoformat(uploadtime)
 
-            if not isinstance(self.ID, int):
-                raise MetadataValueError("metadata value is invalid for '_id' - not an int")
+        return uploadtime
 
-        else:
+    @property
+    def metadata(self) -> dict:
+        """ The metadata dict of the audio file, generated from its attributes """
+        metadata = self._dump()
 
-            try:
-                self.ID = abs(hash(f"{self.name}-{self.duration}-{self.uploadtime.isoformat()}"))
-                self.metadata['_id'] = self.ID
+        if self._extra:
+            metadata.update(self._extra)
 
-            except Exception as e:
-                raise MetadataGenerationError(f"metadata generation failed for 'id'")
+        return metadata
 
-        # Collect and validate 'type'. Generate if not found.
-        if 'type' in self.metadata:
-            if not isinstance(self.metadata['type'], str):
-                raise MetadataValueError("metadata value is invalid for 'type' - not an str")
+    def __eq__(self, other):
+        """ Equality of two Audio Objects of the same class """
+        if other.__class__ is not self.__class__:
+            return NotImplemented
 
-            if self.metadata['type'] not in ['Song', 'Podcast', 'Audiobook', 'Audio']:
-                raise MetadataValueError("metadata value is invalid for 'type' - not supported")
+        return self.metadata == other.metadata
 
-        else:
-            self.metadata['type'] = "Audio"
+    def freeze(self) -> 'Audio':
+        """ A method that returns a frozen copy of the audio file, an object of the frozen variant
+        of its class. The participants of the copy are a tuple and its hash is computed once. """
+        return self._freeze(FROZEN_CLASSES[self.__class__])
 
     def __repr__(self):
         """ Representation of an Audio Object """
         return f"Audio Object <ID={self.ID}, Name={self.name}>"
 
     def __str__(self):
-        """ String Representation of an Audio Object """
-        return json.dumps(self.metadata)
+        """ String Representation of an Audio Object. The JSON of the metadata is cached with a
+        snapshot of the attributes and serialized again only if an attribute has changed. """
+        state = self._state()
+
+        try:
+            snapshot, text = self._json
+            if snapshot == state:
+                return text
+
+        except AttributeError:
+            pass
+
+        text = encode(self.metadata)
+        self._json = (state, text)
+        return text
 
     @classmethod
     def validate_duration(cls, duration: int) -> typing.Tuple[bool, str]:
         """
-        A classmethod that determines if a given object is a string under 100 characters.
+        A classmethod that determines if a given object is a positive integer.
         Returns a validity bool and and an error str in a tuple.
         """
-        if not isinstance(duration, int):
-            return False, "not an int"
-
-        if duration < 0:
-            return False, "not positive"
-
-        return True, "null"
+        return SCHEMAS["Audio"].field("duration").check(duration)
 
     @classmethod
     def validate_string(cls, string: str) -> typing.Tuple[bool, str]:
         """
-        A classmethod that determines if a given object is a positive integer.
+        A classmethod that determines if a given object is a string under 100 characters.
         Returns a validity bool and and an error str in a tuple.
         """
-        if not isinstance(string, str):
-            return False, "not an str"
-
-        if len(string) > 100:
-            return False, "str too long"
-
-        return True, "null"
+        return SCHEMAS["Audio"].field("name").check(string)
 
 
-@dataclass(repr=False)
 class Song(Audio):
     """
     ************
@@ -166,15 +147,20 @@ class Song(Audio):
     ************
     *The class for a Song object.*
 
-    Accepts a metadata dictionary and stores it as an attribute.
-    The post construction initialisation runtime checks the
-    metadata for the other relevant attributes and sets them.
+    Accepts a metadata dictionary, checks it for the relevant attributes and sets them.
+    The checks are declared in the schema of the class and compiled into a validator once.
+    The attributes are stored in __slots__ and the 'metadata' dictionary is generated from
+    them on demand, so the values are not stored twice. Any other fields of the metadata
+    dictionary are kept and included in the generated 'metadata'.
 
     The 'ID' and 'uploadtime' attributes are generated if not found in the metadata (considered
     as the first initialization of the object).
-    The 'ID' is generated by taking the absolute value of the hash generated for a string that
-    contains the name, duration and uploadtime attributes.
+    The 'ID' is generated by the IDGenerator of the process, so IDs are unique across workers
+    and increase in the order the audio files were created.
     The 'uploadtime' attribute is expected as an ISO8601 string and stored as a datetime object.
+    Objects created with 'from_document' keep the string and parse it when it is first accessed.
+    The JSON string representation is serialized by the encoder of the encoder module once and
+    cached until an attribute of the object changes.
 
     *****************
     Class Attributes:
@@ -183,31 +169,35 @@ class Song(Audio):
     - ``name``:     An str that describes the name of the song. Maximum length of 100.
     - ``duration``: A positive int that describes the length of the song. Must be positive.
     - ``uploadtime``:   A datetime object that is the time at which the song was uploaded.
-    - ``metadata``: A dict that contains the song metadata.
+    - ``metadata``: A dict that contains the song metadata. Generated on access.
+    - ``FIELDS``:   A tuple of the names of the fields in the song metadata.
 
     **************
     Class Methods:
     **************
     - ``validate_string``:  A method that checks if a given object is a string under 100 characters.
     - ``validate_duration``:    A method that checks if a given object is a positive integer.
+    - ``from_document``:    A classmethod that creates an object from a trusted stored document
+                            without validating it.
+    - ``freeze``:   A method that returns a frozen and hashable copy of the object.
     """
-    metadata: dict
+    __slots__ = ()
 
-    def __post_init__(self):
-        """ Post Construction Initialisation Runtime """
-        self.metadata['type'] = "Song"
-        super(Song, self).__post_init__()
+    FIELDS: typing.ClassVar[typing.Tuple[str, ...]] = SCHEMAS["Song"].names
+    TYPE: typing.ClassVar[typing.Optional[str]] = "Song"
+
+    _validate = compile_validator(SCHEMAS["Song"], "validate_song")
+    _dump = compile_dumper(SCHEMAS["Song"], "dump_song")
+    from_document = classmethod(compile_loader(SCHEMAS["Song"], "load_song"))
+    _state = compile_state(SCHEMAS["Song"], "state_song")
+    _key = compile_key(SCHEMAS["Song"], "key_song")
+    _freeze = compile_freezer(SCHEMAS["Song"], "freeze_song")
 
     def __repr__(self):
         """ Representation of an Song Object """
         return f"Song Object <ID={self.ID}, Name={self.name}>"
 
-    def __str__(self):
-        """ String Representation of an Song Object """
-        return json.dumps(self.metadata)
-
 
-@dataclass(repr=False)
 class Podcast(Audio):
     """
     ************
@@ -215,16 +205,22 @@ class Podcast(Audio):
     ************
     *The class for a Podcast object.*
 
-    Accepts a metadata dictionary and stores it as an attribute.
-    The post construction initialisation runtime checks the
-    metadata for the other relevant attributes and sets them.
+    Accepts a metadata dictionary, checks it for the relevant attributes and sets them.
+    The checks are declared in the schema of the class and compiled into a validator once.
+    The attributes are stored in __slots__ and the 'metadata' dictionary is generated from
+    them on demand, so the values are not stored twice. Any other fields of the metadata
+    dictionary are kept and included in the generated 'metadata'.
 
     The 'ID' and 'uploadtime' attributes are generated if not found in the metadata (considered
     as the first initialization of the object).
-    The 'ID' is generated by taking the absolute value of the hash generated for a string that
-    contains the name, duration and uploadtime attributes.
+    The 'ID' is generated by the IDGenerator of the process, so IDs are unique across workers
+    and increase in the order the audio files were created.
     The 'uploadtime' attribute is expected as an ISO8601 string and stored as a datetime object.
-    The 'participants' attribute is set to an empty list if none are passed.
+    Objects created with 'from_document' keep the string and parse it when it is first accessed.
+    The JSON string representation is serialized by the encoder of the encoder module once and
+    cached until an attribute of the object changes.
+    The 'participants' attribute is set to an empty list if none are passed, and is only in the
+    'metadata' dictionary if it was passed or has participants.
 
     *****************
     Class Attributes:
@@ -235,72 +231,48 @@ class Podcast(Audio):
     - ``participants``: A list of str that describes the participants of the podcast.
     - ``duration``: A positive int that describes the length of the podcast. Must be positive.
     - ``uploadtime``:   A datetime object that is the time at which the podcast was uploaded.
-    - ``metadata``: A dict that contains the podcast metadata.
+    - ``metadata``: A dict that contains the podcast metadata. Generated on access.
+    - ``FIELDS``:   A tuple of the names of the fields in the podcast metadata.
 
     **************
     Class Methods:
     **************
     - ``validate_string``:  A method that checks if a given object is a string under 100 characters.
     - ``validate_duration``:    A method that checks if a given object is a positive integer.
+    - ``from_document``:    A classmethod that creates an object from a trusted stored document
+                            without validating it.
+    - ``freeze``:   A method that returns a frozen and hashable copy of the object.
     - ``validate_participants``:    A method that checks if a given object is a list of valid str.
     """
-    metadata: dict
-
-    def __post_init__(self):
-        """ Post Construction Initialisation Runtime """
-        self.metadata['type'] = "Podcast"
-        super(Podcast, self).__post_init__()
-
-        # Collect 'host' and 'participants'
-        try:
-            self.host = self.metadata['host']
-            self.participants = self.metadata.get('participants')
-
-        except KeyError as e:
-            raise MetadataValueError(f"metadata value is missing for {e}")
+    __slots__ = ('host', 'participants', '_omitted')
 
-        # Validate the 'host'
-        valid, error = self.validate_string(self.host)
-        if not valid:
-            raise MetadataValueError(f"metadata value is invalid for 'host' - {error}")
+    FIELDS: typing.ClassVar[typing.Tuple[str, ...]] = SCHEMAS["Podcast"].names
+    TYPE: typing.ClassVar[typing.Optional[str]] = "Podcast"
 
-        if not self.participants:
-            self.participants = []
-
-        # Validate the 'participants'
-        valid, error = self.validate_participants(self.participants)
-        if not valid:
-            raise MetadataValueError(f"metadata value is invalid for 'participants' - {error}")
+    _validate = compile_validator(SCHEMAS["Podcast"], "validate_podcast")
+    _dump = compile_dumper(SCHEMAS["Podcast"], "dump_podcast")
+    from_document = classmethod(compile_loader(SCHEMAS["Podcast"], "load_podcast"))
+    _state = compile_state(SCHEMAS["Podcast"], "state_podcast")
+    _key = compile_key(SCHEMAS["Podcast"], "key_podcast")
+    _freeze = compile_freezer(SCHEMAS["Podcast"], "freeze_podcast")
 
     def __repr__(self):
         """ Representation of an Podcast Object """
         return f"Podcast Object <ID={self.ID}, Name={self.name}>"
 
-    def __str__(self):
-        """ String Representation of an Podcast Object """
-        return json.dumps(self.metadata)
-
     @classmethod
     def validate_participants(cls, participants: list) -> typing.Tuple[bool, str]:
         """
         A classmethod that determines if a given object is a list of valid strings (under
         100 characters). Returns a validity bool and and an error str in a tuple.
         """
+        # The schema check accepts an empty value, which the constructors replace with a list
         if not isinstance(participants, list):
             return False, "not a list"
 
-        if len(participants) > 10:
-            return False, "too many participants"
-
-        for count, participant in enumerate(participants, start=1):
-            valid, error = cls.validate_string(participant)
-            if not valid:
-                return False, f"participant {count} - {error}"
-
-        return True, "null"
+        return SCHEMAS["Podcast"].field("participants").check(participants)
 
 
-@dataclass(repr=False)
 class Audiobook(Audio):
     """
     ************
@@ -308,15 +280,20 @@ class Audiobook(Audio):
     ************
     *The class for a Audiobook object.*
 
-    Accepts a metadata dictionary and stores it as an attribute.
-    The post construction initialisation runtime checks the
-    metadata for the other relevant attributes and sets them.
+    Accepts a metadata dictionary, checks it for the relevant attributes and sets them.
+    The checks are declared in the schema of the class and compiled into a validator once.
+    The attributes are stored in __slots__ and the 'metadata' dictionary is generated from
+    them on demand, so the values are not stored twice. Any other fields of the metadata
+    dictionary are kept and included in the generated 'metadata'.
 
     The 'ID' and 'uploadtime' attributes are generated if not found in the metadata (considered
     as the first initialization of the object).
-    The 'ID' is generated by taking the absolute value of the hash generated for a string that
-    contains the name, duration and uploadtime attributes.
+    The 'ID' is generated by the IDGenerator of the process, so IDs are unique across workers
+    and increase in the order the audio files were created.
     The 'uploadtime' attribute is expected as an ISO8601 string and stored as a datetime object.
+    Objects created with 'from_document' keep the string and parse it when it is first accessed.
+    The JSON string representation is serialized by the encoder of the encoder module once and
+    cached until an attribute of the object changes.
 
     *****************
     Class Attributes:
@@ -327,43 +304,136 @@ class Audiobook(Audio):
     - ``narrator``: An str that describes the narrator of the audiobook. Maximum length of 100.
     - ``duration``: A positive int that describes the length of the song. Must be positive.
     - ``uploadtime``:   A datetime object that is the time at which the song was uploaded.
-    - ``metadata``: A dict that contains the song metadata.
+    - ``metadata``: A dict that contains the song metadata. Generated on access.
+    - ``FIELDS``:   A tuple of the names of the fields in the song metadata.
 
     **************
     Class Methods:
     **************
     - ``validate_string``:  A method that checks if a given object is a string under 100 characters.
     - ``validate_duration``:    A method that checks if a given object is a positive integer.
+    - ``from_document``:    A classmethod that creates an object from a trusted stored document
+                            without validating it.
+    - ``freeze``:   A method that returns a frozen and hashable copy of the object.
     """
-    metadata: dict
-
-    def __post_init__(self):
-        """ Post Construction Initialisation Runtime """
-        self.metadata['type'] = "Audiobook"
-        super(Audiobook, self).__post_init__()
-
-        # Collect 'author' and 'narrator'
-        try:
-            self.author = self.metadata['author']
-            self.narrator = self.metadata['narrator']
-
-        except KeyError as e:
-            raise MetadataValueError(f"metadata value is missing for {e}")
+    __slots__ = ('author', 'narrator')
 
-        # Validate the 'author'
-        valid, error = self.validate_string(self.author)
-        if not valid:
-            raise MetadataValueError(f"metadata value is invalid for 'author' - {error}")
+    FIELDS: typing.ClassVar[typing.Tuple[str, ...]] = SCHEMAS["Audiobook"].names
+    TYPE: typing.ClassVar[typing.Optional[str]] = "Audiobook"
 
-        # Validate the 'narrator'
-        valid, error = self.validate_string(self.narrator)
-        if not valid:
-            raise MetadataValueError(f"metadata value is invalid for 'narrator' - {error}")
+    _validate = compile_validator(SCHEMAS["Audiobook"], "validate_audiobook")
+    _dump = compile_dumper(SCHEMAS["Audiobook"], "dump_audiobook")
+    from_document = classmethod(compile_loader(SCHEMAS["Audiobook"], "load_audiobook"))
+    _state = compile_state(SCHEMAS["Audiobook"], "state_audiobook")
+    _key = compile_key(SCHEMAS["Audiobook"], "key_audiobook")
+    _freeze = compile_freezer(SCHEMAS["Audiobook"], "freeze_audiobook")
 
     def __repr__(self):
         """ Representation of an Audiobook Object """
         return f"Audiobook Object <ID={self.ID}, Name={self.name}>"
 
+
+class Frozen:
+    """
+    ************
+    Description:
+    ************
+    *The base class of the frozen variants of the Audio type classes.*
+
+    A frozen audio file is created with the 'freeze' method of an audio file, or from a metadata
+    dictionary or a stored document like the class it is a variant of. Its attributes cannot be
+    assigned or deleted and its participants are stored as a tuple.
+
+    The hash of a frozen audio file is computed once from its validated fields when it is created.
+    Two frozen audio files of the same class are equal if their validated fields are equal, other
+    fields of the metadata are ignored. They can be used as dict keys and deduplicated with sets.
+
+    A frozen audio file is copied and pickled as its metadata dictionary, from which the copy is
+    validated and frozen again, so it can be sent to other processes such as those of a pool.
+
+    **************
+    Class Methods:
+    **************
+    - ``freeze``:   A method that returns the frozen audio file itself.
+    - ``thaw``:     A method that returns a mutable copy of the frozen audio file.
+    """
+    __slots__ = ()
+
+    def __new__(cls, metadata: dict):
+        """ Constructor. Validates the metadata with the mutable class and freezes it. """
+        # The mutable class is always the last base of a frozen variant
+        return cls.__bases__[-1](metadata).freeze()
+
+    def __init__(self, metadata: dict):
+        """ Post Construction Initialisation. The frozen audio file is complete when created. """
+        pass
+
+    @classmethod
+    def from_document(cls, document: dict) -> 'Frozen':
+        """ A classmethod that creates a frozen audio file from a trusted stored document """
+        return cls.__bases__[-1].from_document(document).freeze()
+
+    def __setattr__(self, name, value):
+        """ Attributes of a frozen audio file cannot be assigned """
+        raise AttributeError(f"cannot assign to '{name}' of a frozen {self.TYPE or 'Audio'}")
+
+    def __delattr__(self, name):
+        """ Attributes of a frozen audio file cannot be deleted """
+        raise AttributeError(f"cannot delete '{name}' of a frozen {self.TYPE or 'Audio'}")
+
+    def __reduce__(self):
+        """ Copies and pickles of a frozen audio file are created from its metadata """
+        return self.__class__, (self.metadata,)
+
+    def __hash__(self):
+        """ Hash of the validated fields, computed when the frozen audio file was created """
+        return self._hash
+
+    def __eq__(self, other):
+        """ Equality of the validated fields of two frozen audio files of the same class """
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+
+        return self._hash == other._hash and self._key() == other._key()
+
     def __str__(self):
-        """ String Representation of an Audiobook Object """
-        return json.dumps(self.metadata)
+        """ String Representation of a frozen audio file, serialized once """
+        try:
+            return self._json
+
+        except AttributeError:
+            text = encode(self.metadata)
+            object.__setattr__(self, '_json', text)
+            return text
+
+    def freeze(self) -> 'Frozen':
+        """ A method that returns the frozen audio file itself """
+        return self
+
+    def thaw(self) -> Audio:
+        """ A method that returns a mutable copy of the frozen audio file """
+        return self.__class__.__bases__[-1].from_document(self.metadata)
+
+
+class FrozenAudio(Frozen, Audio):
+    """ The frozen variant of the Audio class """
+    __slots__ = ('_hash',)
+
+
+class FrozenSong(Frozen, Song):
+    """ The frozen variant of the Song class """
+    __slots__ = ('_hash',)
+
+
+class FrozenPodcast(Frozen, Podcast):
+    """ The frozen variant of the Podcast class """
+    __slots__ = ('_hash',)
+
+
+class FrozenAudiobook(Frozen, Audiobook):
+    """ The frozen variant of the Audiobook class """
+    __slots__ = ('_hash',)
+
+
+# The frozen variant of every Audio type class
+FROZEN_CLASSES = {Audio: FrozenAudio, Song: FrozenSong, Podcast: FrozenPodcast, Audiobook: FrozenAudiobook}
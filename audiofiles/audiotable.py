@@ -0,0 +1,238 @@
+"""
+This module contains the AudioTable class that stores the metadata
+of many Song, Podcast and Audiobook objects as typed columns.
+"""
+import typing
+from array import array
+from datetime import datetime, timedelta, timezone
+
+from audiofiles.audiofiles import Audio, Song, Podcast, Audiobook, FROZEN_CLASSES
+from audiofiles.audiofiles import MetadataValueError
+
+INT64_MIN = -(1 << 63)
+INT64_MAX = (1 << 63) - 1
+
+EPOCH = datetime(1970, 1, 1)
+MICROSECOND = timedelta(microseconds=1)
+
+
+class AudioTable:
+    """
+    ************
+    Description:
+    ************
+    *A columnar container for the metadata of many audio files.*
+
+    Every field is stored as a parallel column with one entry per row. IDs, durations and
+    upload times are int64 arrays, with the upload time stored as microseconds since the
+    epoch (UTC). The 'name', 'host', 'author' and 'narrator' strings are interned in a string
+    pool and stored as int64 indexes into it, with -1 for fields that a type does not have.
+    The participants of all rows are stored as one array of string pool indexes, with an
+    offset array that marks where the participants of each row start. Like the metadata of a
+    Podcast, the metadata of a row only has empty participants if they were passed.
+
+    Rows from metadata dicts are validated by the Song, Podcast and Audiobook classes when they
+    are added, while rows from stored documents are trusted. Fields that are not defined by the
+    type are not stored. Upload times with a UTC offset are converted to UTC.
+
+    *****************
+    Class Attributes:
+    *****************
+    - ``types``:        An array of the type code of every row, an index into TYPES.
+    - ``CODES``:        A dict of the classes that can be added as rows to their type code.
+    - ``ids``:          An int64 array of the ID of every row.
+    - ``durations``:    An int64 array of the duration of every row.
+    - ``uploadtimes``:  An int64 array of the upload time of every row in epoch microseconds.
+    - ``names``, ``hosts``, ``authors``, ``narrators``:  int64 arrays of string pool indexes.
+    - ``participants``: An int64 array of the string pool indexes of all participants.
+    - ``offsets``:      An int64 array of the start of the participants of every row. Has one
+                        more entry than the number of rows.
+    - ``listed``:       An array of 1 for every row with participants in its metadata, else 0.
+    - ``strings``:      The string pool, a list of the unique strings.
+
+    **************
+    Class Methods:
+    **************
+    - ``from_metadata``:    A classmethod that creates a table from a list of metadata dicts.
+    - ``from_cursor``:  A classmethod that creates a table from an iterable of database documents.
+    - ``append``:   A method that adds a Song, Podcast or Audiobook as a row.
+    - ``metadata``: A method that returns the metadata dict of a row.
+    - ``to_dicts``: A method that returns the metadata dicts of all rows.
+    """
+    TYPES: typing.ClassVar[typing.Tuple[typing.Type[Audio], ...]] = (Song, Podcast, Audiobook)
+
+    # The type code of every class that can be added as a row, including the frozen variants
+    CODES: typing.ClassVar[typing.Dict[typing.Type[Audio], int]] = {
+        **{audioclass: code for code, audioclass in enumerate(TYPES)},
+        **{FROZEN_CLASSES[audioclass]: code for code, audioclass in enumerate(TYPES)}
+    }
+
+    def __init__(self):
+        """ Constructor """
+        self.types = array('b')
+        self.ids = array('q')
+        self.durations = array('q')
+        self.uploadtimes = array('q')
+        self.names = array('q')
+        self.hosts = array('q')
+        self.authors = array('q')
+        self.narrators = array('q')
+        self.participants = array('q')
+        self.offsets = array('q', [0])
+        self.listed = array('b')
+
+        self.strings = []
+        self._pool = {}
+
+    def __len__(self):
+        """ Number of rows in the table """
+        return len(self.ids)
+
+    def __getitem__(self, row: int) -> Audio:
+        """ The Song, Podcast or Audiobook object for a row """
+        if not -len(self) <= row < len(self):
+            raise IndexError("AudioTable index out of range")
+
+        row = row % len(self)
+        return self.TYPES[self.types[row]].from_document(self.metadata(row))
+
+    def __iter__(self) -> typing.Iterator[Audio]:
+        """ Iterator over the Song, Podcast or Audiobook objects of all rows """
+        for row in range(len(self)):
+            yield self[row]
+
+    @classmethod
+    def from_metadata(cls, metadatas: typing.Iterable[dict]) -> 'AudioTable':
+        """
+        A classmethod that creates an AudioTable from metadata dicts. The class of every row is
+        chosen by its 'type' field. Raises a MetadataValueError if a row is invalid.
+        """
+        classes = {audioclass.TYPE: audioclass for audioclass in cls.TYPES}
+        table = cls()
+
+        for metadata in metadatas:
+            audioclass = classes.get(metadata.get('type'))
+
+            if audioclass is None:
+                raise MetadataValueError("metadata value is invalid for 'type' - not supported")
+
+            table.append(audioclass(metadata))
+
+        return table
+
+    @classmethod
+    def from_cursor(cls, cursor: typing.Iterable[dict]) -> 'AudioTable':
+        """
+        A classmethod that creates an AudioTable from the documents of a database cursor or any
+        other iterable of stored documents. The documents are read one at a time and trusted,
+        so they are loaded with 'from_document' without validating them again.
+        """
+        classes = {audioclass.TYPE: audioclass for audioclass in cls.TYPES}
+        table = cls()
+
+        for document in cursor:
+            audioclass = classes.get(document.get('type'))
+
+            if audioclass is None:
+                raise MetadataValueError("metadata value is invalid for 'type' - not supported")
+
+            table.append(audioclass.from_document(document))
+
+        return table
+
+    def append(self, audiofile: Audio):
+        """ A method that adds a Song, Podcast or Audiobook object as a row of the table. All the
+        values of the row are computed before any column is changed, so a row that cannot be
+        added leaves the columns with the same number of rows. Frozen audio files are added like
+        the class they are a variant of. Raises a MetadataValueError if the object is not a Song,
+        Podcast or Audiobook, or if its ID or duration is not an int in the int64 range. """
+        code = self.CODES.get(audiofile.__class__)
+
+        if code is None:
+            raise MetadataValueError(f"'{audiofile.__class__.__name__}' is not supported")
+
+        ID = self._int64('_id', audiofile.ID)
+        duration = self._int64('duration', audiofile.duration)
+        uploadtime = self._epoch(audiofile.uploadtime)
+        name = self._intern(audiofile.name)
+        host = self._intern(getattr(audiofile, 'host', None))
+        author = self._intern(getattr(audiofile, 'author', None))
+        narrator = self._intern(getattr(audiofile, 'narrator', None))
+        participants = [self._intern(participant)
+                        for participant in getattr(audiofile, 'participants', None) or []]
+        listed = bool(participants) or 'participants' not in getattr(audiofile, '_omitted', ())
+
+        self.types.append(code)
+        self.ids.append(ID)
+        self.durations.append(duration)
+        self.uploadtimes.append(uploadtime)
+        self.names.append(name)
+
+        self.hosts.append(host)
+        self.authors.append(author)
+        self.narrators.append(narrator)
+
+        self.participants.extend(participants)
+        self.offsets.append(len(self.participants))
+        self.listed.append(listed)
+
+    def metadata(self, row: int) -> dict:
+        """ A method that returns the metadata dict of a row, with the fields in the order of the
+        metadata of its class. """
+        audioclass = self.TYPES[self.types[row]]
+        metadata = {"name": self.strings[self.names[row]], "duration": self.durations[row]}
+
+        if audioclass is Podcast:
+            metadata['host'] = self.strings[self.hosts[row]]
+
+            if self.listed[row]:
+                metadata['participants'] = [self.strings[index] for index in
+                                            self.participants[self.offsets[row]:self.offsets[row + 1]]]
+
+        elif audioclass is Audiobook:
+            metadata['author'] = self.strings[self.authors[row]]
+            metadata['narrator'] = self.strings[self.narrators[row]]
+
+        metadata['type'] = audioclass.TYPE
+        metadata['uploadtime'] = (EPOCH + self.uploadtimes[row] * MICROSECOND).isoformat()
+        metadata['_id'] = self.ids[row]
+        return metadata
+
+    def to_dicts(self) -> typing.List[dict]:
+        """ A method that returns the metadata dicts of all rows. """
+        return [self.metadata(row) for row in range(len(self))]
+
+    def _intern(self, string: typing.Optional[str]) -> int:
+        """ A method that returns the string pool index of a string, adding it if it is new.
+        Returns -1 for None. """
+        if string is None:
+            return -1
+
+        index = self._pool.get(string)
+
+        if index is None:
+            index = len(self.strings)
+            self._pool[string] = index
+            self.strings.append(string)
+
+        return index
+
+    @staticmethod
+    def _int64(name: str, value: int) -> int:
+        """ A staticmethod that returns an int value for an int64 column. Raises a MetadataValueError
+        if the value is not an int or out of the int64 range. """
+        if not isinstance(value, int):
+            raise MetadataValueError(f"metadata value is invalid for {name!r} - not an int")
+
+        if not INT64_MIN <= value <= INT64_MAX:
+            raise MetadataValueError(f"metadata value is invalid for {name!r} - out of the int64 range")
+
+        return value
+
+    @staticmethod
+    def _epoch(uploadtime: datetime) -> int:
+        """ A staticmethod that converts a datetime to microseconds since the epoch (UTC) """
+        if uploadtime.tzinfo is not None:
+            uploadtime = uploadtime.astimezone(timezone.utc).replace(tzinfo=None)
+
+        return (uploadtime - EPOCH) // MICROSECOND
@@ -0,0 +1,346 @@
+"""
+This module contains a compact binary codec for Song, Podcast and
+Audiobook objects and for batches of them in a single buffer.
+"""
+import json
+import struct
+import typing
+import functools
+from datetime import datetime, timedelta, timezone
+
+from audiofiles.audiofiles import Audio, Song, Podcast, Audiobook, FROZEN_CLASSES
+from audiofiles.errors import MetadataValueError
+from audiofiles.schema import SCHEMAS
+from audiofiles import interning
+
+# The version of the encoded layout, written into the header of every record
+VERSION = 1
+
+# The type codes of the audio file classes, written into the header of every record
+TYPE_CODES = {Song: 1, Podcast: 2, Audiobook: 3}
+
+# The fixed record header - version, type code, flags, ID and uploadtime in epoch microseconds
+HEADER = struct.Struct("<BBBqq")
+
+# The flags of a record header
+FLAG_OFFSET = 0x01
+FLAG_EXTRA = 0x02
+FLAG_BIGID = 0x04
+FLAG_OMITTED = 0x08
+
+INT64_MIN = -(1 << 63)
+INT64_MAX = (1 << 63) - 1
+
+EPOCH = datetime(1970, 1, 1)
+EPOCH_ORDINAL = EPOCH.toordinal()
+
+Buffer = typing.Union[bytes, bytearray, memoryview]
+
+
+def pack(audiofile: Audio) -> bytes:
+    """
+    A function that encodes a Song, Podcast or Audiobook object into bytes. A record starts with
+    a fixed header of 19 bytes - the layout version, the type code, the flags and the '_id' and
+    'uploadtime' as little endian int64s, with the 'uploadtime' as microseconds since the epoch.
+    An '_id' outside the int64 range and the UTC offset of the 'uploadtime' in microseconds
+    follow as zigzag varints when flagged. The other fields of the type follow in schema order.
+    Ints are zigzag varints, strs are varint length prefixed UTF-8 and lists are a varint count
+    of strs. Empty optional lists that are not in the metadata are flagged. Fields that are not
+    defined by the type are appended as a length prefixed JSON object. Raises a
+    MetadataValueError if the object is not a Song, Podcast or Audiobook.
+    """
+    out = bytearray()
+    _packer(audiofile)(audiofile, out)
+    return bytes(out)
+
+
+def pack_batch(audiofiles: typing.Iterable[Audio]) -> bytes:
+    """ A function that encodes many Song, Podcast or Audiobook objects into a single buffer,
+    which is a varint count followed by the records. """
+    audiofiles = list(audiofiles)
+    out = bytearray()
+    _write_uint(out, len(audiofiles))
+
+    for audiofile in audiofiles:
+        _packer(audiofile)(audiofile, out)
+
+    return bytes(out)
+
+
+def unpack(buffer: Buffer) -> Audio:
+    """ A function that decodes a record created by 'pack' into a Song, Podcast or Audiobook
+    object. Raises a MetadataValueError if the record is invalid or has trailing bytes. """
+    view = memoryview(buffer)
+    audiofile, position = _unpack(view, 0)
+
+    if position != len(view):
+        raise MetadataValueError("encoded metadata is invalid - trailing bytes")
+
+    return audiofile
+
+
+def unpack_batch(buffer: Buffer) -> typing.List[Audio]:
+    """ A function that decodes a buffer created by 'pack_batch' into a list of Song, Podcast
+    or Audiobook objects. The records are decoded from a memoryview of the buffer without
+    copying it. Raises a MetadataValueError if the buffer is invalid. """
+    view = memoryview(buffer)
+
+    try:
+        count, position = _read_uint(view, 0)
+
+    except IndexError:
+        raise MetadataValueError("encoded metadata is invalid - truncated count")
+
+    audiofiles = []
+
+    for _ in range(count):
+        audiofile, position = _unpack(view, position)
+        audiofiles.append(audiofile)
+
+    if position != len(view):
+        raise MetadataValueError("encoded metadata is invalid - trailing bytes")
+
+    return audiofiles
+
+
+def _packer(audiofile: Audio) -> typing.Callable:
+    """ A function that returns the packer for the class of an audio file object.
+    Raises a MetadataValueError if the class is not supported. """
+    packer = PACKERS.get(audiofile.__class__)
+
+    if packer is None:
+        raise MetadataValueError(f"'{audiofile.__class__.__name__}' is not supported")
+
+    return packer
+
+
+def _unpack(view: memoryview, position: int) -> typing.Tuple[Audio, int]:
+    """ A function that decodes the record at a position of a buffer. Returns the audio file
+    object and the position after the record. """
+    try:
+        version, code, flags, ID, micros = HEADER.unpack_from(view, position)
+
+    except struct.error:
+        raise MetadataValueError("encoded metadata is invalid - truncated header")
+
+    if version != VERSION:
+        raise MetadataValueError(f"encoded metadata is invalid - unsupported version {version}")
+
+    unpacker = UNPACKERS.get(code)
+
+    if unpacker is None:
+        raise MetadataValueError(f"encoded metadata is invalid - unsupported type code {code}")
+
+    try:
+        return unpacker(view, position + HEADER.size, flags, ID, micros)
+
+    except (IndexError, UnicodeDecodeError, ValueError) as error:
+        raise MetadataValueError(f"encoded metadata is invalid - {error}")
+
+
+def _write_uint(out: bytearray, value: int):
+    """ A function that appends an unsigned int to a buffer as a varint """
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+
+    out.append(value)
+
+
+def _read_uint(view: memoryview, position: int) -> typing.Tuple[int, int]:
+    """ A function that reads a varint from a buffer. Returns the int and the next position. """
+    value, shift = 0, 0
+
+    while True:
+        byte = view[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+
+        if byte < 0x80:
+            return value, position
+
+        shift += 7
+
+
+@functools.lru_cache(maxsize=64)
+def _offsetepoch(offset: int) -> datetime:
+    """ A function that returns the epoch in the timezone of a UTC offset in microseconds. The
+    epochs are cached since a few offsets are shared by many records. """
+    return EPOCH.replace(tzinfo=timezone(timedelta(0, 0, offset)))
+
+
+def _write_int(out: bytearray, value: int):
+    """ A function that appends a signed int to a buffer as a zigzag varint """
+    _write_uint(out, value << 1 if value >= 0 else (-value << 1) - 1)
+
+
+def _write_str(out: bytearray, value: str):
+    """ A function that appends a varint length prefixed str to a buffer """
+    data = value.encode()
+    _write_uint(out, len(data))
+    out += data
+
+
+def _write_strs(out: bytearray, values: typing.Sequence[str]):
+    """ A function that appends a varint count of strs to a buffer """
+    _write_uint(out, len(values))
+
+    for value in values:
+        _write_str(out, value)
+
+
+def _read_int(view: memoryview, position: int) -> typing.Tuple[int, int]:
+    """ A function that reads a zigzag varint from a buffer. Returns the int and the next position. """
+    value, position = _read_uint(view, position)
+    return (value >> 1) ^ -(value & 1), position
+
+
+def _read_str(view: memoryview, position: int) -> typing.Tuple[str, int]:
+    """ A function that reads a varint length prefixed str from a buffer. The str is decoded
+    from a slice of the memoryview without copying the bytes. Returns the str and the next position. """
+    size, position = _read_uint(view, position)
+    end = position + size
+
+    if end > len(view):
+        raise IndexError("str out of range")
+
+    return str(view[position:end], 'utf-8'), end
+
+
+def _read_strs(view: memoryview, position: int) -> typing.Tuple[typing.List[str], int]:
+    """ A function that reads a varint count of strs from a buffer. Returns the list of strs
+    and the next position. """
+    count, position = _read_uint(view, position)
+    values = []
+
+    for _ in range(count):
+        value, position = _read_str(view, position)
+        values.append(value)
+
+    return values, position
+
+
+# The writers and readers of the field kinds that follow the header of a record
+WRITERS = {"str": _write_str, "int": _write_int, "strlist": _write_strs}
+READERS = {"str": _read_str, "int": _read_int, "strlist": _read_strs}
+
+
+def _body_fields(audioclass: typing.Type[Audio]) -> typing.List:
+    """ A function that returns the fields of the schema of a class that follow the header of
+    its records. Raises a ValueError if the schema has a field of an unsupported kind. """
+    fields = []
+
+    for field in SCHEMAS[audioclass.TYPE].fields:
+        if field.kind in ("id", "isotime"):
+            # Stored in the header
+            continue
+
+        if field.kind not in WRITERS:
+            raise ValueError(f"'{field.kind}' is not a supported field kind")
+
+        fields.append(field)
+
+    return fields
+
+
+def _compile_packer(audioclass: typing.Type[Audio]) -> typing.Callable:
+    """ A function that builds a function from the schema of a class that appends the record
+    of an object of the class to a buffer """
+    header = HEADER.pack
+    code = TYPE_CODES[audioclass]
+    writers = tuple((field.slot, WRITERS[field.kind]) for field in _body_fields(audioclass))
+    omittable = "_omitted" in audioclass.__slots__
+
+    def pack(self, out):
+        t = self.uploadtime
+        offset = t.utcoffset()
+        extra = self._extra
+        ID = self.ID
+        flags = (offset is not None) | (FLAG_EXTRA if extra else 0)
+
+        if omittable and not all(getattr(self, key) for key in self._omitted):
+            flags |= FLAG_OMITTED
+        micros = (((t.toordinal() - EPOCH_ORDINAL) * 86400 + t.hour * 3600 + t.minute * 60 + t.second)
+                  * 1000000 + t.microsecond)
+
+        if INT64_MIN <= ID <= INT64_MAX:
+            out += header(VERSION, code, flags, ID, micros)
+        else:
+            out += header(VERSION, code, flags | FLAG_BIGID, 0, micros)
+            _write_int(out, ID)
+
+        if offset is not None:
+            _write_int(out, offset.days * 86400000000 + offset.seconds * 1000000 + offset.microseconds)
+
+        for slot, write in writers:
+            write(out, getattr(self, slot))
+
+        if extra:
+            _write_str(out, json.dumps(extra))
+
+    pack.__name__ = pack.__qualname__ = f"pack_{audioclass.TYPE.lower()}"
+    return pack
+
+
+def _compile_unpacker(audioclass: typing.Type[Audio]) -> typing.Callable:
+    """ A function that builds a function from the schema of a class that decodes a record of
+    the class from a memoryview at a position after its header, with the flags, ID and upload
+    time of the header. The function returns the new object and the position after the record. """
+    new = object.__new__
+    audiotype = audioclass.TYPE
+    schema = SCHEMAS[audiotype]
+    fields = _body_fields(audioclass)
+    readers = tuple((field.slot, READERS[field.kind]) for field in fields)
+    interned = tuple((field.slot, field.kind == "strlist") for field in fields if field.interned)
+    idslot = next(field.slot for field in schema.fields if field.kind == "id")
+    timeslot = next(field.slot for field in schema.fields if field.kind == "isotime")
+    lists = tuple(field.name for field in fields if field.kind == "strlist" and not field.required)
+
+    def unpack(view, p, flags, ID, micros):
+        self = new(audioclass)
+
+        if flags & FLAG_BIGID:
+            ID, p = _read_int(view, p)
+
+        if flags & FLAG_OFFSET:
+            offset, p = _read_int(view, p)
+            t = _offsetepoch(offset) + timedelta(0, 0, micros)
+        else:
+            t = EPOCH + timedelta(0, 0, micros)
+
+        setattr(self, idslot, ID)
+        setattr(self, timeslot, t)
+
+        for slot, read in readers:
+            value, p = read(view, p)
+            setattr(self, slot, value)
+
+        pool = interning.pool
+
+        if pool is not None:
+            for slot, listed in interned:
+                value = getattr(self, slot)
+                setattr(self, slot, pool.intern_all(value) if listed else pool.intern(value))
+
+        if lists:
+            self._omitted = tuple(key for key in lists if flags & FLAG_OMITTED and not getattr(self, key))
+
+        self.type = audiotype
+
+        if flags & FLAG_EXTRA:
+            extra, p = _read_str(view, p)
+            self._extra = json.loads(extra)
+        else:
+            self._extra = None
+
+        return self, p
+
+    unpack.__name__ = unpack.__qualname__ = f"unpack_{audiotype.lower()}"
+    return unpack
+
+
+# The packers by class and unpackers by type code. Frozen audio files are packed like
+# the class they are a variant of and unpacked as mutable objects
+PACKERS = {audioclass: _compile_packer(audioclass) for audioclass in TYPE_CODES}
+PACKERS.update({FROZEN_CLASSES[audioclass]: PACKERS[audioclass] for audioclass in TYPE_CODES})
+UNPACKERS = {code: _compile_unpacker(audioclass) for audioclass, code in TYPE_CODES.items()}
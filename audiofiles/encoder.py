@@ -0,0 +1,22 @@
+"""
+This module contains the JSON encoder hook that is used to serialize
+the metadata of audio files, so that a faster JSON backend can be used.
+"""
+import json
+import typing
+
+# The function that serializes a metadata dict to a JSON str or bytes
+_encoder: typing.Callable[[dict], typing.Union[str, bytes]] = json.dumps
+
+
+def set_encoder(encoder: typing.Optional[typing.Callable[[dict], typing.Union[str, bytes]]] = None):
+    """ A function that sets the function used to serialize metadata dicts, such as 'orjson.dumps'.
+    The function may return an str or UTF-8 bytes. Resets to 'json.dumps' if it is None. """
+    global _encoder
+    _encoder = json.dumps if encoder is None else encoder
+
+
+def encode(metadata: dict) -> str:
+    """ A function that serializes a metadata dict to a JSON str with the current encoder """
+    text = _encoder(metadata)
+    return text.decode() if text.__class__ is bytes else text
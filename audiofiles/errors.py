@@ -0,0 +1,13 @@
+"""
+This module contains the custom exceptions of the audiofiles package.
+"""
+
+
+class MetadataValueError(Exception):
+    """ Custom exception to handle invalid metadata values """
+    pass
+
+
+class MetadataGenerationError(Exception):
+    """Custom exception to handle failed metadata generation"""
+    pass
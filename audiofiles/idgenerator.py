@@ -0,0 +1,196 @@
+"""
+This module contains the IDGenerator class that generates unique
+64-bit IDs for new audio files without any coordination.
+"""
+import os
+import time
+import zlib
+import socket
+import typing
+import threading
+
+# The bit layout of an ID - 41 bits of milliseconds, 10 bits of worker and 12 bits of sequence
+TIMESTAMP_BITS = 41
+WORKER_BITS = 10
+SEQUENCE_BITS = 12
+
+MAX_WORKER = (1 << WORKER_BITS) - 1
+MAX_SEQUENCE = (1 << SEQUENCE_BITS) - 1
+
+# The epoch of the timestamp in milliseconds since the unix epoch (2021-01-01T00:00:00Z)
+EPOCH = 1609459200000
+
+# The environment variable that sets the worker number of a process
+WORKER_VARIABLE = "AUDIOSERVERWORKERID"
+
+
+def configured_worker() -> typing.Optional[int]:
+    """ A function that returns the worker number set with the AUDIOSERVERWORKERID environment
+    variable or None if it is not set. Raises a ValueError if it is not an int from 0 to 1023. """
+    value = os.environ.get(WORKER_VARIABLE)
+
+    if value is None:
+        return None
+
+    try:
+        worker = int(value)
+
+    except ValueError:
+        raise ValueError(f"{WORKER_VARIABLE} must be an int, not {value!r}")
+
+    if not 0 <= worker <= MAX_WORKER:
+        raise ValueError(f"{WORKER_VARIABLE} must be between 0 and {MAX_WORKER}")
+
+    return worker
+
+
+def host_worker() -> int:
+    """ A function that derives a worker number from the name of the host, so that processes
+    on different hosts or containers start from different worker numbers. Raises a RuntimeError
+    if the host has no name. """
+    hostname = socket.gethostname()
+
+    if not hostname:
+        raise RuntimeError(f"the host has no name to derive a worker number from, set {WORKER_VARIABLE}")
+
+    return zlib.crc32(hostname.encode()) & MAX_WORKER
+
+
+def default_worker() -> int:
+    """ A function that returns the worker number of the process, which is the AUDIOSERVERWORKERID
+    environment variable if it is set, or else derived from the name of the host plus the process
+    ID. Raises a ValueError if the variable is invalid or a RuntimeError if neither is available. """
+    worker = configured_worker()
+
+    if worker is None:
+        worker = (host_worker() + os.getpid()) & MAX_WORKER
+
+    return worker
+
+
+class IDGenerator:
+    """
+    ************
+    Description:
+    ************
+    *A generator of unique 63-bit positive int IDs that fit in a signed int64.*
+
+    Every ID is made up of the milliseconds since 2021-01-01 (41 bits), the worker number
+    (10 bits) and a sequence number within the millisecond (12 bits). IDs are strictly
+    increasing within a generator, so they sort in the order they were generated. Generators
+    with different worker numbers never generate the same ID.
+
+    If the sequence runs out within a millisecond or the clock goes backwards, the generator
+    continues from the last timestamp it used instead of waiting for the clock.
+
+    The worker number defaults to the AUDIOSERVERWORKERID environment variable, which should
+    be unique for every process that generates IDs. Without it, the worker number is derived
+    from the name of the host plus the process ID, and again in a child process after a fork,
+    unless it was set explicitly. Processes on different hosts may still get the same derived
+    worker number, so deployments with several hosts should set AUDIOSERVERWORKERID.
+
+    A 'lazy' generator without a worker number resolves its default worker number on first use
+    instead of in the constructor, so that the generator of the package can be created when it
+    is imported without failing on an invalid AUDIOSERVERWORKERID.
+
+    *****************
+    Class Attributes:
+    *****************
+    - ``worker``:   An int from 0 to 1023 that is the worker number of the generator.
+
+    **************
+    Class Methods:
+    **************
+    - ``next_id``:  A method that returns a new ID.
+    - ``next_ids``: A method that returns a list of new IDs.
+    - ``reset``:    A method that sets the worker number and restarts the sequence.
+    """
+
+    def __init__(self, worker: typing.Optional[int] = None, clock: typing.Callable[[], int] = time.time_ns,
+                 lazy: bool = False):
+        """ Constructor """
+        self._clock = clock
+        self.reset(worker, lazy)
+
+    @property
+    def worker(self) -> int:
+        """ The worker number of the generator, which is resolved with 'default_worker' on first
+        use if the generator is lazy. Raises a ValueError or a RuntimeError like 'default_worker'. """
+        if self._worker is None:
+            with self._lock:
+                if self._worker is None:
+                    self._worker = default_worker()
+
+        return self._worker
+
+    def reset(self, worker: typing.Optional[int] = None, lazy: bool = False):
+        """ A method that sets the worker number of the generator and restarts the sequence.
+        The worker number defaults to 'default_worker', which is resolved on first use if 'lazy'
+        is True. Raises a ValueError if it is out of range or a RuntimeError if there is no default. """
+        self._explicit = worker is not None
+
+        if worker is None and not lazy:
+            worker = default_worker()
+
+        if worker is not None and not 0 <= worker <= MAX_WORKER:
+            raise ValueError(f"worker must be between 0 and {MAX_WORKER}")
+
+        self._worker = worker
+        self._lock = threading.Lock()
+        self._last = 0
+        self._sequence = 0
+
+    def next_id(self) -> int:
+        """ A method that returns a new ID. """
+        worker = self.worker
+
+        with self._lock:
+            now = self._clock() // 1000000 - EPOCH
+
+            if now > self._last:
+                self._last, self._sequence = now, 0
+
+            elif self._sequence < MAX_SEQUENCE:
+                self._sequence += 1
+
+            else:
+                self._last, self._sequence = self._last + 1, 0
+
+            return (self._last << (WORKER_BITS + SEQUENCE_BITS)) | (worker << SEQUENCE_BITS) | self._sequence
+
+    def next_ids(self, count: int) -> typing.List[int]:
+        """ A method that returns a list of 'count' new IDs in increasing order. The IDs are
+        reserved in blocks of sequence numbers with a single lock acquisition. """
+        ids, worker = [], self.worker
+
+        with self._lock:
+            now = self._clock() // 1000000 - EPOCH
+
+            if now > self._last:
+                self._last, self._sequence = now, -1
+
+            while len(ids) < count:
+                if self._sequence == MAX_SEQUENCE:
+                    self._last, self._sequence = self._last + 1, -1
+
+                start = self._sequence + 1
+                stop = min(MAX_SEQUENCE, start + count - len(ids) - 1)
+                prefix = (self._last << (WORKER_BITS + SEQUENCE_BITS)) | (worker << SEQUENCE_BITS)
+
+                ids.extend(range(prefix | start, (prefix | stop) + 1))
+                self._sequence = stop
+
+        return ids
+
+    def _after_fork(self):
+        """ A method that restarts the generator in a child process after a fork. A worker number
+        that was not set explicitly is derived again on first use in the child. """
+        self.reset(self._worker if self._explicit else None, lazy=True)
+
+
+# The generator used for the IDs of new audio files in this process, whose worker number is
+# resolved on first use so that importing the package does not depend on AUDIOSERVERWORKERID
+generator = IDGenerator(lazy=True)
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=generator._after_fork)
@@ -0,0 +1,122 @@
+"""
+This module contains the StringPool class that canonicalises repeated
+metadata strings, so that audio files with identical values share them.
+"""
+import typing
+import threading
+from collections import OrderedDict
+
+
+class StringPool:
+    """
+    ************
+    Description:
+    ************
+    *A bounded pool of canonical strings.*
+
+    Interning a string returns the pooled object that is equal to it, adding the string if it
+    is new. Audio files that intern their fields share a single object for every repeated value,
+    which saves memory and allows values to be grouped by identity. When the pool is full, the
+    least recently interned string is evicted. Objects that already hold it keep it, but new
+    values equal to it are pooled again as a new object.
+
+    Lookups of pooled strings do not take the lock, so the hit counter is approximate when
+    strings are interned by several threads at once.
+
+    *****************
+    Class Attributes:
+    *****************
+    - ``maxsize``:  An int that is the maximum number of pooled strings.
+    - ``hits``:     An int counter of the strings that were already pooled.
+    - ``misses``:   An int counter of the strings that were added to the pool.
+    - ``evictions``:    An int counter of the strings evicted to make space for another.
+
+    **************
+    Class Methods:
+    **************
+    - ``intern``:   A method that returns the pooled str equal to a str.
+    - ``intern_all``:   A method that returns a list of the pooled strs equal to a list of strs.
+    - ``clear``:    A method that removes all strings from the pool.
+    - ``stats``:    A method that returns the counters and size of the pool as a dict.
+    """
+    def __init__(self, maxsize: int = 65536):
+        """ Constructor """
+        self.maxsize = maxsize
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._strings = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """ Number of strings in the pool """
+        return len(self._strings)
+
+    def intern(self, string: str) -> str:
+        """ A method that returns the pooled str that is equal to a str, adding it if it is new. """
+        pooled = self._strings.get(string)
+
+        if pooled is not None:
+            self.hits += 1
+
+            try:
+                self._strings.move_to_end(string)
+
+            except KeyError:
+                # Evicted by another thread since it was looked up
+                pass
+
+            return pooled
+
+        with self._lock:
+            pooled = self._strings.setdefault(string, string)
+            self.misses += 1
+
+            if len(self._strings) > self.maxsize:
+                # Hits move their string to the end, so the first one is the least recently interned
+                self._strings.popitem(last=False)
+                self.evictions += 1
+
+        return pooled
+
+    def intern_all(self, strings: typing.Iterable[str]) -> typing.List[str]:
+        """ A method that returns a new list of the pooled strs that are equal to a list of strs. """
+        intern = self.intern
+        return [intern(string) for string in strings]
+
+    def clear(self):
+        """ A method that removes all strings from the pool. """
+        with self._lock:
+            self._strings.clear()
+
+    def stats(self) -> dict:
+        """ A method that returns the counters and the size of the pool as a dict. """
+        with self._lock:
+            return {
+                "size": len(self._strings),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions
+            }
+
+
+# The pool used by the audio file constructors, None when interning is disabled
+pool: typing.Optional[StringPool] = None
+
+
+def enable_interning(maxsize: int = 65536) -> StringPool:
+    """ A function that enables interning of the repeated fields of new audio files with a new
+    pool of a maximum size, and returns the pool. """
+    global pool
+    pool = StringPool(maxsize)
+    return pool
+
+
+def disable_interning():
+    """ A function that disables interning of the fields of new audio files. Audio files that
+    were created with interning keep their pooled strings. """
+    global pool
+    pool = None
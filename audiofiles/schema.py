@@ -0,0 +1,678 @@
+"""
+This module contains the declarative schemas of the Audio, Song, Podcast and
+Audiobook classes and builds the validator and other functions of every class from them.
+"""
+import re
+import typing
+import operator
+from datetime import datetime
+from dataclasses import dataclass
+
+from audiofiles.errors import MetadataValueError, MetadataGenerationError
+from audiofiles.idgenerator import generator
+from audiofiles import interning
+
+# Sentinel for a field that is not in the metadata
+MISSING = object()
+
+# The ISO8601 strs that datetime.isoformat returns, with the microseconds and the seconds of the
+# UTC offset only if they are not zero and a zero UTC offset as '+00:00'
+ISOFORMAT = re.compile(r"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d(?:\.(?!000000)\d{6})?"
+                       r"(?:(?!-00:00$)[+-]\d\d:\d\d(?::(?!00$)\d\d(?:\.(?!000000)\d{6})?)?)?")
+
+
+def generate_uploadtime() -> datetime:
+    """ A function that generates the 'uploadtime' of a new audio file """
+    return datetime.utcnow()
+
+
+def generate_id() -> int:
+    """ A function that generates the '_id' of a new audio file with the ID generator """
+    return generator.next_id()
+
+
+@dataclass(frozen=True)
+class Field:
+    """
+    ************
+    Description:
+    ************
+    *The declaration of a single metadata field.*
+
+    The 'kind' of the field decides how it is validated and converted.
+    - ``str``:      An str with at most 'maxlength' characters.
+    - ``int``:      An int that is not smaller than 'minimum'.
+    - ``strlist``:  A list of at most 'maxlength' items that are str fields of 'itemlength'
+                    characters. Empty values are replaced with the default. An optional strlist
+                    that is not in the metadata is named in the '_omitted' attribute of the
+                    object, and is left out of the generated metadata while it is empty.
+    - ``isotime``:  An ISO8601 str that is converted to a datetime object.
+    - ``id``:       An int.
+    - ``choice``:   An str that is one of 'choices'.
+
+    A field that is not required and not in the metadata is set to its default. A callable
+    default is called with the values of the fields in 'depends', which must be declared
+    before it, and a failure to generate the value raises a MetadataGenerationError.
+
+    A 'lazy' isotime field is stored in the slot '_<attribute>'. Trusted documents store the
+    ISO8601 str in it, which is parsed by a property of the class when it is first accessed.
+
+    The values of an 'interned' str or strlist field are replaced with the equal strs of the
+    string pool of the interning module when interning is enabled.
+
+    *****************
+    Class Attributes:
+    *****************
+    - ``name``:     An str that is the key of the field in the metadata.
+    - ``kind``:     An str that is the kind of the field.
+    - ``attribute``:    An str that is the name of the object attribute. Defaults to the name.
+    - ``required``: A bool that describes if the field must be in the metadata.
+    - ``default``:  The value or the callable that generates the value of a missing field.
+    - ``depends``:  A tuple of the names of the fields that a callable default is called with.
+    - ``mutable``:  A bool that describes if the field can be changed after creation.
+    - ``maxlength``:    An int that is the maximum length of a str or list field.
+    - ``minimum``:  An int that is the minimum value of an int field.
+    - ``itemlength``:   An int that is the maximum length of the items of a strlist field.
+    - ``itemlabel``:    An str that names an item of a strlist field in error messages.
+    - ``choices``:  A tuple of the allowed values of a choice field.
+    - ``lazy``:     A bool that describes if the value of an isotime field is parsed on access.
+    - ``interned``: A bool that describes if the values of the field are interned.
+
+    **************
+    Class Methods:
+    **************
+    - ``check``:    A method that checks a value and returns a validity bool and an error str.
+    """
+    name: str
+    kind: str
+    attribute: str = None
+    required: bool = True
+    default: typing.Any = None
+    depends: typing.Tuple[str, ...] = ()
+    mutable: bool = True
+    maxlength: int = None
+    minimum: int = None
+    itemlength: int = None
+    itemlabel: str = None
+    choices: typing.Tuple[str, ...] = ()
+    lazy: bool = False
+    interned: bool = False
+
+    def __post_init__(self):
+        """ Post Construction Initialisation Runtime """
+        if self.attribute is None:
+            object.__setattr__(self, 'attribute', self.name)
+
+    @property
+    def slot(self) -> str:
+        """ The name of the slot that stores the value of the field """
+        return f"_{self.attribute}" if self.lazy else self.attribute
+
+    def check(self, value) -> typing.Tuple[bool, str]:
+        """
+        A method that determines if a given object is a valid value for the field.
+        Returns a validity bool and and an error str in a tuple.
+        """
+        if self.kind == "str":
+            if not isinstance(value, str):
+                return False, "not an str"
+
+            if len(value) > self.maxlength:
+                return False, "str too long"
+
+        elif self.kind == "int":
+            if not isinstance(value, int):
+                return False, "not an int"
+
+            if value < self.minimum:
+                return False, "not positive"
+
+        elif self.kind == "strlist":
+            if not value:
+                return True, "null"
+
+            if not isinstance(value, list):
+                return False, "not a list"
+
+            if len(value) > self.maxlength:
+                return False, f"too many {self.name}"
+
+            for count, item in enumerate(value, start=1):
+                if not isinstance(item, str):
+                    return False, f"{self.itemlabel} {count} - not an str"
+
+                if len(item) > self.itemlength:
+                    return False, f"{self.itemlabel} {count} - str too long"
+
+        elif self.kind == "isotime":
+            if not isinstance(value, str):
+                return False, "not an str"
+
+            try:
+                datetime.fromisoformat(value)
+
+            except ValueError:
+                return False, "not ISO8601"
+
+        elif self.kind == "id":
+            if not isinstance(value, int):
+                return False, "not an int"
+
+        elif self.kind == "choice":
+            if not isinstance(value, str):
+                return False, "not an str"
+
+            if value not in self.choices:
+                return False, "not supported"
+
+        return True, "null"
+
+
+@dataclass(frozen=True)
+class Schema:
+    """
+    ************
+    Description:
+    ************
+    *The declaration of the metadata of an audio file type.*
+
+    The fields are declared in groups. When validating, every group first checks that its
+    required fields are in the metadata and then validates its fields in order. A schema
+    with an 'audiotype' always sets the 'type' of its audio files to it.
+
+    *****************
+    Class Attributes:
+    *****************
+    - ``groups``:   A tuple of tuples of Field objects.
+    - ``audiotype``:    An str that is the fixed type of the audio files, or None.
+
+    **************
+    Class Methods:
+    **************
+    - ``extend``:   A method that returns a new schema with another group of fields.
+    - ``field``:    A method that returns the Field for a name.
+    """
+    groups: typing.Tuple[typing.Tuple[Field, ...], ...]
+    audiotype: str = None
+
+    @property
+    def fields(self) -> typing.Tuple[Field, ...]:
+        """ All the fields of the schema in validation order """
+        return tuple(field for group in self.groups for field in group)
+
+    @property
+    def names(self) -> typing.Tuple[str, ...]:
+        """ The names of all the metadata fields of the audio files, including 'type' """
+        names = tuple(field.name for field in self.fields)
+        return names if 'type' in names else names + ('type',)
+
+    def extend(self, audiotype: str, *fields: Field) -> 'Schema':
+        """ A method that returns a new schema for an audio file type with another group of fields """
+        groups = self.groups + ((fields,) if fields else ())
+        return Schema(groups=groups, audiotype=audiotype)
+
+    def field(self, name: str) -> typing.Optional[Field]:
+        """ A method that returns the Field for a name or None if there is no such field """
+        for field in self.fields:
+            if field.name == name:
+                return field
+
+        return None
+
+
+AUDIO_SCHEMA = Schema(groups=((
+    Field("name", "str", maxlength=100),
+    Field("duration", "int", minimum=0),
+    Field("uploadtime", "isotime", required=False, default=generate_uploadtime, mutable=False,
+          lazy=True),
+    Field("_id", "id", attribute="ID", required=False, default=generate_id, mutable=False),
+),))
+
+SCHEMAS = {
+    "Audio": Schema(groups=(AUDIO_SCHEMA.groups[0] + (
+        Field("type", "choice", required=False, default="Audio", mutable=False,
+              choices=('Song', 'Podcast', 'Audiobook', 'Audio')),
+    ),)),
+
+    "Song": AUDIO_SCHEMA.extend("Song"),
+
+    "Podcast": AUDIO_SCHEMA.extend(
+        "Podcast",
+        Field("host", "str", maxlength=100, interned=True),
+        Field("participants", "strlist", required=False, default=list, maxlength=10,
+              itemlength=100, itemlabel="participant", interned=True),
+    ),
+
+    "Audiobook": AUDIO_SCHEMA.extend(
+        "Audiobook",
+        Field("author", "str", maxlength=100, interned=True),
+        Field("narrator", "str", maxlength=100, interned=True),
+    ),
+}
+
+
+def _invalid(field: Field, error: str) -> str:
+    """ A function that returns the message of the MetadataValueError for an invalid field """
+    return f"metadata value is invalid for {field.name!r} - {error}"
+
+
+def _converter(field: Field) -> typing.Callable:
+    """ A function that returns a function that checks a value of a field that is not a strlist,
+    converts it and returns it. The function is called with the value and the string pool of the
+    interning module, and raises a MetadataValueError if the value is invalid. """
+    if field.kind == "str":
+        maxlength, interned = field.maxlength, field.interned
+        not_str, too_long = _invalid(field, "not an str"), _invalid(field, "str too long")
+
+        def convert(value, pool):
+            if not isinstance(value, str):
+                raise MetadataValueError(not_str)
+            if len(value) > maxlength:
+                raise MetadataValueError(too_long)
+
+            return pool.intern(value) if interned and pool is not None else value
+
+    elif field.kind == "int":
+        minimum = field.minimum
+        not_int, not_positive = _invalid(field, "not an int"), _invalid(field, "not positive")
+
+        def convert(value, pool):
+            if not isinstance(value, int):
+                raise MetadataValueError(not_int)
+            if value < minimum:
+                raise MetadataValueError(not_positive)
+
+            return value
+
+    elif field.kind == "isotime":
+        fromisoformat = datetime.fromisoformat
+        not_iso, not_str = _invalid(field, "not ISO8601"), _invalid(field, "not an str")
+
+        def convert(value, pool):
+            try:
+                return fromisoformat(value)
+
+            except ValueError:
+                raise MetadataValueError(not_iso)
+            except TypeError:
+                raise MetadataValueError(not_str)
+
+    elif field.kind == "id":
+        not_int = _invalid(field, "not an int")
+
+        def convert(value, pool):
+            if not isinstance(value, int):
+                raise MetadataValueError(not_int)
+
+            return value
+
+    elif field.kind == "choice":
+        choices = field.choices
+        not_str, not_supported = _invalid(field, "not an str"), _invalid(field, "not supported")
+
+        def convert(value, pool):
+            if not isinstance(value, str):
+                raise MetadataValueError(not_str)
+            if value not in choices:
+                raise MetadataValueError(not_supported)
+
+            return value
+
+    else:
+        raise ValueError(f"'{field.kind}' is not a supported field kind")
+
+    return convert
+
+
+def _list_step(field: Field) -> typing.Callable:
+    """ A function that returns the validation step of a strlist field. Empty or missing values
+    are replaced with the default and other values are checked with Field.check. """
+    key, default, check, interned, required = field.name, field.default, field.check, field.interned, field.required
+
+    def step(metadata, values, pool):
+        value = values[key] if required else metadata.get(key, MISSING)
+        found = value is not MISSING and not required
+
+        if value is MISSING or not value:
+            values[key] = default()
+            return found
+
+        valid, error = check(value)
+        if not valid:
+            raise MetadataValueError(f"metadata value is invalid for '{key}' - {error}")
+
+        values[key] = pool.intern_all(value) if interned and pool is not None else value
+        return found
+
+    return step
+
+
+def _field_step(field: Field) -> typing.Callable:
+    """ A function that returns the validation step of a field. A step is called with the metadata
+    dict, the dict of the values validated so far and the string pool, stores the converted value
+    of its field in the values and returns the number of optional fields it found in the metadata.
+    The values of the required fields of a group are already collected when their steps run. """
+    if field.kind == "strlist":
+        return _list_step(field)
+
+    key, convert = field.name, _converter(field)
+
+    if field.required:
+        def step(metadata, values, pool):
+            values[key] = convert(values[key], pool)
+            return 0
+
+    elif callable(field.default):
+        default, depends = field.default, field.depends
+        generated = f"metadata generation failed for {field.attribute.lower()!r}"
+
+        def step(metadata, values, pool):
+            value = metadata.get(key, MISSING)
+
+            if value is MISSING:
+                try:
+                    values[key] = default(*[values[name] for name in depends])
+
+                except Exception:
+                    raise MetadataGenerationError(generated)
+
+                return 0
+
+            values[key] = convert(value, pool)
+            return 1
+
+    else:
+        default = field.default
+
+        def step(metadata, values, pool):
+            value = metadata.get(key, MISSING)
+
+            if value is MISSING:
+                values[key] = default
+                return 0
+
+            values[key] = convert(value, pool)
+            return 1
+
+    return step
+
+
+def compile_validator(schema: Schema, name: str = "validate") -> typing.Callable:
+    """
+    A function that builds a validator function from a schema. The validator is called with an
+    audio file object and a metadata dict, validates the metadata with the checks of the schema
+    and sets the attributes of the object. Fields that are not in the schema are set as the
+    '_extra' attribute. It raises the same MetadataValueError or MetadataGenerationError as the
+    checks of the schema.
+    """
+    groups = tuple((tuple(field.name for field in group if field.required),
+                    tuple(_field_step(field) for field in group)) for group in schema.groups)
+    slots = tuple((field.slot, field.name) for field in schema.fields)
+    required = sum(field.required for field in schema.fields)
+    lists = _optional_lists(schema)
+    audiotype = schema.audiotype
+    names = frozenset(schema.names)
+
+    def validate(self, metadata):
+        pool = interning.pool
+        values = {}
+        found = required
+
+        for keys, steps in groups:
+            # Collect the required fields of the group
+            try:
+                for key in keys:
+                    values[key] = metadata[key]
+
+            except KeyError as e:
+                raise MetadataValueError(f"metadata value is missing for {e}")
+
+            for step in steps:
+                found += step(metadata, values, pool)
+
+        for slot, key in slots:
+            setattr(self, slot, values[key])
+
+        if lists:
+            self._omitted = tuple(key for key in lists if key not in metadata)
+
+        if audiotype:
+            self.type = audiotype
+            found += 'type' in metadata
+
+        self._extra = _collect_extra(metadata, found, names)
+
+    return _named(validate, name)
+
+
+def _optional_lists(schema: Schema) -> typing.Tuple[str, ...]:
+    """ A function that returns the names of the optional strlist fields of a schema, which
+    are recorded in the '_omitted' attribute when they are not in the metadata """
+    return tuple(field.name for field in schema.fields if field.kind == "strlist" and not field.required)
+
+
+def _named(function: typing.Callable, name: str) -> typing.Callable:
+    """ A function that names a function built from a schema, for tracebacks and profiles """
+    function.__name__ = function.__qualname__ = name
+    return function
+
+
+def compile_loader(schema: Schema, name: str = "load") -> typing.Callable:
+    """
+    A function that builds a loader function for trusted documents from a schema, such as those
+    read from the database. The loader is called with an audio file class and a document, and
+    returns a new object of the class with the values of the document set as its attributes
+    without any checks. Lazy fields keep the stored value until they are accessed, if it is
+    already the ISO8601 str that the validator would generate. Other ISO8601 strs are normalized
+    when they are loaded, so the object equals one validated from the document.
+    Raises a MetadataValueError if a field without a default is not in the document or if an
+    isotime field that needs to be normalized is not ISO8601.
+    """
+    new = object.__new__
+    isoformat, fromisoformat = ISOFORMAT.fullmatch, datetime.fromisoformat
+    times = tuple((field.slot, field.name, field.lazy) for field in schema.fields if field.kind == "isotime")
+    required, lists, optional = [], [], []
+
+    for field in schema.fields:
+        if field.kind == "strlist":
+            lists.append((field.slot, field.name))
+        elif field.kind == "choice" and not field.required:
+            optional.append((field.slot, field.name, field.default))
+        else:
+            required.append((field.slot, field.name))
+
+    interned = tuple((field.slot, field.kind == "strlist") for field in schema.fields if field.interned)
+    required, lists, optional = tuple(required), tuple(lists), tuple(optional)
+    omittable = _optional_lists(schema)
+    audiotype = schema.audiotype
+    names = frozenset(schema.names)
+
+    def load(cls, document):
+        self = new(cls)
+
+        try:
+            for slot, key in required:
+                setattr(self, slot, document[key])
+
+        except KeyError as e:
+            raise MetadataValueError(f"metadata value is missing for {e}")
+
+        for slot, key, lazy in times:
+            value = getattr(self, slot)
+
+            if value.__class__ is str and not (lazy and isoformat(value)):
+                try:
+                    value = fromisoformat(value)
+
+                except ValueError:
+                    raise MetadataValueError(f"metadata value is invalid for {key!r} - not ISO8601")
+
+                setattr(self, slot, value.isoformat() if lazy else value)
+
+        found = len(required)
+
+        for slot, key in lists:
+            setattr(self, slot, document.get(key) or [])
+            found += key in document
+
+        if omittable:
+            self._omitted = tuple(key for key in omittable if key not in document)
+
+        for slot, key, default in optional:
+            setattr(self, slot, document.get(key, default))
+            found += key in document
+
+        pool = interning.pool
+
+        if pool is not None:
+            for slot, listed in interned:
+                value = getattr(self, slot)
+                setattr(self, slot, pool.intern_all(value) if listed else pool.intern(value))
+
+        if audiotype:
+            self.type = audiotype
+            found += 'type' in document
+
+        self._extra = _collect_extra(document, found, names)
+        return self
+
+    return _named(load, name)
+
+
+def compile_state(schema: Schema, name: str = "state") -> typing.Callable:
+    """
+    A function that builds a function from a schema that returns a snapshot of the attributes of
+    an audio file object as a tuple. List and extra values are copied, so a snapshot differs from
+    a later one if any attribute was reassigned or changed in place. The classes of the values are
+    part of the snapshot, so it also differs if a value was replaced with an equal value of another
+    class that is serialized differently, such as 1 with True.
+    """
+    values = operator.attrgetter(*(field.slot for field in schema.fields if field.kind != "strlist"))
+    lists = tuple(operator.attrgetter(field.slot) for field in schema.fields if field.kind == "strlist")
+
+    def state(self):
+        current = values(self)
+        extra = self._extra
+        snapshot = (current, tuple(map(type, current)), self.type,
+                    extra and tuple((key, value.__class__, value) for key, value in extra.items()))
+
+        for get in lists:
+            items = tuple(get(self))
+            snapshot += (items, tuple(map(type, items)))
+
+        return snapshot
+
+    return _named(state, name)
+
+
+def compile_key(schema: Schema, name: str = "key") -> typing.Callable:
+    """
+    A function that builds a function from a schema that returns the values of the validated
+    fields of an audio file object as a tuple, with its type first and list values as tuples
+    after the other values. Fields that are not in the schema are not part of the key.
+    """
+    fields = schema.fields
+    values = operator.attrgetter("type", *(field.attribute for field in fields if field.kind != "strlist"))
+    lists = tuple(operator.attrgetter(field.attribute) for field in fields if field.kind == "strlist")
+
+    def key(self):
+        if not lists:
+            return values(self)
+
+        return (*values(self), *[tuple(get(self)) for get in lists])
+
+    return _named(key, name)
+
+
+def compile_freezer(schema: Schema, name: str = "freeze") -> typing.Callable:
+    """
+    A function that builds a function from a schema that copies an audio file object into a
+    new object of a frozen class, which does not allow its attributes to be set. Lazy fields
+    are copied parsed, list values are copied as tuples and the hash of the key of the copy
+    is stored as its '_hash' attribute.
+    """
+    new, setslot = object.__new__, object.__setattr__
+    copies = tuple((field.slot, field.attribute, field.kind == "strlist") for field in schema.fields)
+    omittable = _optional_lists(schema)
+
+    def freeze(self, cls):
+        frozen = new(cls)
+
+        for slot, attribute, listed in copies:
+            value = getattr(self, attribute)
+            setslot(frozen, slot, tuple(value) if listed else value)
+
+        if omittable:
+            setslot(frozen, '_omitted', self._omitted)
+
+        setslot(frozen, 'type', self.type)
+        setslot(frozen, '_extra', self._extra and dict(self._extra))
+        setslot(frozen, '_hash', hash(frozen._key()))
+        return frozen
+
+    return _named(freeze, name)
+
+
+def _collect_extra(source: dict, found: int, names: typing.FrozenSet[str]) -> typing.Optional[dict]:
+    """ A function that returns the fields of the dict 'source' that are not in the schema
+    'names', only looking for them if there are more fields than the 'found' schema fields,
+    or None if there are no such fields. """
+    if len(source) > found:
+        extra = {key: value for key, value in source.items() if key not in names}
+        return extra if extra else None
+
+    return None
+
+
+def _dump_getter(field: Field) -> typing.Callable:
+    """ A function that returns a function that reads the metadata value of a field from an
+    audio file object """
+    get = operator.attrgetter(field.slot)
+
+    if field.kind == "isotime" and field.lazy:
+        # A lazy field still holds the stored str if it was never accessed
+        def getter(self):
+            value = get(self)
+            return value if value.__class__ is str else value.isoformat()
+
+        return getter
+
+    if field.kind == "isotime":
+        return lambda self: get(self).isoformat()
+
+    if field.kind == "strlist":
+        return lambda self: list(get(self))
+
+    return get
+
+
+def compile_dumper(schema: Schema, name: str = "dump") -> typing.Callable:
+    """
+    A function that builds a function from a schema that generates the metadata dict of an
+    audio file object from its attributes. The fields are in the order in which the constructors
+    of the audio files have always added them - the fields of the schema in order, with the
+    'type' of a schema with an 'audiotype' before the generated 'uploadtime' and '_id'. Optional
+    lists that were not in the metadata of the object are left out while they are empty.
+    """
+    audiotype = schema.audiotype
+    generated = tuple(field for field in schema.fields if audiotype and field.kind in ("isotime", "id"))
+    getters = [(field.name, _dump_getter(field)) for field in schema.fields if field not in generated]
+
+    if audiotype:
+        getters.append(("type", lambda self: audiotype))
+        getters += [(field.name, _dump_getter(field)) for field in generated]
+
+    getters = tuple(getters)
+    omittable = _optional_lists(schema)
+
+    def dump(self):
+        metadata = {key: get(self) for key, get in getters}
+
+        if omittable:
+            for key in self._omitted:
+                if not metadata[key]:
+                    del metadata[key]
+
+        return metadata
+
+    return _named(dump, name)
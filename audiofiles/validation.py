@@ -0,0 +1,52 @@
+"""
+This module contains the validate_batch function that validates
+the metadata of many Song, Podcast or Audiobook objects in one pass.
+"""
+import typing
+
+from audiofiles.errors import MetadataValueError
+from audiofiles.schema import SCHEMAS
+
+# The checks of every audio file type in order as (field, check, required)
+BATCH_CHECKS = {
+    audiotype: [(field.name, field.check, field.required) for field in SCHEMAS[audiotype].fields]
+    for audiotype in ("Song", "Podcast", "Audiobook")
+}
+
+
+def validate_batch(audiotype: str, metadatas: typing.List[dict]) -> typing.List[typing.List[str]]:
+    """
+    A function that validates a list of metadata dicts for an audio file type, one of 'Song',
+    'Podcast' and 'Audiobook' (case insensitive). The checks are grouped by field, so every
+    row is checked for one field before the next field is checked.
+
+    Returns a list with a list of error strs for every row, which is empty for valid rows.
+    The errors are the same as those raised by the constructors of the audio file type.
+    Only raises a MetadataValueError if the audio file type is not supported.
+    """
+    checks = BATCH_CHECKS.get(audiotype.capitalize())
+
+    if checks is None:
+        raise MetadataValueError(f"'{audiotype}' is not supported")
+
+    errors = [[] for _ in metadatas]
+    rows = []
+
+    for index, metadata in enumerate(metadatas):
+        if isinstance(metadata, dict):
+            rows.append((metadata, errors[index]))
+        else:
+            errors[index].append("metadata is invalid - not a dict")
+
+    for field, check, required in checks:
+        for metadata, row_errors in rows:
+            if field not in metadata:
+                if required:
+                    row_errors.append(f"metadata value is missing for '{field}'")
+                continue
+
+            valid, error = check(metadata[field])
+            if not valid:
+                row_errors.append(f"metadata value is invalid for '{field}' - {error}")
+
+    return errors
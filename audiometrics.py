@@ -0,0 +1,267 @@
+"""
+This module contains the metric classes that instrument the AudioServer
+resources and render them in the Prometheus text exposition format.
+
+Author: Manish Meganathan
+License: MIT License
+"""
+import math
+import time
+import typing
+import bisect
+import threading
+
+# The content type of the Prometheus text exposition format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# The default upper bounds of the histogram buckets in seconds, from 100us to 10s
+DEFAULT_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025,
+                   0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def formatLabels(labelnames: typing.Sequence[str], labelvalues: typing.Sequence[str], extra: str = "") -> str:
+    """ A function that formats label names and values as a Prometheus label set """
+    pairs = [f'{name}="{escapeLabel(str(value))}"' for name, value in zip(labelnames, labelvalues)]
+
+    if extra:
+        pairs.append(extra)
+
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def escapeLabel(value: str) -> str:
+    """ A function that escapes a label value for the Prometheus text format """
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def formatValue(value: float) -> str:
+    """ A function that formats a sample value for the Prometheus text format """
+    if value == math.inf:
+        return "+Inf"
+
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """
+    ************
+    Description:
+    ************
+    *A thread-safe Prometheus counter with labels.*
+
+    *****************
+    Class Attributes:
+    *****************
+    - ``name``:     An str that is the name of the metric, without the '_total' suffix.
+    - ``documentation``:    An str that describes the metric.
+    - ``labelnames``:   A tuple of the names of the labels of the metric.
+
+    **************
+    Class Methods:
+    **************
+    - ``inc``:      A method that increments the counter for a set of label values.
+    - ``value``:    A method that returns the value of the counter for a set of label values.
+    - ``render``:   A method that returns the lines of the metric in the Prometheus text format.
+    """
+    def __init__(self, name: str, documentation: str, labelnames: typing.Sequence[str] = ()):
+        """ Constructor """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labelvalues: str, amount: float = 1):
+        """ A method that increments the counter for a set of label values by an amount. """
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0) + amount
+
+    def value(self, *labelvalues: str) -> float:
+        """ A method that returns the value of the counter for a set of label values. """
+        with self._lock:
+            return self._values.get(labelvalues, 0)
+
+    def render(self) -> typing.List[str]:
+        """ A method that returns the lines of the counter in the Prometheus text format. """
+        with self._lock:
+            values = sorted(self._values.items())
+
+        lines = [f"# HELP {self.name}_total {self.documentation}",
+                 f"# TYPE {self.name}_total counter"]
+
+        for labelvalues, value in values:
+            lines.append(f"{self.name}_total{formatLabels(self.labelnames, labelvalues)} {formatValue(value)}")
+
+        return lines
+
+
+class Histogram:
+    """
+    ************
+    Description:
+    ************
+    *A thread-safe Prometheus histogram with labels.*
+
+    Observations are counted in the first bucket whose upper bound is not smaller than them.
+    The buckets are rendered as cumulative counts with an additional '+Inf' bucket.
+
+    *****************
+    Class Attributes:
+    *****************
+    - ``name``:     An str that is the name of the metric.
+    - ``documentation``:    An str that describes the metric.
+    - ``labelnames``:   A tuple of the names of the labels of the metric.
+    - ``buckets``:  A tuple of the sorted upper bounds of the buckets.
+
+    **************
+    Class Methods:
+    **************
+    - ``observe``:  A method that records an observation for a set of label values.
+    - ``time``:     A method that returns a context manager that observes its duration.
+    - ``count``:    A method that returns the number of observations for a set of label values.
+    - ``render``:   A method that returns the lines of the metric in the Prometheus text format.
+    """
+    def __init__(self, name: str, documentation: str, labelnames: typing.Sequence[str] = (),
+                 buckets: typing.Sequence[float] = DEFAULT_BUCKETS):
+        """ Constructor """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+        # The per bucket counts, the sum and the count of the observations of every label set
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labelvalues: str):
+        """ A method that records an observation for a set of label values. """
+        index = bisect.bisect_left(self.buckets, value)
+
+        with self._lock:
+            entry = self._values.get(labelvalues)
+
+            if entry is None:
+                entry = self._values[labelvalues] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+
+            entry[0][index] += 1
+            entry[1] += value
+            entry[2] += 1
+
+    def time(self, *labelvalues: str) -> 'Timer':
+        """ A method that returns a context manager that observes the seconds spent in it. """
+        return Timer(self, labelvalues)
+
+    def count(self, *labelvalues: str) -> int:
+        """ A method that returns the number of observations for a set of label values. """
+        with self._lock:
+            entry = self._values.get(labelvalues)
+            return entry[2] if entry else 0
+
+    def render(self) -> typing.List[str]:
+        """ A method that returns the lines of the histogram in the Prometheus text format. """
+        with self._lock:
+            values = sorted((labelvalues, (list(counts), total, count))
+                            for labelvalues, (counts, total, count) in self._values.items())
+
+        lines = [f"# HELP {self.name} {self.documentation}",
+                 f"# TYPE {self.name} histogram"]
+
+        for labelvalues, (counts, total, count) in values:
+            cumulative = 0
+
+            for bound, bucketcount in zip(self.buckets + (math.inf,), counts):
+                cumulative += bucketcount
+                labels = formatLabels(self.labelnames, labelvalues, f'le="{formatValue(float(bound))}"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+
+            labels = formatLabels(self.labelnames, labelvalues)
+            lines.append(f"{self.name}_sum{labels} {formatValue(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+
+        return lines
+
+
+class Timer:
+    """ A context manager that observes the seconds spent in it in a Histogram """
+    __slots__ = ('histogram', 'labelvalues', 'start')
+
+    def __init__(self, histogram: Histogram, labelvalues: tuple):
+        """ Constructor """
+        self.histogram = histogram
+        self.labelvalues = labelvalues
+
+    def __enter__(self):
+        """ Starts the timer """
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        """ Stops the timer and observes the elapsed seconds """
+        self.histogram.observe(time.perf_counter() - self.start, *self.labelvalues)
+
+
+class Gauge:
+    """
+    ************
+    Description:
+    ************
+    *A Prometheus gauge or counter whose value is read from a function when it is rendered.*
+
+    *****************
+    Class Attributes:
+    *****************
+    - ``name``:     An str that is the name of the metric.
+    - ``documentation``:    An str that describes the metric.
+    - ``function``: A function without arguments that returns the value of the metric.
+    - ``kind``:     An str that is the Prometheus type of the metric, 'gauge' or 'counter'.
+
+    **************
+    Class Methods:
+    **************
+    - ``render``:   A method that returns the lines of the metric in the Prometheus text format.
+    """
+    def __init__(self, name: str, documentation: str, function: typing.Callable[[], float], kind: str = "gauge"):
+        """ Constructor """
+        self.name = name
+        self.documentation = documentation
+        self.function = function
+        self.kind = kind
+
+    def render(self) -> typing.List[str]:
+        """ A method that returns the lines of the metric in the Prometheus text format. """
+        return [f"# HELP {self.name} {self.documentation}",
+                f"# TYPE {self.name} {self.kind}",
+                f"{self.name} {formatValue(self.function())}"]
+
+
+class MetricsRegistry:
+    """
+    ************
+    Description:
+    ************
+    *A collection of metrics that are rendered together.*
+
+    **************
+    Class Methods:
+    **************
+    - ``register``: A method that adds a metric to the registry and returns it.
+    - ``render``:   A method that returns all metrics in the Prometheus text format.
+    """
+    def __init__(self):
+        """ Constructor """
+        self.metrics = []
+
+    def register(self, metric):
+        """ A method that adds a Counter, Histogram or Gauge to the registry and returns it. """
+        self.metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        """ A method that returns all metrics of the registry in the Prometheus text format. """
+        lines = []
+
+        for metric in self.metrics:
+            lines += metric.render()
+
+        return "\n".join(lines) + "\n"
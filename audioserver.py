@@ -1,20 +1,116 @@
 """
 A Flask-RESTful App Server that serves audio file metadata from a MongoDB server
+or an in-memory storage backend
 
 Author: Manish Meganathan
 License: MIT License
 """
 import os
-
-from pymongo import MongoClient
-from flask import Flask, request
+import base64
+import typing
+import time
+import logging
+import threading
+import binascii
+import itertools
+
+from pymongo import ASCENDING
+from flask import Flask, Response, g, request, has_request_context
 from flask_restful import Api, Resource
+from flask_restful.representations.json import output_json
 
-from audiofiles import Song, Podcast, Audiobook
+from audiofiles import Audio, Song, Podcast, Audiobook, SCHEMAS, encode
 from audiofiles import MetadataValueError, MetadataGenerationError
+from audiofiles.idgenerator import generator, configured_worker
+from documentcache import DocumentCache
+from audiostorage import StorageBackend, createStorage, StorageUnavailableError
+from audiometrics import MetricsRegistry, Counter, Histogram, Gauge, CONTENT_TYPE
+from slowlog import SlowOperationLog
+
+# The logger of the server, which is configured by the process that runs the app
+logger = logging.getLogger(__name__)
+
+
+def currentEndpoint() -> typing.Optional[str]:
+    """ A function that returns the endpoint of the current request or None outside a request """
+    return request.endpoint if has_request_context() else None
+
+
+# The log of slow database operations, enabled by setting AUDIOSERVERSLOWLOG to a file path
+slowlog = None
+if os.environ.get('AUDIOSERVERSLOWLOG'):
+    slowlog = SlowOperationLog(os.environ['AUDIOSERVERSLOWLOG'],
+                               threshold=float(os.environ.get('AUDIOSERVERSLOWMS', 100)) / 1000,
+                               interval=float(os.environ.get('AUDIOSERVERSLOWINTERVAL', 1)),
+                               context=currentEndpoint)
+
+# The storage backend, either 'mongo' (default) for the AUDIOSERVERDB MongoDB server or 'memory'.
+# It is created by connectStorage, so that a process can import the app and fork before connecting
+storage: typing.Optional[StorageBackend] = None
+storageLock = threading.RLock()
+
+# The default and maximum number of documents returned in a single page of a Get-all request
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+# The maximum number of audio files that can be created with a single batch create request
+MAX_BATCH_SIZE = 1000
+
+# The compound indexes required by the resource handlers and the query shapes that they cover
+INDEXES = [
+    {
+        "name": "type_id",
+        "keys": [("type", ASCENDING), ("_id", ASCENDING)],
+        "shapes": ["Get/Update/Delete {type, _id}",
+                   "Get many {type, _id: $in}",
+                   "Get-all page {type, _id: $gt} sorted by _id",
+                   "Get-all {type}"]
+    },
+    {
+        "name": "type_uploadtime",
+        "keys": [("type", ASCENDING), ("uploadtime", ASCENDING)],
+        "shapes": ["Get-all {type} sorted by uploadtime",
+                   "{type, uploadtime: <range>}"]
+    }
+]
+
+# The Audio classes for each supported audio file type
+AUDIO_CLASSES = {"Song": Song, "Podcast": Podcast, "Audiobook": Audiobook}
+
+# The names of the validate classmethods of the Audio classes for the kinds of the fields that can be updated
+FIELD_VALIDATORS = {"str": "validate_string", "int": "validate_duration", "strlist": "validate_participants"}
+
+# Read-through cache for single document Get requests, keyed by (type, _id)
+cache = DocumentCache(maxsize=int(os.environ.get('AUDIOSERVERCACHESIZE', 1024)),
+                      ttl=float(os.environ.get('AUDIOSERVERCACHETTL', 60)))
+
+# The metrics of this process, served in the Prometheus text format by the /metrics endpoint
+metrics = MetricsRegistry()
+
+requestLatency = metrics.register(Histogram(
+    "audioserver_request_duration_seconds", "Latency of requests by endpoint and method.",
+    ["endpoint", "method"]))
+phaseLatency = metrics.register(Histogram(
+    "audioserver_phase_duration_seconds", "Latency of the phases of requests by endpoint, method and phase.",
+    ["endpoint", "method", "phase"]))
+responseCount = metrics.register(Counter(
+    "audioserver_responses", "Responses by endpoint, method and status code.",
+    ["endpoint", "method", "status"]))
+documentCount = metrics.register(Counter(
+    "audioserver_documents_returned", "Documents returned by Get requests by response format.",
+    ["format"]))
+
+for statistic in ("hits", "misses", "evictions", "expirations"):
+    metrics.register(Gauge(f"audioserver_cache_{statistic}_total", f"Document cache {statistic}.",
+                           lambda statistic=statistic: cache.stats()[statistic], kind="counter"))
 
-cluster = MongoClient(os.environ.get('AUDIOSERVERDB'))
-collection = cluster["AudioServer"]["audiofiles"]
+metrics.register(Gauge("audioserver_cache_size", "Documents in the document cache.", lambda: len(cache)))
+
+
+def timePhase(phase: str):
+    """ A function that returns a context manager that observes the latency of a phase of
+    the current request. The phases are 'parse', 'validate', 'storage' and 'serialize'. """
+    return phaseLatency.time(request.endpoint or "unknown", request.method, phase)
 
 
 def generate400response(error: str) -> dict:
@@ -37,20 +133,15 @@ def generate500response(error: str) -> dict:
 
 def generateAudio(audiotype: str, audiometadata: dict):
     """ A function that generates an Audio object, one of Song, Podcast and Audiobook
-    and returns it. Returns None if the 'audiotype' is invalid. """
+    and returns it. The metadata is validated by the compiled schema validator of the
+    class. Returns None if the 'audiotype' is invalid. """
     try:
-        audiotype = audiotype.lower()
-
-        if audiotype == "song":
-            file = Song(audiometadata)
-        elif audiotype == "podcast":
-            file = Podcast(audiometadata)
-        elif audiotype == "audiobook":
-            file = Audiobook(audiometadata)
-        else:
+        audioclass = AUDIO_CLASSES.get(audiotype.capitalize())
+
+        if audioclass is None:
             return None
 
-        return file
+        return audioclass(audiometadata)
 
     except MetadataValueError as error:
         raise MetadataValueError(error)
@@ -59,56 +150,318 @@ def generateAudio(audiotype: str, audiometadata: dict):
         raise MetadataGenerationError(error)
 
 
+def generateAudioFromRequest(data: dict) -> typing.Tuple[typing.Optional[Audio], typing.Optional[tuple]]:
+    """ A function that validates a create request of the format {audioFileType, audioFileMetadata}
+    and generates its Audio object. Returns the Audio object and None if the request is valid,
+    otherwise returns None and an error response with its status code. """
+    try:
+        audiotype: str = data['audioFileType']
+        audiometadata: dict = data['audioFileMetadata']
+
+    except KeyError as key:
+        response = generate400response(f"{key} is required")
+        return None, (response, 400)
+
+    if not isinstance(audiotype, str):
+        response = generate400response("'audioFileType' must be an str")
+        return None, (response, 400)
+
+    if not isinstance(audiometadata, dict):
+        response = generate400response("'audioFileMetadata' must be a dict")
+        return None, (response, 400)
+
+    try:
+        audiotype = audiotype.capitalize()
+        audiofile = generateAudio(audiotype, audiometadata)
+
+        if not audiofile:
+            response = generate400response(f"'{audiotype}' is not supported")
+            return None, (response, 400)
+
+    except MetadataValueError as error:
+        response = generate400response(f"{error}")
+        return None, (response, 400)
+
+    except MetadataGenerationError as error:
+        response = generate500response(f"metadata generation for {audiotype} - {error}")
+        return None, (response, 500)
+
+    return audiofile, None
+
+
+def reserveBatchIDs(data: list) -> list:
+    """ A function that returns the items of a batch create request with a new '_id' set in a copy
+    of every metadata dict that has none. The IDs are reserved from the ID generator with a single
+    call, instead of one at a time by the constructor of every audio file. """
+    items = list(data)
+    pending = [index for index, item in enumerate(items) if isinstance(item, dict)
+               and isinstance(item.get('audioFileMetadata'), dict) and '_id' not in item['audioFileMetadata']]
+
+    for index, audioID in zip(pending, generator.next_ids(len(pending))):
+        item = items[index]
+        items[index] = dict(item, audioFileMetadata=dict(item['audioFileMetadata'], _id=audioID))
+
+    return items
+
+
+def generateProjection(audiotype: str, fields: typing.Optional[str]) -> typing.Optional[dict]:
+    """ A function that generates a database projection from a comma separated str of field
+    names. Returns None if no fields are given. Raises a ValueError if a field is not defined
+    for the audio file type. The '_id' field is always included in the projection. """
+    if fields is None:
+        return None
+
+    projection = {}
+    for field in fields.split(','):
+        if field not in AUDIO_CLASSES[audiotype].FIELDS:
+            raise ValueError(f"'{field}' is not a field of {audiotype}")
+
+        projection[field] = 1
+
+    return projection
+
+
+def projectDocument(document: dict, projection: typing.Optional[dict]) -> dict:
+    """ A function that trims a document to the fields of a projection and returns it """
+    if projection is None:
+        return document
+
+    return {key: value for key, value in document.items() if key == '_id' or key in projection}
+
+
+def parseUpdateRequest(audiotype: str, data: dict) -> typing.Tuple[typing.Optional[dict], typing.Optional[tuple]]:
+    """ A function that validates an update request of the format {audioFileType, audioFileMetadata}
+    against the audio file type of the endpoint. Returns the metadata and None if the request is
+    valid, otherwise returns None and an error response with its status code. """
+    try:
+        param_audiotype: str = data['audioFileType']
+        audiometadata: dict = data['audioFileMetadata']
+
+    except KeyError as key:
+        response = generate400response(f"{key} is required")
+        return None, (response, 400)
+
+    if not isinstance(param_audiotype, str):
+        response = generate400response("'audioFileType' must be an str")
+        return None, (response, 400)
+
+    if not isinstance(audiometadata, dict):
+        response = generate400response("'audioFileMetadata' must be a dict")
+        return None, (response, 400)
+
+    if param_audiotype.capitalize() != audiotype:
+        response = generate400response("'audioFileType' field must match the endpoint")
+        return None, (response, 400)
+
+    return audiometadata, None
+
+
+def validatePartialMetadata(audiotype: str, audiometadata: dict) -> dict:
+    """ A function that validates the fields of a partial metadata dict for an audio file type
+    with the validate classmethods of its Audio class, which the constructors share. Returns the
+    metadata with empty optional lists replaced by their default. Raises a MetadataValueError
+    for the first field that cannot be updated or is invalid. """
+    audioclass = AUDIO_CLASSES[audiotype]
+    schema = SCHEMAS[audiotype]
+    validated = {}
+
+    for name, value in audiometadata.items():
+        if name not in audioclass.FIELDS:
+            raise MetadataValueError(f"'{name}' is not a field of {audiotype}")
+
+        field = schema.field(name)
+
+        if field is None or not field.mutable or field.kind not in FIELD_VALIDATORS:
+            raise MetadataValueError(f"'{name}' cannot be updated")
+
+        # An empty list is replaced by the default, as it is by the constructors
+        if field.kind == "strlist" and not value:
+            value = field.default()
+
+        valid, error = getattr(audioclass, FIELD_VALIDATORS[field.kind])(value)
+        if not valid:
+            raise MetadataValueError(f"metadata value is invalid for '{name}' - {error}")
+
+        validated[name] = value
+
+    return validated
+
+
+def encodeCursor(audioID: int) -> str:
+    """ A function that encodes the ID of the last document in a page into an opaque cursor str """
+    return base64.urlsafe_b64encode(str(audioID).encode()).decode()
+
+
+def decodeCursor(cursor: str) -> int:
+    """ A function that decodes an opaque cursor str into the ID of the last document in a page.
+    Raises a ValueError if the cursor is malformed. """
+    try:
+        return int(base64.urlsafe_b64decode(cursor.encode()).decode())
+
+    except (binascii.Error, UnicodeError) as error:
+        raise ValueError(error)
+
+
+def streamDocuments(documents: typing.Iterator[dict], cursor) -> typing.Iterator[str]:
+    """ A generator function that yields documents as newline delimited JSON (NDJSON) lines
+    as they are read from the storage backend. The storage cursor is closed once the stream
+    ends or the client disconnects. """
+    count = 0
+
+    try:
+        for document in documents:
+            yield encode(document) + "\n"
+            count += 1
+
+    finally:
+        cursor.close()
+        documentCount.inc("ndjson", amount=count)
+
+
+def connectStorage(poolsize: typing.Optional[int] = None) -> StorageBackend:
+    """ A function that creates the storage backend configured by the AUDIOSERVERSTORAGE and
+    AUDIOSERVERDB environment variables, ensures its indexes and logs the index report. The
+    MongoDB client keeps at most 'poolsize' connections, which defaults to AUDIOSERVERPOOLSIZE
+    or the pymongo default. Returns the storage backend, which replaces any previous one. """
+    global storage
+
+    if poolsize is None and os.environ.get('AUDIOSERVERPOOLSIZE'):
+        poolsize = int(os.environ['AUDIOSERVERPOOLSIZE'])
+
+    with storageLock:
+        storage = createStorage(os.environ.get('AUDIOSERVERSTORAGE', "mongo"), os.environ.get('AUDIOSERVERDB'),
+                                slowlog, poolsize)
+
+        for index_report in ensureIndexes():
+            logger.info(index_report)
+
+    return storage
+
+
+def ensureIndexes() -> typing.List[str]:
+    """ A function that creates the indexes in INDEXES if they do not exist. Index creation
+    is idempotent and indexes that already exist are left untouched. Returns a report with
+    a line for every index that describes the query shapes it covers or why it failed. """
+    report = []
+
+    for index in INDEXES:
+        keys = ", ".join(key for key, _ in index['keys'])
+
+        try:
+            storage.create_index(index['name'], index['keys'])
+
+        except StorageUnavailableError as error:
+            # The database is unreachable, so the remaining indexes would also time out
+            report.append(f"index creation failed - {error}")
+            break
+
+        except Exception as error:
+            report.append(f"index '{index['name']}' on ({keys}) could not be created - {error}")
+            continue
+
+        report.append(f"index '{index['name']}' on ({keys}) covers {'; '.join(index['shapes'])}")
+
+    return report
+
+
 # noinspection PyMethodMayBeStatic
 class Create(Resource):
     """ Resource for creating new audio files on the server """
     def post(self):
         """ RESTful POST Method. """
-        data = request.get_json()
+        with timePhase("parse"):
+            data = request.get_json()
+
+        with timePhase("validate"):
+            audiofile, error = generateAudioFromRequest(data)
+
+        if error:
+            return error
+
+        audiotype = audiofile.type
 
         try:
-            audiotype: str = data['audioFileType']
-            audiometadata: dict = data['audioFileMetadata']
+            with timePhase("storage"):
+                inserted_id = storage.insert(audiofile.metadata)
 
-        except KeyError as key:
-            response = generate400response(f"{key} is required")
-            return response, 400
+        except Exception as error:
+            response = generate500response(f"database insertion failed - {error}")
+            return response, 500
 
-        if not isinstance(audiotype, str):
-            response = generate400response("'audioFileType' must be an str")
+        return {
+            "status": 200,
+            "message": "Create Complete",
+            "result": f"{audiotype} file with ID {inserted_id} has been created",
+            "document": inserted_id
+        }, 200
+
+
+# noinspection PyMethodMayBeStatic
+class CreateBatch(Resource):
+    """ Resource for creating multiple new audio files on the server with a single request """
+    def post(self):
+        """ RESTful POST Method. """
+        with timePhase("parse"):
+            data = request.get_json()
+
+        if not isinstance(data, list):
+            response = generate400response("request must be a list of audio files")
             return response, 400
 
-        if not isinstance(audiometadata, dict):
-            response = generate400response("'audioFileMetadata' must be a dict")
+        if not 0 < len(data) <= MAX_BATCH_SIZE:
+            response = generate400response(f"request must contain between 1 and {MAX_BATCH_SIZE} audio files")
             return response, 400
 
-        try:
-            audiotype = audiotype.capitalize()
-            audiofile = generateAudio(audiotype, audiometadata)
+        results = [None] * len(data)
+        documents, positions = [], []
 
-            if not audiofile:
-                response = generate400response(f"'{audiotype}' is not supported")
-                return response, 400
+        with timePhase("validate"):
+            for index, item in enumerate(reserveBatchIDs(data)):
+                if not isinstance(item, dict):
+                    results[index] = generate400response("audio file must be a dict")
+                    continue
 
-        except MetadataValueError as error:
-            response = generate400response(f"{error}")
-            return response, 400
+                audiofile, error = generateAudioFromRequest(item)
 
-        except MetadataGenerationError as error:
-            response = generate500response(f"metadata generation for {audiotype} - {error}")
-            return response, 500
+                if error:
+                    results[index] = error[0]
+                    continue
 
-        insert_result = collection.insert_one(audiofile.metadata)
+                documents.append(audiofile.metadata)
+                positions.append(index)
 
-        if not insert_result.acknowledged:
-            response = generate500response("database insertion failed")
-            return response, 500
+        failed_inserts = {}
+
+        if documents:
+            try:
+                # An unordered insert continues past failed documents and reports all of them
+                with timePhase("storage"):
+                    failed_inserts = storage.insert_many(documents)
+
+            except Exception as error:
+                response = generate500response(f"database insertion failed - {error}")
+                return response, 500
+
+        for count, (index, document) in enumerate(zip(positions, documents)):
+            if count in failed_inserts:
+                results[index] = generate500response(f"database insertion failed - {failed_inserts[count]}")
+                continue
+
+            results[index] = {
+                "status": 200,
+                "message": "Create Complete",
+                "result": f"{document['type']} file with ID {document['_id']} has been created",
+                "document": document['_id']
+            }
+
+        created = sum(1 for result in results if result['status'] == 200)
 
         return {
             "status": 200,
             "message": "Create Complete",
-            "result": f"{audiotype} file with ID {insert_result.inserted_id} has been created",
-            "document": insert_result.inserted_id
+            "result": f"{created} of {len(results)} file(s) have been created",
+            "results": results,
+            "created": created
         }, 200
 
 
@@ -124,13 +477,16 @@ class Delete(Resource):
             return response, 400
 
         try:
-            search_filter = {"type": audiotype, "_id": audioID}
-            delete_result = collection.find_one_and_delete(search_filter)
+            with timePhase("storage"):
+                delete_result = storage.delete(audiotype, audioID)
 
         except Exception as error:
             response = generate500response(f"database query and delete failed - {error}")
             return response, 500
 
+        finally:
+            cache.invalidate((audiotype, audioID))
+
         if not delete_result:
             return {
                 "status": 200,
@@ -157,49 +513,24 @@ class Update(Resource):
             response = generate400response(f"'{audiotype}' is not supported")
             return response, 400
 
-        data = request.get_json()
-
-        try:
-            param_audiotype: str = data['audioFileType']
-            audiometadata: dict = data['audioFileMetadata']
-
-        except KeyError as key:
-            response = generate400response(f"{key} is required")
-            return response, 400
-
-        if not isinstance(param_audiotype, str):
-            response = generate400response("'audioFileType' must be an str")
-            return response, 400
+        with timePhase("parse"):
+            data = request.get_json()
 
-        if not isinstance(audiometadata, dict):
-            response = generate400response("'audioFileMetadata' must be a dict")
-            return response, 400
+        audiometadata, error = parseUpdateRequest(audiotype, data)
 
-        if param_audiotype.capitalize() != audiotype:
-            response = generate400response("'audioFileType' field must match the endpoint")
-            return response, 400
+        if error:
+            return error
 
         try:
-            search_filter = {"type": audiotype, "_id": audioID}
-            old_document = collection.find_one(search_filter)
-
-        except Exception as error:
-            response = generate500response(f"database query failed - {error}")
-            return response, 500
-
-        if not old_document:
-            response = generate400response(f"No document found for ID - {audioID}")
-            return response, 400
-
-        try:
-            new_audiofile = generateAudio(audiotype, audiometadata)
+            with timePhase("validate"):
+                new_audiofile = generateAudio(audiotype, audiometadata)
 
             if not new_audiofile:
                 response = generate400response(f"'{audiotype}' is not supported")
                 return response, 400
 
             new_document = new_audiofile.metadata
-            new_document['_id'] = old_document['_id']
+            new_document['_id'] = audioID
 
         except MetadataValueError as error:
             response = generate400response(f"{error}")
@@ -214,12 +545,21 @@ class Update(Resource):
             return response, 500
 
         try:
-            pre_update_doc = collection.find_one_and_replace(search_filter, new_document)
+            # A single atomic replace, the pre-update document is None if no document matched
+            with timePhase("storage"):
+                pre_update_doc = storage.replace(audiotype, audioID, new_document)
 
         except Exception as error:
             response = generate500response(f"database query and replace failed - {error}")
             return response, 500
 
+        finally:
+            cache.invalidate((audiotype, audioID))
+
+        if not pre_update_doc:
+            response = generate400response(f"No document found for ID - {audioID}")
+            return response, 400
+
         return {
             "status": 200,
             "message": "Update Complete",
@@ -229,6 +569,57 @@ class Update(Resource):
             "document": audioID
         }, 200
 
+    def patch(self, audiotype: str, audioID: int):
+        """ RESTful PATCH Method. """
+        audiotype = audiotype.capitalize()
+
+        if audiotype.lower() not in ['song', 'podcast', 'audiobook']:
+            response = generate400response(f"'{audiotype}' is not supported")
+            return response, 400
+
+        with timePhase("parse"):
+            data = request.get_json()
+
+        audiometadata, error = parseUpdateRequest(audiotype, data)
+
+        if error:
+            return error
+
+        if not audiometadata:
+            response = generate400response("'audioFileMetadata' must not be empty")
+            return response, 400
+
+        try:
+            with timePhase("validate"):
+                audiometadata = validatePartialMetadata(audiotype, audiometadata)
+
+        except MetadataValueError as error:
+            response = generate400response(f"{error}")
+            return response, 400
+
+        try:
+            with timePhase("storage"):
+                updated = storage.update(audiotype, audioID, audiometadata)
+
+        except Exception as error:
+            response = generate500response(f"database query and update failed - {error}")
+            return response, 500
+
+        finally:
+            cache.invalidate((audiotype, audioID))
+
+        if not updated:
+            response = generate400response(f"No document found for ID - {audioID}")
+            return response, 400
+
+        return {
+            "status": 200,
+            "message": "Update Complete",
+            "result": f"{audiotype} file with ID {audioID} has been updated",
+            "updated": audiometadata,
+            "document": audioID
+        }, 200
+
 
 # noinspection PyMethodMayBeStatic
 class Get(Resource):
@@ -242,35 +633,233 @@ class Get(Resource):
             return response, 400
 
         try:
-            if audioID:
-                search = {"type": audiotype, "_id": audioID}
-                result = collection.find_one(search)
-                result = [result] if result else []
-            else:
-                search = {"type": audiotype}
-                search_result = collection.find(search)
+            projection = generateProjection(audiotype, request.args.get('fields'))
+
+        except ValueError as error:
+            response = generate400response(f"{error}")
+            return response, 400
+
+        if audioID:
+            try:
+                # The whole document is cached and trimmed, so that cached documents can
+                # serve requests for any set of fields
+                with timePhase("storage"):
+                    result = cache.fetch((audiotype, audioID), lambda: storage.find_one(audiotype, audioID))
+
+                result = [projectDocument(result, projection)] if result else []
+
+            except Exception as error:
+                response = generate500response(f"database query failed - {error}")
+                return response, 500
+
+            documentCount.inc("json", amount=len(result))
+
+            return {
+                "status": 200,
+                "message": "Get Complete",
+                "result": f"{len(result)} result(s) found",
+                "documents": result,
+                "matches": len(result)
+            }, 200
+
+        ids = request.args.get('ids')
+
+        if ids is not None:
+            try:
+                # Remove the duplicate IDs while preserving the order of the request
+                audioIDs = list(dict.fromkeys(int(ID) for ID in ids.split(',')))
+
+            except ValueError:
+                response = generate400response("'ids' must be a comma separated list of int")
+                return response, 400
+
+            if len(audioIDs) > MAX_PAGE_SIZE:
+                response = generate400response(f"'ids' must contain at most {MAX_PAGE_SIZE} IDs")
+                return response, 400
+
+            try:
+                with timePhase("storage"):
+                    found = {res['_id']: res for res in storage.find_many(audiotype, audioIDs, projection)}
+
+            except Exception as error:
+                response = generate500response(f"database query failed - {error}")
+                return response, 500
+
+            result = [found[ID] for ID in audioIDs if ID in found]
+            missing = [ID for ID in audioIDs if ID not in found]
+            documentCount.inc("json", amount=len(result))
+
+            return {
+                "status": 200,
+                "message": "Get Complete",
+                "result": f"{len(result)} result(s) found",
+                "documents": result,
+                "matches": len(result),
+                "missing": missing
+            }, 200
+
+        limit = request.args.get('limit')
+        after = request.args.get('after')
+        paged = limit is not None or after is not None
+
+        if paged:
+            try:
+                limit = int(limit) if limit is not None else DEFAULT_PAGE_SIZE
+
+            except ValueError:
+                response = generate400response("'limit' must be an int")
+                return response, 400
+
+            if not 0 < limit <= MAX_PAGE_SIZE:
+                response = generate400response(f"'limit' must be between 1 and {MAX_PAGE_SIZE}")
+                return response, 400
+
+            if after is not None:
+                try:
+                    after = decodeCursor(after)
+
+                except ValueError:
+                    response = generate400response("'after' is not a valid cursor")
+                    return response, 400
+
+        mimetype = request.accept_mimetypes.best_match(['application/json', 'application/x-ndjson'])
+
+        if mimetype == 'application/x-ndjson' and not paged:
+            try:
+                # Read the first document before responding, so that a failed query can still
+                # be reported with a 500 response instead of an interrupted stream
+                with timePhase("storage"):
+                    search_result = storage.find_by_type(audiotype, projection)
+                    first = next(search_result, None)
+
+            except Exception as error:
+                response = generate500response(f"database query failed - {error}")
+                return response, 500
+
+            documents = itertools.chain([first], search_result) if first else iter([])
+            return Response(streamDocuments(documents, search_result), mimetype=mimetype)
+
+        if not paged:
+            try:
+                with timePhase("storage"):
+                    search_result = storage.find_by_type(audiotype, projection)
+                    result = [res for res in search_result]
+
+            except Exception as error:
+                response = generate500response(f"database query failed - {error}")
+                return response, 500
+
+            documentCount.inc("json", amount=len(result))
+
+            return {
+                "status": 200,
+                "message": "Get Complete",
+                "result": f"{len(result)} result(s) found",
+                "documents": result,
+                "matches": len(result)
+            }, 200
+
+        try:
+            # Fetch one document beyond the page to determine if another page exists
+            with timePhase("storage"):
+                search_result = storage.find_by_type(audiotype, projection, after=after, limit=limit + 1)
                 result = [res for res in search_result]
 
         except Exception as error:
             response = generate500response(f"database query failed - {error}")
             return response, 500
 
+        cursor = None
+        if len(result) > limit:
+            result = result[:limit]
+            cursor = encodeCursor(result[-1]['_id'])
+
+        if mimetype == 'application/x-ndjson':
+            # A page is read before responding to know if another page exists, and its
+            # cursor is returned in a header since the stream has no envelope
+            response = Response(streamDocuments(iter(result), search_result), mimetype=mimetype)
+
+            if cursor is not None:
+                response.headers['X-Next-Cursor'] = cursor
+
+            return response
+
+        documentCount.inc("json", amount=len(result))
+
         return {
             "status": 200,
             "message": "Get Complete",
             "result": f"{len(result)} result(s) found",
             "documents": result,
-            "matches": len(result)
+            "matches": len(result),
+            "next": cursor
         }, 200
 
 
-app = Flask(__name__)
-api = Api(app)
+# noinspection PyMethodMayBeStatic
+class Metrics(Resource):
+    """ Resource for retrieving the metrics of the server process in the Prometheus text format """
+    def get(self):
+        """ RESTful GET Method. """
+        return Response(metrics.render(), content_type=CONTENT_TYPE)
+
+
+def startRequest():
+    """ A function that records the start time of every request and connects the storage
+    backend on the first request if it was not connected when the process started """
+    g.requestStart = time.perf_counter()
+
+    if storage is None:
+        with storageLock:
+            if storage is None:
+                connectStorage()
+
+
+def observeRequest(response: Response) -> Response:
+    """ A function that observes the latency and status code of every request """
+    endpoint = request.endpoint or "unknown"
+
+    if 'requestStart' in g:
+        requestLatency.observe(time.perf_counter() - g.requestStart, endpoint, request.method)
+
+    responseCount.inc(endpoint, request.method, str(response.status_code))
+    return response
+
+
+def outputJSON(data, code: int, headers: dict = None) -> Response:
+    """ A function that serializes the JSON response of a resource and observes its latency """
+    with timePhase("serialize"):
+        return output_json(data, code, headers)
+
+
+def create_app() -> Flask:
+    """ A function that creates the Flask app with the resources of the AudioServer. The app
+    does not connect to the storage backend, which is connected by connectStorage, either in
+    each worker process after it is forked or on the first request. The ID worker number of
+    AUDIOSERVERWORKERID is checked, so that an invalid value fails the start of the server with
+    a ValueError instead of the first create request. """
+    configured_worker()
+
+    app = Flask(__name__)
+    api = Api(app)
+
+    app.before_request(startRequest)
+    app.after_request(observeRequest)
+    api.representation('application/json')(outputJSON)
+
+    api.add_resource(Create, '/create')
+    api.add_resource(CreateBatch, '/create/batch')
+    api.add_resource(Delete, '/delete/<string:audiotype>/<int:audioID>')
+    api.add_resource(Update, '/update/<string:audiotype>/<int:audioID>')
+    api.add_resource(Get, '/get/<string:audiotype>', '/get/<string:audiotype>/<int:audioID>')
+    api.add_resource(Metrics, '/metrics')
+
+    return app
+
 
-api.add_resource(Create, '/create')
-api.add_resource(Delete, '/delete/<string:audiotype>/<int:audioID>')
-api.add_resource(Update, '/update/<string:audiotype>/<int:audioID>')
-api.add_resource(Get, '/get/<string:audiotype>', '/get/<string:audiotype>/<int:audioID>')
+app = create_app()
 
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    connectStorage()
     app.run(host='0.0.0.0', port=int(os.environ.get('PORT', 8080)))
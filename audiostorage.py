@@ -0,0 +1,462 @@
+"""
+This module contains the storage backends of the AudioServer. The StorageBackend class
+defines the operations that the resources use to store audio file documents, with an
+implementation for MongoDB and an in-memory implementation that needs no database.
+
+Author: Manish Meganathan
+License: MIT License
+"""
+import abc
+import time
+import typing
+import bisect
+import threading
+
+from pymongo import MongoClient, ASCENDING
+from pymongo.errors import BulkWriteError, DuplicateKeyError, ServerSelectionTimeoutError
+
+
+class StorageError(Exception):
+    """ Custom exception to handle failed storage operations """
+    pass
+
+
+class StorageUnavailableError(StorageError):
+    """ Custom exception to handle an unreachable storage backend """
+    pass
+
+
+class DuplicateDocumentError(StorageError):
+    """ Custom exception to handle the insertion of a document with an existing ID """
+    pass
+
+
+class StorageBackend(abc.ABC):
+    """
+    ************
+    Description:
+    ************
+    *The abstract base class for all storage backends.*
+
+    Documents are dicts that are identified by their 'type' and '_id' fields. The '_id' of a
+    document is unique across all types. A projection is a dict of field names, documents
+    returned with a projection only contain those fields and the '_id'.
+
+    **************
+    Class Methods:
+    **************
+    - ``insert``:   A method that inserts a document.
+    - ``insert_many``:  A method that inserts many documents and reports the failed ones.
+    - ``find_one``: A method that returns the document for a type and ID.
+    - ``find_many``:    A method that returns the documents for a type and a list of IDs.
+    - ``find_by_type``: A method that returns the documents of a type, optionally as a page.
+    - ``replace``:  A method that replaces the document for a type and ID.
+    - ``update``:   A method that sets some fields of the document for a type and ID.
+    - ``delete``:   A method that deletes the document for a type and ID.
+    - ``create_index``: A method that ensures an index exists.
+    """
+    @abc.abstractmethod
+    def insert(self, document: dict) -> int:
+        """ A method that inserts a document and returns its ID. Raises a DuplicateDocumentError
+        if a document with the same ID exists. """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def insert_many(self, documents: typing.List[dict]) -> typing.Dict[int, str]:
+        """ A method that inserts many documents. A failed document does not prevent the other
+        documents from being inserted. Returns a dict of the position of every failed document
+        in the list to its error. """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def find_one(self, audiotype: str, audioID: int, projection: dict = None) -> typing.Optional[dict]:
+        """ A method that returns the document for a type and ID or None if it does not exist. """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def find_many(self, audiotype: str, audioIDs: typing.List[int], projection: dict = None) -> typing.List[dict]:
+        """ A method that returns the documents for a type and a list of IDs in any order.
+        IDs without a document are skipped. """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def find_by_type(self, audiotype: str, projection: dict = None,
+                     after: int = None, limit: int = None) -> typing.Iterator[dict]:
+        """ A method that returns an iterator over the documents of a type. If 'after' or 'limit'
+        are given, the documents are in ascending order of ID, start after the ID 'after' and
+        are at most 'limit' in number. The iterator has a close() method that releases it. """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def replace(self, audiotype: str, audioID: int, document: dict) -> typing.Optional[dict]:
+        """ A method that replaces the document for a type and ID with a single atomic operation.
+        Returns the document before the replace or None if it does not exist. """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def update(self, audiotype: str, audioID: int, fields: dict) -> bool:
+        """ A method that sets the given fields of the document for a type and ID with a single
+        atomic operation. Returns whether the document exists. """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def delete(self, audiotype: str, audioID: int) -> typing.Optional[dict]:
+        """ A method that deletes the document for a type and ID. Returns the deleted document
+        or None if it does not exist. """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def create_index(self, name: str, keys: typing.List[typing.Tuple[str, int]]):
+        """ A method that ensures an index exists. Index creation is idempotent. Raises a
+        StorageUnavailableError if the backend cannot be reached. """
+        raise NotImplementedError
+
+
+class TimedCursor:
+    """
+    ************
+    Description:
+    ************
+    *An iterator over a database cursor that measures the time spent reading it.*
+
+    The time of the query and of every batch read is summed, and reported with the number of
+    documents read to a function when the cursor is exhausted, raises an exception or is closed.
+    The exception is reported with them.
+    """
+    def __init__(self, cursor, report: typing.Callable[[float, int, typing.Optional[BaseException]], None]):
+        """ Constructor """
+        self.cursor = cursor
+        self.report = report
+
+        self.duration = 0.0
+        self.documents = 0
+        self._reported = False
+
+    def __iter__(self):
+        """ Iterator over the documents of the cursor """
+        return self
+
+    def __next__(self) -> dict:
+        """ The next document of the cursor """
+        start = time.perf_counter()
+
+        try:
+            document = next(self.cursor)
+
+        except StopIteration:
+            self.duration += time.perf_counter() - start
+            self._report()
+            raise
+
+        except BaseException as error:
+            self.duration += time.perf_counter() - start
+            self._report(error)
+            raise
+
+        self.duration += time.perf_counter() - start
+        self.documents += 1
+        return document
+
+    def close(self):
+        """ A method that closes the cursor and reports it if it was not exhausted """
+        self.cursor.close()
+        self._report()
+
+    def _report(self, error: typing.Optional[BaseException] = None):
+        """ A method that reports the duration, the documents and the exception of the cursor once """
+        if not self._reported:
+            self._reported = True
+            self.report(self.duration, self.documents, error)
+
+
+class MongoStorage(StorageBackend):
+    """
+    ************
+    Description:
+    ************
+    *The storage backend for a MongoDB collection.*
+
+    Accepts a pymongo collection and performs every operation with a single database call.
+    The find, find_one_and_replace and find_one_and_delete operations are timed and reported
+    to an optional SlowOperationLog, which records the slow and failed ones with their query
+    plans.
+    """
+    def __init__(self, collection, slowlog=None):
+        """ Constructor """
+        self.collection = collection
+        self.slowlog = slowlog
+
+    def insert(self, document: dict) -> int:
+        """ A method that inserts a document and returns its ID. Raises a DuplicateDocumentError
+        if a document with the same ID exists. """
+        try:
+            insert_result = self.collection.insert_one(document)
+
+        except DuplicateKeyError as error:
+            raise DuplicateDocumentError(error)
+
+        if not insert_result.acknowledged:
+            raise StorageError("insertion not acknowledged")
+
+        return insert_result.inserted_id
+
+    def insert_many(self, documents: typing.List[dict]) -> typing.Dict[int, str]:
+        """ A method that inserts many documents with a single unordered insert. Returns a dict
+        of the position of every failed document in the list to its error. """
+        try:
+            self.collection.insert_many(documents, ordered=False)
+
+        except BulkWriteError as error:
+            return {write_error['index']: write_error.get('errmsg', "unknown error")
+                    for write_error in error.details.get('writeErrors', [])}
+
+        return {}
+
+    def find_one(self, audiotype: str, audioID: int, projection: dict = None) -> typing.Optional[dict]:
+        """ A method that returns the document for a type and ID or None if it does not exist. """
+        search = {"type": audiotype, "_id": audioID}
+        return self._timed("find", search, lambda: self.collection.find_one(search, projection))
+
+    def find_many(self, audiotype: str, audioIDs: typing.List[int], projection: dict = None) -> typing.List[dict]:
+        """ A method that returns the documents for a type and a list of IDs with a single $in query. """
+        search = {"type": audiotype, "_id": {"$in": audioIDs}}
+        return self._timed("find", search, lambda: list(self.collection.find(search, projection)))
+
+    def find_by_type(self, audiotype: str, projection: dict = None,
+                     after: int = None, limit: int = None) -> typing.Iterator[dict]:
+        """ A method that returns a cursor over the documents of a type. Pages are read with a
+        keyset query on the (type, _id) index. """
+        search = {"type": audiotype}
+
+        if after is None and limit is None:
+            return self._timedCursor(search, self.collection.find(search, projection))
+
+        if after is not None:
+            search["_id"] = {"$gt": after}
+
+        cursor = self.collection.find(search, projection).sort("_id", ASCENDING)
+
+        if limit is not None:
+            cursor = cursor.limit(limit)
+
+        return self._timedCursor(search, cursor, sort={"_id": ASCENDING}, limit=limit)
+
+    def replace(self, audiotype: str, audioID: int, document: dict) -> typing.Optional[dict]:
+        """ A method that replaces the document for a type and ID with a single find_one_and_replace. """
+        search = {"type": audiotype, "_id": audioID}
+        return self._timed("find_one_and_replace", search,
+                           lambda: self.collection.find_one_and_replace(search, document))
+
+    def update(self, audiotype: str, audioID: int, fields: dict) -> bool:
+        """ A method that sets the given fields of the document for a type and ID with a single update_one. """
+        update_result = self.collection.update_one({"type": audiotype, "_id": audioID}, {"$set": fields})
+        return update_result.matched_count > 0
+
+    def delete(self, audiotype: str, audioID: int) -> typing.Optional[dict]:
+        """ A method that deletes the document for a type and ID with a single find_one_and_delete. """
+        search = {"type": audiotype, "_id": audioID}
+        return self._timed("find_one_and_delete", search, lambda: self.collection.find_one_and_delete(search))
+
+    def create_index(self, name: str, keys: typing.List[typing.Tuple[str, int]]):
+        """ A method that ensures an index exists on the collection. """
+        try:
+            self.collection.create_index(keys, name=name)
+
+        except ServerSelectionTimeoutError as error:
+            raise StorageUnavailableError(error)
+
+    def explain(self, search: dict, sort: dict = None, limit: int = None) -> dict:
+        """ A method that returns the query plan of a find with a filter, sort and limit from an
+        explain command at the 'queryPlanner' verbosity, which does not run the query. The find
+        and modify operations select their documents with the same plan as a find. """
+        command = {"find": self.collection.name, "filter": search}
+
+        if sort is not None:
+            command["sort"] = sort
+
+        if limit is not None:
+            command["limit"] = limit
+
+        return self.collection.database.command("explain", command, verbosity="queryPlanner")
+
+    def _timed(self, operation: str, search: dict, call: typing.Callable):
+        """ A method that performs a database call and reports its duration and the number of
+        documents it returned, or the exception it raised, to the slow operation log. """
+        if self.slowlog is None:
+            return call()
+
+        result, error = None, None
+        start = time.perf_counter()
+
+        try:
+            result = call()
+            return result
+
+        except BaseException as exception:
+            error = exception
+            raise
+
+        finally:
+            duration = time.perf_counter() - start
+            documents = len(result) if isinstance(result, list) else int(result is not None)
+            self.slowlog.observe(operation, search, duration, documents, lambda: self.explain(search), error)
+
+    def _timedCursor(self, search: dict, cursor, sort: dict = None, limit: int = None):
+        """ A method that wraps a find cursor to report the time spent reading it to the slow
+        operation log. """
+        if self.slowlog is None:
+            return cursor
+
+        def report(duration: float, documents: int, error: typing.Optional[BaseException]):
+            self.slowlog.observe("find", search, duration, documents,
+                                 lambda: self.explain(search, sort, limit), error)
+
+        return TimedCursor(cursor, report)
+
+
+class MemoryStorage(StorageBackend):
+    """
+    ************
+    Description:
+    ************
+    *The storage backend that keeps all documents in memory.*
+
+    Documents are stored in a hash index keyed by their (type, _id) pair. Every type also has
+    an ordered index of its IDs, which serves pages in ID order with a binary search. Documents
+    are copied when they are stored and returned, so callers cannot modify stored documents.
+    All operations are atomic with respect to each other.
+
+    The backend needs no database process and is used to run the server and its tests without
+    a MongoDB server and to measure the server apart from database latency.
+    """
+    def __init__(self):
+        """ Constructor """
+        self._documents = {}
+        self._ordered = {}
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        """ Number of stored documents """
+        return len(self._documents)
+
+    def insert(self, document: dict) -> int:
+        """ A method that inserts a document and returns its ID. Raises a DuplicateDocumentError
+        if a document with the same ID exists. """
+        with self._lock:
+            audioID = document['_id']
+
+            if self._exists(audioID):
+                raise DuplicateDocumentError(f"duplicate key error - _id: {audioID}")
+
+            self._documents[(document['type'], audioID)] = self._copy(document)
+            bisect.insort(self._ordered.setdefault(document['type'], []), audioID)
+
+            return audioID
+
+    def insert_many(self, documents: typing.List[dict]) -> typing.Dict[int, str]:
+        """ A method that inserts many documents. Returns a dict of the position of every failed
+        document in the list to its error. """
+        failures = {}
+
+        with self._lock:
+            for position, document in enumerate(documents):
+                try:
+                    self.insert(document)
+
+                except DuplicateDocumentError as error:
+                    failures[position] = f"{error}"
+
+        return failures
+
+    def find_one(self, audiotype: str, audioID: int, projection: dict = None) -> typing.Optional[dict]:
+        """ A method that returns the document for a type and ID from the hash index. """
+        with self._lock:
+            document = self._documents.get((audiotype, audioID))
+            return self._copy(document, projection) if document is not None else None
+
+    def find_many(self, audiotype: str, audioIDs: typing.List[int], projection: dict = None) -> typing.List[dict]:
+        """ A method that returns the documents for a type and a list of IDs from the hash index. """
+        with self._lock:
+            documents = (self._documents.get((audiotype, audioID)) for audioID in audioIDs)
+            return [self._copy(document, projection) for document in documents if document is not None]
+
+    def find_by_type(self, audiotype: str, projection: dict = None,
+                     after: int = None, limit: int = None) -> typing.Iterator[dict]:
+        """ A method that returns an iterator over the documents of a type in ascending order of
+        ID. The documents are read when the method is called, so later writes are not seen. """
+        with self._lock:
+            ordered = self._ordered.get(audiotype, [])
+            start = bisect.bisect_right(ordered, after) if after is not None else 0
+            stop = start + limit if limit is not None else len(ordered)
+
+            documents = [self._copy(self._documents[(audiotype, audioID)], projection)
+                         for audioID in ordered[start:stop]]
+
+        return (document for document in documents)
+
+    def replace(self, audiotype: str, audioID: int, document: dict) -> typing.Optional[dict]:
+        """ A method that replaces the document for a type and ID. """
+        with self._lock:
+            previous = self._documents.get((audiotype, audioID))
+
+            if previous is None:
+                return None
+
+            if document.get('type', audiotype) != audiotype or document.get('_id', audioID) != audioID:
+                raise StorageError("the 'type' and '_id' of a document cannot be replaced")
+
+            self._documents[(audiotype, audioID)] = self._copy(document)
+            return previous
+
+    def update(self, audiotype: str, audioID: int, fields: dict) -> bool:
+        """ A method that sets the given fields of the document for a type and ID. """
+        with self._lock:
+            document = self._documents.get((audiotype, audioID))
+
+            if document is None:
+                return False
+
+            self._documents[(audiotype, audioID)] = self._copy({**document, **fields})
+            return True
+
+    def delete(self, audiotype: str, audioID: int) -> typing.Optional[dict]:
+        """ A method that deletes the document for a type and ID. """
+        with self._lock:
+            document = self._documents.pop((audiotype, audioID), None)
+
+            if document is not None:
+                ordered = self._ordered[audiotype]
+                del ordered[bisect.bisect_left(ordered, audioID)]
+
+            return document
+
+    def create_index(self, name: str, keys: typing.List[typing.Tuple[str, int]]):
+        """ A method that ensures an index exists. The hash and ordered indexes of the backend
+        cover every query, so this does nothing. """
+        pass
+
+    def _exists(self, audioID: int) -> bool:
+        """ A method that checks if a document exists for an ID of any type. """
+        return any((audiotype, audioID) in self._documents for audiotype in self._ordered)
+
+    @staticmethod
+    def _copy(document: dict, projection: dict = None) -> dict:
+        """ A staticmethod that copies a document, trimmed to the fields of a projection. """
+        return {key: list(value) if isinstance(value, list) else value
+                for key, value in document.items()
+                if projection is None or key == '_id' or key in projection}
+
+
+def createStorage(kind: str, uri: str = None, slowlog=None, poolsize: int = None) -> StorageBackend:
+    """ A function that creates a storage backend, either 'mongo' for a MongoDB server at the
+    given URI or 'memory' for the in-memory backend. Raises a ValueError for other kinds. The
+    slow operations of a MongoDB server are reported to the optional SlowOperationLog and its
+    client keeps at most 'poolsize' connections, the pymongo default if it is not given. """
+    if kind == "mongo":
+        cluster = MongoClient(uri) if poolsize is None else MongoClient(uri, maxPoolSize=poolsize)
+        return MongoStorage(cluster["AudioServer"]["audiofiles"], slowlog)
+
+    if kind == "memory":
+        return MemoryStorage()
+
+    raise ValueError(f"'{kind}' is not a supported storage backend")
@@ -0,0 +1,11 @@
+"""
+This package contains a module loadgen.py that drives the AudioServer
+with a mix of concurrent requests, through the Flask test client or over
+HTTP, and reports the throughput and latency of every operation, a module
+micro.py that contains the microbenchmarks of the audiofiles package and
+compares them with a baseline, and a module __main__.py that runs a load
+test from the command line.
+"""
+
+from benchmarks.loadgen import LoadGenerator, ClientTransport, HTTPTransport
+from benchmarks.loadgen import OPERATIONS, parseMix, percentile
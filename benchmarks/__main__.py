@@ -0,0 +1,183 @@
+"""
+A command line interface that runs a load test against the AudioServer and prints
+its report as JSON. The server is either driven in process through the Flask test
+client, over HTTP at a URL or over HTTP on a local gunicorn server started for the run.
+
+    python -m benchmarks --requests 5000 --concurrency 16
+    python -m benchmarks --storage mongo --gunicorn "--workers 2 --worker-class gthread --threads 4"
+    python -m benchmarks --target http://localhost:8080 --mix get-one=9,update=1
+
+Author: Manish Meganathan
+License: MIT License
+"""
+import os
+import sys
+import json
+import time
+import shlex
+import argparse
+import subprocess
+import http.client
+import contextlib
+
+from benchmarks.loadgen import LoadGenerator, ClientTransport, HTTPTransport, OPERATIONS, parseMix
+
+# The directory of the audioserver module
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def gunicornWorkers(arguments: str) -> int:
+    """ A function that returns the number of worker processes of a gunicorn server started with
+    arguments. gunicorn loads gunicorn.conf.py from the directory of the server by default, so the
+    number defaults to the WORKERS environment variable of that configuration or else 1. Raises a
+    ValueError if the number of workers is not an int. """
+    workers = os.environ.get('WORKERS', 1)
+    tokens = shlex.split(arguments)
+
+    for index, token in enumerate(tokens):
+        if token in ("-w", "--workers") and index + 1 < len(tokens):
+            workers = tokens[index + 1]
+
+        elif token.startswith("--workers="):
+            workers = token.partition("=")[2]
+
+        elif token.startswith("-w") and not token.startswith("--") and len(token) > 2:
+            workers = token[2:]
+
+    return int(workers)
+
+
+def parseArguments(arguments=None) -> argparse.Namespace:
+    """ A function that parses the command line arguments of a load test """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Load test the AudioServer.")
+
+    parser.add_argument("--target", default="client",
+                        help="'client' for the in process test client (default) or the URL of a running server")
+    parser.add_argument("--gunicorn", metavar="ARGS",
+                        help="start a local gunicorn server with these arguments and load test it over HTTP")
+    parser.add_argument("--port", type=int, default=8099, help="the port of the local gunicorn server")
+    parser.add_argument("--storage", default="memory", choices=["memory", "mongo"],
+                        help="the storage backend of the test client or local gunicorn server")
+    parser.add_argument("--mix", type=parseMix, default=dict(OPERATIONS),
+                        help=f"the weights of the operations, defaults to "
+                             f"{','.join(f'{op}={weight}' for op, weight in OPERATIONS.items())}")
+    parser.add_argument("--requests", type=int, default=2000, help="the number of requests to send")
+    parser.add_argument("--concurrency", type=int, default=8, help="the number of threads sending requests")
+    parser.add_argument("--files", type=int, default=500, help="the number of files created before the run")
+    parser.add_argument("--pagesize", type=int, default=100, help="the number of files read by get-all")
+    parser.add_argument("--seed", type=int, default=0, help="the seed of the random operations")
+    parser.add_argument("--output", help="a file to write the report to, in addition to stdout")
+
+    options = parser.parse_args(arguments)
+
+    if options.gunicorn is not None and options.storage == "memory":
+        try:
+            workers = gunicornWorkers(options.gunicorn)
+
+        except ValueError:
+            parser.error("--gunicorn must have an int number of workers")
+
+        # Every worker process would have its own in-memory files, so the requests for a file
+        # would fail on the workers that did not create it
+        if workers > 1:
+            parser.error(f"--storage memory cannot be used with {workers} gunicorn workers, "
+                         f"since every worker has its own files - use --storage mongo")
+
+    return options
+
+
+def gitCommit() -> str:
+    """ A function that returns the current git commit of the repository or None """
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+@contextlib.contextmanager
+def gunicornServer(arguments: str, port: int, storage: str, timeout: float = 30.0):
+    """ A context manager that starts a local gunicorn server for the audioserver app, waits
+    until it serves requests and stops it on exit. Yields the URL of the server. """
+    environment = dict(os.environ, AUDIOSERVERSTORAGE=storage)
+    # gunicorn is run through its entry point, since 'python -m gunicorn' needs gunicorn 20.1
+    command = [sys.executable, "-c", "from gunicorn.app.wsgiapp import run; run()",
+               "--bind", f"127.0.0.1:{port}", *shlex.split(arguments), "audioserver:app"]
+    process = subprocess.Popen(command, cwd=ROOT, env=environment)
+
+    try:
+        deadline = time.monotonic() + timeout
+
+        while True:
+            if process.poll() is not None:
+                raise RuntimeError(f"gunicorn exited with status {process.returncode}")
+
+            try:
+                connection = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+                connection.request("GET", "/metrics")
+                connection.getresponse().read()
+                connection.close()
+                break
+
+            except OSError:
+                if time.monotonic() > deadline:
+                    raise RuntimeError(f"gunicorn did not serve requests within {timeout} seconds")
+
+                time.sleep(0.2)
+
+        yield f"http://127.0.0.1:{port}"
+
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def runLoadTest(options: argparse.Namespace, transport) -> dict:
+    """ A function that seeds the server, runs a load test and returns its report """
+    generator = LoadGenerator(transport, options.mix, options.concurrency, options.pagesize, options.seed)
+
+    try:
+        generator.seed(options.files)
+        return generator.run(options.requests)
+
+    finally:
+        transport.close()
+
+
+def main(arguments=None) -> dict:
+    """ A function that runs a load test from command line arguments and prints its report """
+    options = parseArguments(arguments)
+
+    if options.gunicorn is not None:
+        target = f"gunicorn {options.gunicorn}"
+
+        with gunicornServer(options.gunicorn, options.port, options.storage) as url:
+            report = runLoadTest(options, HTTPTransport(url))
+
+    elif options.target == "client":
+        target = "client"
+
+        # The storage backend of the app is created from the environment when it is connected
+        os.environ['AUDIOSERVERSTORAGE'] = options.storage
+        from audioserver import app
+
+        report = runLoadTest(options, ClientTransport(app))
+
+    else:
+        target = options.target
+        report = runLoadTest(options, HTTPTransport(options.target))
+
+    report = {"target": target, "commit": gitCommit(), **report}
+    text = json.dumps(report, indent=4)
+
+    if options.output:
+        with open(options.output, "w") as file:
+            file.write(text + "\n")
+
+    print(text)
+    return report
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,345 @@
+"""
+This module contains the LoadGenerator class that drives the AudioServer with
+a configurable mix of concurrent requests and reports their latency.
+
+Author: Manish Meganathan
+License: MIT License
+"""
+import json
+import math
+import time
+import random
+import typing
+import threading
+import http.client
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+
+# The operations of a load test and their default share of the requests
+OPERATIONS = {
+    "create": 1,
+    "get-one": 6,
+    "get-all": 1,
+    "update": 1,
+    "delete": 1
+}
+
+AUDIOTYPES = ["Song", "Podcast", "Audiobook"]
+
+
+def parseMix(mix: str) -> typing.Dict[str, float]:
+    """ A function that parses a mix of operations from a comma separated str of 'operation=weight'
+    pairs, for example 'create=1,get-one=8,update=1'. Raises a ValueError if an operation is not
+    supported or a weight is not a non negative number. """
+    weights = {}
+
+    for pair in mix.split(','):
+        operation, _, weight = pair.partition('=')
+        operation = operation.strip()
+
+        if operation not in OPERATIONS:
+            raise ValueError(f"'{operation}' is not an operation, must be one of {', '.join(OPERATIONS)}")
+
+        weights[operation] = float(weight) if weight else 1.0
+
+        if weights[operation] < 0:
+            raise ValueError(f"the weight of '{operation}' must not be negative")
+
+    if not sum(weights.values()):
+        raise ValueError("the mix must contain an operation with a positive weight")
+
+    return weights
+
+
+def percentile(latencies: typing.List[float], rank: float) -> float:
+    """ A function that returns the nearest-rank percentile of a sorted list of latencies """
+    if not latencies:
+        return 0.0
+
+    index = math.ceil(rank / 100 * len(latencies)) - 1
+    return latencies[min(max(index, 0), len(latencies) - 1)]
+
+
+def generateMetadata(audiotype: str, rng: random.Random) -> dict:
+    """ A function that generates random valid metadata for an audio file type """
+    metadata = {"name": f"bench-{audiotype.lower()}-{rng.randrange(10 ** 9)}", "duration": rng.randrange(1, 3600)}
+
+    if audiotype == "Podcast":
+        metadata["host"] = f"host-{rng.randrange(100)}"
+        metadata["participants"] = [f"guest-{rng.randrange(1000)}" for _ in range(rng.randrange(4))]
+
+    if audiotype == "Audiobook":
+        metadata["author"] = f"author-{rng.randrange(100)}"
+        metadata["narrator"] = f"narrator-{rng.randrange(100)}"
+
+    return metadata
+
+
+class ClientTransport:
+    """
+    ************
+    Description:
+    ************
+    *A transport that sends requests to a Flask app in process through its test client.*
+
+    Every thread uses its own test client. The latency includes the app and its storage
+    backend but no network or WSGI server.
+    """
+    def __init__(self, app):
+        """ Constructor """
+        self.app = app
+        self._local = threading.local()
+
+    def request(self, method: str, path: str, body: typing.Any = None) -> typing.Tuple[int, typing.Any]:
+        """ A method that sends a request and returns its status code and JSON response """
+        client = getattr(self._local, "client", None)
+
+        if client is None:
+            client = self._local.client = self.app.test_client()
+
+        response = client.open(path, method=method, json=body)
+        return response.status_code, response.get_json(silent=True)
+
+    def close(self):
+        """ A method that releases the transport """
+        pass
+
+
+class HTTPTransport:
+    """
+    ************
+    Description:
+    ************
+    *A transport that sends requests to a running server over HTTP.*
+
+    Every thread keeps its own persistent connection, which is opened again after an error.
+    """
+    def __init__(self, url: str, timeout: float = 30.0):
+        """ Constructor """
+        parsed = urllib.parse.urlsplit(url)
+
+        self.host = parsed.hostname or "127.0.0.1"
+        self.port = parsed.port or 80
+        self.prefix = parsed.path.rstrip('/')
+        self.timeout = timeout
+
+        self._local = threading.local()
+        self._connections = []
+        self._lock = threading.Lock()
+
+    def request(self, method: str, path: str, body: typing.Any = None) -> typing.Tuple[int, typing.Any]:
+        """ A method that sends a request and returns its status code and JSON response """
+        connection = getattr(self._local, "connection", None)
+
+        if connection is None:
+            connection = self._local.connection = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+            with self._lock:
+                self._connections.append(connection)
+
+        headers = {"Content-Type": "application/json"} if body is not None else {}
+        payload = json.dumps(body) if body is not None else None
+
+        try:
+            connection.request(method, self.prefix + path, body=payload, headers=headers)
+            response = connection.getresponse()
+            data = response.read()
+
+        except (http.client.HTTPException, OSError):
+            connection.close()
+            self._local.connection = None
+            raise
+
+        try:
+            return response.status, json.loads(data)
+
+        except ValueError:
+            return response.status, None
+
+    def close(self):
+        """ A method that closes the connections of all threads """
+        with self._lock:
+            for connection in self._connections:
+                connection.close()
+
+            self._connections.clear()
+
+
+class LoadGenerator:
+    """
+    ************
+    Description:
+    ************
+    *A load generator that drives the AudioServer with a mix of concurrent requests.*
+
+    The operations of a run are drawn from the mix with a seeded random generator, so runs with
+    the same settings send the same sequence of operations. They are sent by a pool of threads
+    and the latency of every request is measured with a monotonic clock.
+
+    The IDs of the audio files created by the seed and create operations are shared by the
+    threads. The get-one and update operations pick a random known ID and the delete operation
+    removes one, so the server is measured on files that exist. The get-all operation reads a
+    page of files of a random type. A get-one, update or delete of a file that is not found is
+    counted as an error, since the server answers some of them with a 200 status code. A get-one,
+    update or delete is skipped without a request while no ID is known, and is only counted as
+    skipped, so that its latency and errors do not measure the load generator.
+
+    *****************
+    Class Attributes:
+    *****************
+    - ``transport``:    A ClientTransport or HTTPTransport that sends the requests.
+    - ``mix``:  A dict of the operations to their share of the requests.
+    - ``concurrency``:  An int that is the number of threads sending requests.
+    - ``pagesize``: An int that is the number of files read by a get-all operation.
+
+    **************
+    Class Methods:
+    **************
+    - ``seed``: A method that creates audio files for the operations to work on.
+    - ``run``:  A method that sends a number of requests and returns a report of their latency.
+    """
+    def __init__(self, transport, mix: typing.Dict[str, float] = None, concurrency: int = 8,
+                 pagesize: int = 100, seed: int = 0):
+        """ Constructor """
+        self.transport = transport
+        self.mix = mix or dict(OPERATIONS)
+        self.concurrency = concurrency
+        self.pagesize = pagesize
+
+        self._rng = random.Random(seed)
+        self._ids = []
+        self._lock = threading.Lock()
+
+    def seed(self, count: int):
+        """ A method that creates 'count' audio files with batch create requests. Raises a
+        RuntimeError if the server does not create them. """
+        for start in range(0, count, 1000):
+            batch = [self._createRequest(self._rng) for _ in range(min(1000, count - start))]
+            status, data = self.transport.request("POST", "/create/batch", batch)
+
+            if status != 200:
+                raise RuntimeError(f"seeding failed with status {status} - {data}")
+
+            with self._lock:
+                self._ids += [(item['audioFileType'], result['document'])
+                              for item, result in zip(batch, data['results']) if result['status'] == 200]
+
+    def run(self, requests: int) -> dict:
+        """ A method that sends 'requests' requests of the mix from the pool of threads and
+        returns a report with the throughput and latency percentiles of every operation. """
+        operations = list(self.mix)
+        weights = [self.mix[operation] for operation in operations]
+        plan = self._rng.choices(operations, weights, k=requests)
+
+        # Every request gets its own random generator, so that its parameters do not depend on
+        # the order in which the threads run
+        seeds = [self._rng.randrange(2 ** 32) for _ in range(requests)]
+        latencies = {operation: [] for operation in operations}
+        errors = {operation: 0 for operation in operations}
+        skipped = {operation: 0 for operation in operations}
+
+        def work(index: int):
+            operation = plan[index]
+            start = time.perf_counter()
+
+            try:
+                success = self._perform(operation, random.Random(seeds[index]))
+
+            except (http.client.HTTPException, OSError):
+                success = False
+
+            elapsed = time.perf_counter() - start
+
+            with self._lock:
+                if success is None:
+                    skipped[operation] += 1
+                    return
+
+                latencies[operation].append(elapsed)
+
+                if not success:
+                    errors[operation] += 1
+
+        start = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            list(executor.map(work, range(requests)))
+
+        duration = time.perf_counter() - start
+        return self._report(duration, latencies, errors, skipped)
+
+    def _perform(self, operation: str, rng: random.Random) -> typing.Optional[bool]:
+        """ A method that sends the request of an operation and returns whether it succeeded,
+        or None if the operation was skipped because no ID is known. """
+        if operation == "create":
+            body = self._createRequest(rng)
+            status, data = self.transport.request("POST", "/create", body)
+
+            if status == 200:
+                with self._lock:
+                    self._ids.append((body['audioFileType'], data['document']))
+
+            return status == 200
+
+        if operation == "get-all":
+            status, _ = self.transport.request("GET", f"/get/{rng.choice(AUDIOTYPES)}?limit={self.pagesize}")
+            return status == 200
+
+        with self._lock:
+            if not self._ids:
+                return None
+
+            if operation == "delete":
+                audiotype, audioID = self._ids.pop(rng.randrange(len(self._ids)))
+            else:
+                audiotype, audioID = self._ids[rng.randrange(len(self._ids))]
+
+        if operation == "get-one":
+            status, data = self.transport.request("GET", f"/get/{audiotype}/{audioID}")
+            return status == 200 and bool(data) and data.get('matches', 0) > 0
+
+        if operation == "update":
+            body = {"audioFileType": audiotype, "audioFileMetadata": {"duration": rng.randrange(1, 3600)}}
+            status, data = self.transport.request("PATCH", f"/update/{audiotype}/{audioID}", body)
+
+        else:
+            status, data = self.transport.request("GET", f"/delete/{audiotype}/{audioID}")
+
+        # An update or delete only returns the ID of the 'document' if a file was found
+        return status == 200 and bool(data) and data.get('document') == audioID
+
+    @staticmethod
+    def _createRequest(rng: random.Random) -> dict:
+        """ A staticmethod that generates a create request for a random audio file type """
+        audiotype = rng.choice(AUDIOTYPES)
+        return {"audioFileType": audiotype, "audioFileMetadata": generateMetadata(audiotype, rng)}
+
+    def _report(self, duration: float, latencies: dict, errors: dict, skipped: dict) -> dict:
+        """ A method that summarises the latencies of a run into a report dict """
+        operations = {}
+        requests = sum(len(values) for values in latencies.values())
+
+        for operation, values in latencies.items():
+            values.sort()
+
+            operations[operation] = {
+                "requests": len(values),
+                "errors": errors[operation],
+                "skipped": skipped[operation],
+                "throughput": round(len(values) / duration, 2) if duration else 0.0,
+                "mean_ms": round(sum(values) / len(values) * 1000, 3) if values else 0.0,
+                "p50_ms": round(percentile(values, 50) * 1000, 3),
+                "p95_ms": round(percentile(values, 95) * 1000, 3),
+                "p99_ms": round(percentile(values, 99) * 1000, 3),
+                "max_ms": round(values[-1] * 1000, 3) if values else 0.0
+            }
+
+        return {
+            "requests": requests,
+            "errors": sum(errors.values()),
+            "skipped": sum(skipped.values()),
+            "concurrency": self.concurrency,
+            "duration_s": round(duration, 3),
+            "throughput": round(requests / duration, 2) if duration else 0.0,
+            "mix": self.mix,
+            "operations": operations
+        }
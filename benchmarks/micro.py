@@ -0,0 +1,289 @@
+"""
+This module contains the microbenchmarks of the audiofiles package and the
+comparison of their results against a baseline file. Results are only compared
+with a baseline that was measured with the same minor version of Python.
+
+    python -m benchmarks.micro
+    python -m benchmarks.micro --update-baseline
+
+Author: Manish Meganathan
+License: MIT License
+"""
+import gc
+import os
+import sys
+import json
+import timeit
+import statistics
+import typing
+import argparse
+import subprocess
+import tracemalloc
+
+from audiofiles import Audio, Song, Podcast, Audiobook
+
+# The directory of the benchmarks package
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The baseline results of the microbenchmarks that are kept in the repository
+BASELINE = os.path.join(ROOT, "benchmarks", "baseline.json")
+
+# The default percentage by which a benchmark may regress before the gate fails
+DEFAULT_TOLERANCE = 20.0
+
+SONG = {"name": "Lose Yourself", "duration": 326}
+PODCAST = {"name": "Episode 12", "duration": 3600, "host": "host1", "participants": ["guest1", "guest2", "guest3"]}
+AUDIOBOOK = {"name": "Dune", "duration": 75600, "author": "Frank Herbert", "narrator": "Scott Brick",
+             "uploadtime": "2021-01-01T00:00:00", "_id": 5}
+
+
+def validator(audioclass: type, metadata: dict) -> typing.Callable[[], None]:
+    """ A function that returns a benchmark of the compiled schema validator of a class on a
+    complete metadata dict, so that no '_id' or 'uploadtime' is generated """
+    audiofile = object.__new__(audioclass)
+    metadata = {"_id": 5, "uploadtime": "2021-01-01T00:00:00", **metadata}
+
+    return lambda: audioclass._validate(audiofile, metadata)
+
+
+def strModified() -> typing.Callable[[], str]:
+    """ A function that returns a benchmark of the str of a Song that was modified since it was
+    last serialized, so that its cached JSON cannot be used """
+    song = Song(dict(SONG))
+
+    def benchmark() -> str:
+        song.duration ^= 1
+        return str(song)
+
+    return benchmark
+
+
+def strCached() -> typing.Callable[[], str]:
+    """ A function that returns a benchmark of the str of an unmodified Song """
+    song = Song(dict(SONG))
+    str(song)
+    return song.__str__
+
+
+# The microbenchmarks by name, as functions that return the benchmarked function
+BENCHMARKS = {
+    "Song": lambda: lambda: Song(dict(SONG)),
+    "Podcast": lambda: lambda: Podcast(dict(PODCAST)),
+    "Audiobook": lambda: lambda: Audiobook(dict(AUDIOBOOK)),
+    "validate_string": lambda: lambda: Audio.validate_string(SONG["name"]),
+    "validate_duration": lambda: lambda: Audio.validate_duration(SONG["duration"]),
+    "validate_participants": lambda: lambda: Podcast.validate_participants(PODCAST["participants"]),
+    "validate_song": lambda: validator(Song, SONG),
+    "validate_podcast": lambda: validator(Podcast, PODCAST),
+    "validate_audiobook": lambda: validator(Audiobook, AUDIOBOOK),
+    "str": strModified,
+    "str_cached": strCached
+}
+
+
+def measureSpeed(function: typing.Callable, repeat: int = 7, target: float = 0.05) -> float:
+    """ A function that returns the operations per second of a function from the fastest of
+    'repeat' timings, each of which runs for about 'target' seconds """
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    number = max(1, int(number * target / 0.2))
+
+    return number / min(timer.repeat(repeat=repeat, number=number))
+
+
+def measureMemory(function: typing.Callable, count: int = 1000) -> typing.Tuple[float, float]:
+    """ A function that returns the memory blocks and bytes allocated per call of a function and
+    kept by its result. The results of 'count' calls are kept alive while they are measured. """
+    function()
+    gc.collect()
+    gc.disable()
+
+    try:
+        results = [None] * count
+        blocks = sys.getallocatedblocks()
+
+        for index in range(count):
+            results[index] = function()
+
+        blocks = sys.getallocatedblocks() - blocks
+        del results
+
+        results = [None] * count
+        tracemalloc.start()
+
+        try:
+            before, _ = tracemalloc.get_traced_memory()
+
+            for index in range(count):
+                results[index] = function()
+
+            after, _ = tracemalloc.get_traced_memory()
+
+        finally:
+            tracemalloc.stop()
+
+    finally:
+        gc.enable()
+
+    return blocks / count, (after - before) / count
+
+
+def runBenchmark(name: str) -> dict:
+    """ A function that runs a microbenchmark and returns its operations per second and the
+    memory blocks ('allocations') and bytes allocated per operation and kept by its result """
+    function = BENCHMARKS[name]()
+    allocations, size = measureMemory(function)
+
+    return {
+        "ops_per_sec": round(measureSpeed(function)),
+        "allocations": round(allocations, 2),
+        "bytes": round(size, 1)
+    }
+
+
+def runIsolated(name: str) -> dict:
+    """ A function that runs a microbenchmark in a new Python process and returns its result.
+    The speed of a benchmark can differ between processes by far more than between the runs
+    of a single process, so repeated runs are spread over processes. """
+    command = f"import json; from benchmarks.micro import runBenchmark; print(json.dumps(runBenchmark({name!r})))"
+    process = subprocess.run([sys.executable, "-c", command], cwd=ROOT, capture_output=True, text=True, check=True)
+    return json.loads(process.stdout.splitlines()[-1])
+
+
+def bestResult(results: typing.List[dict]) -> dict:
+    """ A function that combines the results of several runs of a benchmark into the best result,
+    with the most operations per second and the least memory """
+    return {
+        "ops_per_sec": max(result["ops_per_sec"] for result in results),
+        "allocations": min(result["allocations"] for result in results),
+        "bytes": min(result["bytes"] for result in results)
+    }
+
+
+def medianResult(results: typing.List[dict]) -> dict:
+    """ A function that combines the results of several runs of a benchmark into their median """
+    return {metric: statistics.median(result[metric] for result in results) for metric in results[0]}
+
+
+def runBenchmarks(names: typing.Iterable[str] = None, attempts: int = 1) -> typing.Dict[str, dict]:
+    """ A function that runs microbenchmarks, all of them by default, and returns the median
+    result of 'attempts' runs in separate processes by name. A baseline of median results can
+    be reached by the best result of a few runs on the same machine even when some of the runs
+    are slowed down. """
+    return {name: medianResult([runIsolated(name) for _ in range(attempts)]) for name in (names or BENCHMARKS)}
+
+
+def checkBenchmark(name: str, baseline: dict, tolerance: float = DEFAULT_TOLERANCE,
+                   attempts: int = 3) -> typing.Tuple[dict, typing.List[str]]:
+    """ A function that runs a benchmark in separate processes until its best result does not
+    regress from its baseline, at most 'attempts' times, so that a single slow run on a busy
+    machine is not reported. Returns the best result and its regressions. """
+    results = []
+
+    while True:
+        results.append(runIsolated(name))
+        result = bestResult(results)
+        regressions = compareResults(baseline, result, tolerance)
+
+        if not regressions or len(results) == attempts:
+            return result, regressions
+
+
+def loadBaseline(path: str = BASELINE) -> typing.Dict[str, dict]:
+    """ A function that reads the baseline results from a file """
+    with open(path) as file:
+        return json.load(file)["benchmarks"]
+
+
+def saveBaseline(results: typing.Dict[str, dict], path: str = BASELINE):
+    """ A function that writes results as the baseline file, with the Python version they were measured with """
+    with open(path, "w") as file:
+        json.dump({"python": pythonVersion(), "benchmarks": results}, file, indent=4)
+        file.write("\n")
+
+
+def pythonVersion() -> str:
+    """ A function that returns the version of the running Python """
+    return sys.version.split()[0]
+
+
+def baselineVersion(path: str = BASELINE) -> str:
+    """ A function that returns the Python version that the baseline file was measured with """
+    with open(path) as file:
+        return json.load(file)["python"]
+
+
+def sameMinorVersion(version: str, other: str) -> bool:
+    """ A function that returns whether two Python versions have the same major and minor version.
+    Timings of different minor versions are not comparable, since the interpreter changes. """
+    return version.split(".")[:2] == other.split(".")[:2]
+
+
+def compareResults(baseline: dict, result: dict, tolerance: float = DEFAULT_TOLERANCE) -> typing.List[str]:
+    """ A function that compares the result of a benchmark with its baseline and returns a list of
+    the regressions of more than 'tolerance' percent. Fewer operations per second and more
+    allocations or bytes than the baseline are regressions. Memory is allowed to grow by half
+    a block and 16 bytes over the tolerance, so that results near zero are not reported. """
+    regressions = []
+    factor = tolerance / 100
+
+    if result["ops_per_sec"] < baseline["ops_per_sec"] * (1 - factor):
+        change = 100 * (1 - result["ops_per_sec"] / baseline["ops_per_sec"])
+        regressions.append(f"ops_per_sec {result['ops_per_sec']} is {change:.1f}% below "
+                           f"the baseline {baseline['ops_per_sec']}")
+
+    for metric, slack in (("allocations", 0.5), ("bytes", 16)):
+        if result[metric] > baseline[metric] * (1 + factor) + slack:
+            regressions.append(f"{metric} {result[metric]} is above the baseline {baseline[metric]}")
+
+    return regressions
+
+
+def main(arguments=None):
+    """ A function that runs the microbenchmarks and prints their results as JSON, compared with the baseline """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.micro", description="Benchmark the audiofiles package.")
+    parser.add_argument("names", nargs="*", help=f"the benchmarks to run, all by default - {', '.join(BENCHMARKS)}")
+    parser.add_argument("--baseline", default=BASELINE, help="the baseline file")
+    parser.add_argument("--update-baseline", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="the percentage by which a benchmark may regress")
+    options = parser.parse_args(arguments)
+
+    for name in options.names:
+        if name not in BENCHMARKS:
+            parser.error(f"'{name}' is not a benchmark")
+
+    compared = os.path.exists(options.baseline) and sameMinorVersion(baselineVersion(options.baseline),
+                                                                      pythonVersion())
+
+    if options.update_baseline:
+        if options.names and not compared:
+            parser.error("the baseline was measured with another Python version, update all the benchmarks")
+
+        results = runBenchmarks(options.names, attempts=5)
+        saveBaseline({**(loadBaseline(options.baseline) if options.names else {}), **results}, options.baseline)
+        print(json.dumps(results, indent=4))
+        return 0
+
+    if os.path.exists(options.baseline) and not compared:
+        print(f"the baseline was measured with Python {baselineVersion(options.baseline)}, the results "
+              f"of Python {pythonVersion()} are not compared with it", file=sys.stderr)
+
+    baseline = loadBaseline(options.baseline) if compared else {}
+    report, failed = {}, False
+
+    for name in options.names or BENCHMARKS:
+        if name in baseline:
+            result, regressions = checkBenchmark(name, baseline[name], options.tolerance)
+        else:
+            result, regressions = runIsolated(name), []
+
+        report[name] = {**result, "baseline": baseline.get(name), "regressions": regressions}
+        failed = failed or bool(regressions)
+
+    print(json.dumps(report, indent=4))
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,150 @@
+"""
+This module contains the DocumentCache class, an in-process read-through cache
+for audio file documents that is used by the AudioServer resources.
+
+Author: Manish Meganathan
+License: MIT License
+"""
+import time
+import typing
+import threading
+from collections import OrderedDict
+
+
+class DocumentCache:
+    """
+    ************
+    Description:
+    ************
+    *A bounded, thread-safe LRU cache with a TTL for audio file documents.*
+
+    Documents are keyed by their (type, _id) pair. When the cache is full, the least recently
+    used document is evicted. Documents older than the TTL are treated as misses and dropped.
+    Only documents that were found are cached, so a newly created document is never hidden
+    by a cached miss.
+
+    A document loaded through ``fetch`` is not stored if any key was invalidated while it was
+    being loaded. This prevents a reader that raced with an update or delete from caching the
+    stale document.
+
+    *****************
+    Class Attributes:
+    *****************
+    - ``maxsize``:  An int that is the maximum number of cached documents. 0 disables the cache.
+    - ``ttl``:      A float that is the number of seconds a document stays valid for.
+    - ``hits``:     An int counter of the lookups that were served from the cache.
+    - ``misses``:   An int counter of the lookups that were not served from the cache.
+    - ``evictions``:    An int counter of the documents evicted to make space for another.
+    - ``expirations``:  An int counter of the documents dropped because their TTL had passed.
+
+    **************
+    Class Methods:
+    **************
+    - ``fetch``:    A method that returns a cached document or loads and caches it.
+    - ``get``:      A method that returns a cached document or None.
+    - ``put``:      A method that caches a document.
+    - ``invalidate``:   A method that removes a document from the cache.
+    - ``clear``:    A method that removes all documents from the cache.
+    - ``stats``:    A method that returns the counters and size of the cache as a dict.
+    """
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0, timer: typing.Callable = time.monotonic):
+        """ Constructor """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.timer = timer
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+        self._entries = OrderedDict()
+        self._invalidations = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """ Number of documents in the cache """
+        return len(self._entries)
+
+    def get(self, key: tuple) -> typing.Optional[dict]:
+        """ A method that returns the cached document for a key or None if it is not cached. """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expiry, document = entry
+
+            if expiry <= self.timer():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return document
+
+    def put(self, key: tuple, document: dict):
+        """ A method that caches a document for a key, evicting the least recently used document
+        if the cache is full. """
+        with self._lock:
+            self._store(key, document)
+
+    def fetch(self, key: tuple, loader: typing.Callable[[], typing.Optional[dict]]) -> typing.Optional[dict]:
+        """ A method that returns the cached document for a key. If the document is not cached,
+        it is loaded by calling the loader and cached if it is found. """
+        document = self.get(key)
+
+        if document is not None:
+            return document
+
+        with self._lock:
+            invalidations = self._invalidations
+
+        document = loader()
+
+        if document is not None:
+            with self._lock:
+                if invalidations == self._invalidations:
+                    self._store(key, document)
+
+        return document
+
+    def invalidate(self, key: tuple):
+        """ A method that removes the document for a key from the cache. """
+        with self._lock:
+            self._invalidations += 1
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """ A method that removes all documents from the cache. """
+        with self._lock:
+            self._invalidations += 1
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """ A method that returns the counters and the size of the cache as a dict. """
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations
+            }
+
+    def _store(self, key: tuple, document: dict):
+        """ A method that caches a document. The lock must be held by the caller. """
+        if self.maxsize <= 0:
+            return
+
+        self._entries[key] = (self.timer() + self.ttl, document)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
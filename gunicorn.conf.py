@@ -0,0 +1,74 @@
+"""
+The gunicorn configuration of the AudioServer. The app is imported once in the
+master process and shared by the forked workers, which connect to the storage
+backend after they are forked.
+
+    gunicorn --config gunicorn.conf.py audioserver:app
+
+The server is configured with the PORT, WORKERS and THREADS environment variables.
+The AUDIOSERVERWORKERID environment variable is the first ID worker number of the
+server, which should be unique for every host or container of a deployment.
+
+Author: Manish Meganathan
+License: MIT License
+"""
+import gc
+import os
+import logging
+import itertools
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 8080)}"
+workers = int(os.environ.get('WORKERS', 1))
+worker_class = "gthread"
+threads = int(os.environ.get('THREADS', 4))
+timeout = 60
+
+# Import the app in the master process, so that workers start without importing it again and
+# share the memory of the imported modules until they write to it
+preload_app = True
+
+
+def when_ready(server):
+    """ A hook that runs in the master process after the app is imported and before the workers
+    are forked. The log of the app is written to the error log of gunicorn. The objects that exist
+    are moved to the permanent generation of the garbage collector, so that collections in the
+    workers do not write to them and copy their pages. """
+    logger = logging.getLogger("audioserver")
+    logger.handlers = list(server.log.error_log.handlers)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+    gc.collect()
+    gc.freeze()
+    server.log.info("froze %d objects for the workers", gc.get_freeze_count())
+
+
+def pre_fork(server, worker):
+    """ A hook that runs in the master process before a worker is forked. The worker is given the
+    lowest slot that no running worker has, so the slots stay below the number of running workers
+    however often workers are restarted. """
+    used = {getattr(running, 'slot', None) for running in server.WORKERS.values()}
+    worker.slot = next(slot for slot in itertools.count() if slot not in used)
+
+
+def post_fork(server, worker):
+    """ A hook that runs in every worker after it is forked. A MongoDB client is not safe to use
+    across a fork, so each worker creates its own, with a connection for each of its threads.
+    The IDs of a worker are generated with the worker number of the server plus its slot, so
+    they never collide with the IDs of the other workers. The worker number of the server is
+    AUDIOSERVERWORKERID or else derived from the host name, and a worker fails to start if its
+    worker number would be out of range. """
+    import audioserver
+    from audiofiles.idgenerator import generator, configured_worker, host_worker, MAX_WORKER
+
+    first = configured_worker()
+
+    if first is None:
+        generator.reset((host_worker() + worker.slot) & MAX_WORKER)
+    else:
+        generator.reset(first + worker.slot)
+
+    audioserver.connectStorage(poolsize=threads)
+
+    server.log.info("worker %s connected with %d connections per worker, %d in total, and ID worker number %d",
+                    worker.pid, threads, workers * threads, generator.worker)
@@ -0,0 +1,225 @@
+"""
+This module contains the SlowOperationLog class that records slow database
+operations of the AudioServer with their query plans in rotating log files.
+
+Author: Manish Meganathan
+License: MIT License
+"""
+import os
+import json
+import time
+import queue
+import typing
+import logging
+import threading
+import logging.handlers
+from datetime import datetime, timezone
+
+
+def planStages(plan: dict) -> typing.List[str]:
+    """ A function that returns the names of the stages of a query plan from the root stage
+    to the leaf stages, for example ['FETCH', 'IXSCAN'] or ['COLLSCAN']. """
+    stages, pending = [], [plan]
+
+    while pending:
+        stage = pending.pop(0)
+        if not isinstance(stage, dict):
+            continue
+
+        if 'stage' in stage:
+            stages.append(stage['stage'])
+
+        if 'inputStage' in stage:
+            pending.append(stage['inputStage'])
+
+        pending.extend(stage.get('inputStages', []))
+
+    return stages
+
+
+def processPath(path: str, pid: int) -> str:
+    """ A function that returns the path of the log file of the process 'pid', which is the
+    given path with the pid before its extension, for example 'slow.1234.log' for 'slow.log'. """
+    root, extension = os.path.splitext(path)
+    return f"{root}.{pid}{extension}"
+
+
+class SlowOperationLog:
+    """
+    ************
+    Description:
+    ************
+    *A log of database operations that took longer than a threshold.*
+
+    Every slow operation is written as a single JSON line to a rotating log file, with the
+    operation, the filter, the endpoint that issued it, the duration, the number of documents
+    returned and the winning query plan with its stages. Operations that raised an exception
+    are recorded whatever their duration, with the exception. The plan is captured with an
+    explain command at the 'queryPlanner' verbosity, which plans the query without running it.
+
+    The explain command is a database round trip, so it is not run by the thread of the
+    operation. Records are queued and explained and written by a background thread of the
+    process, which is started with the first record. A full queue suppresses the record.
+
+    Every process writes to its own log file, named with its pid by 'processPath', since the
+    workers of a server would otherwise write to and rotate the same file. A rotation renames
+    the file of the process that rotates it, which the other processes would keep writing to.
+
+    At most one record is written per 'interval' seconds, so that a burst of slow operations
+    does not add more load to the database. The number of slow operations that were not
+    recorded since the last record is reported with the next record as 'suppressed'.
+
+    *****************
+    Class Attributes:
+    *****************
+    - ``threshold``:    A float that is the number of seconds after which an operation is slow.
+    - ``interval``:     A float that is the minimum number of seconds between two records.
+    - ``context``:  A function without arguments that returns the endpoint issuing an operation.
+    - ``recorded``: An int counter of the slow operations that were recorded.
+    - ``suppressed``:   An int counter of the slow operations that were not recorded.
+
+    **************
+    Class Methods:
+    **************
+    - ``observe``:  A method that records an operation if it is slow or failed and not rate limited.
+    - ``flush``:    A method that waits until the queued records are written.
+    - ``close``:    A method that writes the queued records and closes the log file.
+    """
+    def __init__(self, path: str, threshold: float = 0.1, interval: float = 1.0,
+                 maxbytes: int = 10485760, backups: int = 5, queuesize: int = 64,
+                 context: typing.Callable[[], typing.Optional[str]] = lambda: None,
+                 timer: typing.Callable[[], float] = time.monotonic):
+        """ Constructor """
+        self.threshold = threshold
+        self.interval = interval
+        self.context = context
+        self.timer = timer
+
+        self.recorded = 0
+        self.suppressed = 0
+
+        self._path = path
+        self._maxbytes = maxbytes
+        self._backups = backups
+        self._handler = None
+        self._last = None
+        self._pending = 0
+        self._lock = threading.Lock()
+
+        self._queuesize = queuesize
+        self._queue = None
+        self._writer = None
+        self._pid = None
+
+    def observe(self, operation: str, search: dict, duration: float, documents: int,
+                explain: typing.Callable[[], dict], error: typing.Optional[BaseException] = None) -> bool:
+        """ A method that records an operation if its duration in seconds is over the threshold or
+        it raised the exception 'error', and no other operation was recorded in the last interval.
+        The 'explain' function is only called for recorded operations, by the background thread,
+        and returns the explain output of the operation. Returns whether the operation was queued
+        to be recorded. """
+        if duration < self.threshold and error is None:
+            return False
+
+        with self._lock:
+            now = self.timer()
+
+            if self._last is not None and now - self._last < self.interval:
+                self._pending += 1
+                self.suppressed += 1
+                return False
+
+            self._last = now
+            suppressed, self._pending = self._pending, 0
+            self.recorded += 1
+
+        record = {
+            "time": datetime.now(timezone.utc).isoformat(),
+            "operation": operation,
+            "endpoint": self.context(),
+            "filter": search,
+            "duration_ms": round(duration * 1000, 3),
+            "documents": documents,
+            "suppressed": suppressed
+        }
+
+        if error is not None:
+            record["exception"] = f"{error.__class__.__name__} - {error}"
+
+        try:
+            self._writerQueue().put_nowait((record, explain))
+
+        except queue.Full:
+            with self._lock:
+                self._pending += 1
+                self.recorded -= 1
+                self.suppressed += 1
+
+            return False
+
+        return True
+
+    def flush(self):
+        """ A method that waits until the queued records of this process are written. """
+        with self._lock:
+            records = self._queue if self._pid == os.getpid() else None
+
+        if records is not None:
+            records.join()
+
+    def close(self):
+        """ A method that writes the queued records, stops the background thread and closes the log file. """
+        with self._lock:
+            writer, handler = (self._writer, self._handler) if self._pid == os.getpid() else (None, None)
+            self._writer, self._handler = None, None
+
+        if writer is not None:
+            self._queue.put(None)
+            writer.join()
+
+        if handler is not None:
+            handler.close()
+
+    def _writerQueue(self) -> queue.Queue:
+        """ A method that returns the queue of the background thread of this process, starting it
+        if it is not running. A forked process starts its own thread, since threads do not survive
+        a fork, and opens its own log file. """
+        with self._lock:
+            if self._writer is None or self._pid != os.getpid():
+                if self._handler is None or self._pid != os.getpid():
+                    self._handler = logging.handlers.RotatingFileHandler(
+                        processPath(self._path, os.getpid()), maxBytes=self._maxbytes,
+                        backupCount=self._backups, delay=True, encoding="utf-8")
+
+                self._queue = queue.Queue(maxsize=self._queuesize)
+                self._writer = threading.Thread(target=self._write, args=(self._queue, self._handler),
+                                                name="slowlog", daemon=True)
+                self._pid = os.getpid()
+                self._writer.start()
+
+            return self._queue
+
+    def _write(self, records: queue.Queue, handler: logging.Handler):
+        """ A method that explains and writes the queued records with the handler until it gets None """
+        while True:
+            item = records.get()
+
+            try:
+                if item is None:
+                    return
+
+                record, explain = item
+
+                try:
+                    plan = explain().get('queryPlanner', {}).get('winningPlan', {})
+                    record["plan"] = plan
+                    record["stages"] = planStages(plan)
+
+                except Exception as error:
+                    record["plan"] = None
+                    record["error"] = f"explain failed - {error}"
+
+                handler.handle(logging.makeLogRecord({"msg": json.dumps(record, default=str)}))
+
+            finally:
+                records.task_done()
@@ -1,5 +1,29 @@
+import os
 import pytest
+
+# Run against the in-memory storage backend unless a MongoDB server is configured
+os.environ.setdefault('AUDIOSERVERSTORAGE', "mongo" if os.environ.get('AUDIOSERVERDB') else "memory")
+
+import audioserver
 from audioserver import app as flask_app
+from audioserver import generateAudio
+from audiostorage import MemoryStorage
+
+# The app connects its storage backend in each worker, so connect it once for the tests
+storage = audioserver.storage or audioserver.connectStorage()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def seed():
+    """Seeds an in-memory storage backend with a few files of every type"""
+    if isinstance(storage, MemoryStorage) and not len(storage):
+        for count in range(5):
+            for audiotype, metadata in [("Song", {}),
+                                        ("Podcast", {"host": "host1", "participants": ["cast1"]}),
+                                        ("Audiobook", {"author": "author1", "narrator": "narrator1"})]:
+
+                metadata = {"name": f"seed-{audiotype.lower()}-{count}", "duration": count, **metadata}
+                storage.insert(generateAudio(audiotype, metadata).metadata)
 
 
 @pytest.fixture
@@ -0,0 +1,152 @@
+"""
+Functional Test Module for the app factory and gunicorn configuration of the AudioServer
+Test Framework: pyTest
+"""
+import os
+import gc
+import sys
+import logging
+import subprocess
+import importlib.util
+
+import pytest
+
+import audioserver
+from audiostorage import MemoryStorage
+from audiofiles.idgenerator import generator, host_worker, MAX_WORKER
+
+
+class RecordingHandler(logging.Handler):
+    """ A logging handler that keeps the messages it handles """
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+class FakeLog:
+    """ A gunicorn logger with an error log """
+    error_log = logging.getLogger("gunicorn.test")
+
+    def info(self, message, *arguments):
+        self.error_log.info(message, *arguments)
+
+
+class FakeServer:
+    """ A gunicorn arbiter with a logger and its running workers by process ID """
+    log = FakeLog()
+
+    def __init__(self, *workers):
+        self.WORKERS = {index: worker for index, worker in enumerate(workers)}
+
+
+class FakeWorker:
+    """ A gunicorn worker with a spawn number """
+    pid = os.getpid()
+
+    def __init__(self, age: int):
+        self.age = age
+
+
+def loadConfig():
+    """ A function that imports the gunicorn configuration module """
+    path = os.path.join(os.path.dirname(audioserver.__file__), "gunicorn.conf.py")
+    spec = importlib.util.spec_from_file_location("gunicorn_conf", path)
+    config = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(config)
+    return config
+
+
+def test_create_app():
+    """
+    **GIVEN** the app factory of the AudioServer\n
+    **WHEN** a new app is created\n
+    **THEN** check that it serves every resource with the connected storage backend
+    """
+    client = audioserver.create_app().test_client()
+
+    response = client.get('/get/song')
+    assert response.status_code == 200
+    assert response.get_json()['matches'] > 0
+
+    response = client.get('/metrics')
+    assert response.status_code == 200
+
+
+def test_create_app_workerid(monkeypatch):
+    """
+    **GIVEN** an AUDIOSERVERWORKERID that is not a valid worker number
+
+    **WHEN** the audiofiles package is imported and an app is created
+
+    **THEN** check that the import succeeds and the app factory fails with a ValueError that names the variable
+    """
+    monkeypatch.setenv('AUDIOSERVERWORKERID', "worker")
+
+    subprocess.run([sys.executable, "-c", "import audiofiles"], check=True)
+
+    with pytest.raises(ValueError, match="AUDIOSERVERWORKERID"):
+        audioserver.create_app()
+
+
+def test_gunicorn_config(monkeypatch, capsys):
+    """
+    **GIVEN** the gunicorn configuration of the AudioServer\n
+    **WHEN** its hooks run before and after a worker is forked\n
+    **THEN** check that objects are frozen, that the worker connects its own storage backend and
+    logs its index report to the error log, and that running workers get different ID worker
+    numbers from the configured or derived one
+    """
+    monkeypatch.setenv('WORKERS', "2")
+    monkeypatch.setenv('THREADS', "8")
+    monkeypatch.setenv('AUDIOSERVERSTORAGE', "memory")
+
+    config = loadConfig()
+    assert (config.workers, config.threads, config.preload_app) == (2, 8, True)
+
+    storage, worker, explicit = audioserver.storage, generator.worker, generator._explicit
+    logger = logging.getLogger("audioserver")
+    handlers, level, propagate = logger.handlers, logger.level, logger.propagate
+    handler = RecordingHandler()
+    FakeLog.error_log.addHandler(handler)
+
+    try:
+        config.when_ready(FakeServer())
+        assert gc.get_freeze_count() > 0
+
+        first, second, third = FakeWorker(1), FakeWorker(2), FakeWorker(1027)
+        config.pre_fork(FakeServer(), first)
+        config.pre_fork(FakeServer(first), second)
+
+        # A restarted worker takes the slot of the worker it replaces, whatever its spawn number
+        config.pre_fork(FakeServer(second), third)
+        assert (first.slot, second.slot, third.slot) == (0, 1, 0)
+
+        monkeypatch.setenv('AUDIOSERVERWORKERID', "40")
+        config.post_fork(FakeServer(), second)
+        assert audioserver.storage is not storage
+        assert isinstance(audioserver.storage, MemoryStorage)
+        assert generator.worker == 41
+
+        # The index report is logged to the error log instead of the output of the worker
+        assert any(message.startswith("index 'type_id'") for message in handler.messages)
+        assert capsys.readouterr().out == ""
+
+        monkeypatch.setenv('AUDIOSERVERWORKERID', str(MAX_WORKER))
+
+        with pytest.raises(ValueError):
+            config.post_fork(FakeServer(), second)
+
+        monkeypatch.delenv('AUDIOSERVERWORKERID')
+        config.post_fork(FakeServer(), third)
+        assert generator.worker == host_worker()
+
+    finally:
+        gc.unfreeze()
+        FakeLog.error_log.removeHandler(handler)
+        logger.handlers, logger.propagate = handlers, propagate
+        logger.setLevel(level)
+        audioserver.storage = storage
+        generator.reset(worker if explicit else None)
@@ -5,6 +5,8 @@ Test Framework: pyTest
 import json
 import random
 
+from audiofiles.idgenerator import generator
+
 
 def test_Create_Song(client):
     """
@@ -296,3 +298,97 @@ def test_Create_badURL(client):
 
     response = client.post(f"/create/something")
     assert response.status_code == 404
+
+
+def test_Create_batch(client, monkeypatch):
+    """
+    **GIVEN** a Flask application configured for testing\n
+    **WHEN** the batch create endpoint is hit with a POST request with a list of valid and
+    invalid audio files\n
+    **THEN** check that the response is valid for a 200 response (OK), that every valid file
+    has been created with an ID reserved for the batch and every invalid file has an error,
+    then delete the created files.
+    """
+    reserved = []
+    next_ids = generator.next_ids
+
+    def reserve(count: int) -> list:
+        reserved.append(next_ids(count))
+        return reserved[-1]
+
+    monkeypatch.setattr(generator, "next_ids", reserve)
+
+    name = f"test-batch-{random.randint(100, 999)}"
+    request = [
+        {"audioFileType": "Song", "audioFileMetadata": {"name": f"{name}", "duration": 45}},
+        {"audioFileType": "Podcast", "audioFileMetadata": {"name": f"{name}", "duration": 45}},
+        {"audioFileType": "Audiobook",
+         "audioFileMetadata": {"name": f"{name}", "duration": 45,
+                               "author": "author1", "narrator": "narrator1"}},
+        {"audioFileType": "Music", "audioFileMetadata": {"name": f"{name}", "duration": 45}},
+        {"audioFileMetadata": {"name": f"{name}", "duration": 45}},
+    ]
+    response = client.post(f"/create/batch", json=request)
+
+    assert response.status_code == 200
+    assert isinstance(response.data, bytes)
+
+    data = json.loads(response.data)
+
+    assert data['status'] == 200
+    assert data['message'] == f"Create Complete"
+    assert data['result'] == f"2 of 5 file(s) have been created"
+    assert data['created'] == 2
+    assert len(data['results']) == 5
+
+    song, podcast, audiobook, music, missing = data['results']
+
+    # The IDs of the batch were reserved with a single call
+    assert len(reserved) == 1 and len(reserved[0]) == 5
+    assert song['document'] == reserved[0][0]
+    assert audiobook['document'] == reserved[0][2]
+
+    assert song['status'] == 200
+    assert song['result'] == f"Song file with ID {song['document']} has been created"
+    assert audiobook['status'] == 200
+    assert audiobook['result'] == f"Audiobook file with ID {audiobook['document']} has been created"
+
+    assert podcast['status'] == 400
+    assert podcast['error'] == f"metadata value is missing for 'host'"
+    assert music['status'] == 400
+    assert music['error'] == f"'Music' is not supported"
+    assert missing['status'] == 400
+    assert missing['error'] == f"'audioFileType' is required"
+
+    # Retrieve the created documents and check their values
+    for audiotype, result in [("song", song), ("audiobook", audiobook)]:
+        response = client.get(f"/get/{audiotype}/{result['document']}")
+        test_data = json.loads(response.data)
+
+        assert test_data['documents'][0]['_id'] == result['document']
+        assert test_data['documents'][0]['name'] == name
+
+        # Cleanup - Delete the added test file
+        response = client.get(f"/delete/{audiotype}/{result['document']}")
+        assert response.status_code == 200
+
+
+def test_Create_batch_invalid(client):
+    """
+    **GIVEN** a Flask application configured for testing\n
+    **WHEN** the batch create endpoint is hit with a POST request that is not a list of
+    audio files or is an empty list\n
+    **THEN** check that the response is valid for a 400 response (Bad Request)
+    """
+    for request, error in [({"audioFileType": "Song"}, "request must be a list of audio files"),
+                           ([], "request must contain between 1 and 1000 audio files")]:
+
+        response = client.post(f"/create/batch", json=request)
+
+        assert response.status_code == 400
+
+        data = json.loads(response.data)
+
+        assert data['status'] == 400
+        assert data['message'] == f"Bad Request"
+        assert data['error'] == error
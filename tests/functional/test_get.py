@@ -147,3 +147,232 @@ def test_Get_badURL(client):
 
     response = client.post(f"/get/song/something")
     assert response.status_code == 404
+
+
+def test_Get_all_paginated(client):
+    """
+    **GIVEN** a Flask application configured for testing\n
+    **WHEN** a valid endpoint for retrieving all files of a type is hit with a GET request
+    with a 'limit' parameter and the 'next' cursor is followed\n
+    **THEN** check that every page is valid for a 200 response (OK) and that the pages
+    together contain every file of the type exactly once, in ascending order of ID
+    """
+    for endpoint in ['Song', 'Podcast', 'Audiobook']:
+        response = client.get(f"/get/{endpoint}")
+        data = json.loads(response.data)
+
+        expected = sorted(doc['_id'] for doc in data['documents'])
+        collected = []
+
+        cursor = None
+        while True:
+            url = f"/get/{endpoint}?limit=2" + (f"&after={cursor}" if cursor else "")
+            response = client.get(url)
+
+            assert response.status_code == 200
+
+            data = json.loads(response.data)
+
+            assert data['status'] == 200
+            assert data['message'] == f"Get Complete"
+            assert data['matches'] <= 2
+            assert data['result'] == f"{data['matches']} result(s) found"
+
+            for doc in data['documents']:
+                assert doc['type'] == endpoint
+
+            collected.extend(doc['_id'] for doc in data['documents'])
+
+            cursor = data['next']
+            if not cursor:
+                break
+
+        assert collected == expected
+
+
+def test_Get_all_paginated_invalid(client):
+    """
+    **GIVEN** a Flask application configured for testing\n
+    **WHEN** a valid endpoint for retrieving all files of a type is hit with a GET request
+    with an invalid 'limit' or 'after' parameter\n
+    **THEN** check that the response is valid for a 400 response (Bad Request)
+    """
+    for query, error in [("limit=abc", "'limit' must be an int"),
+                         ("limit=0", "'limit' must be between 1 and 1000"),
+                         ("limit=1001", "'limit' must be between 1 and 1000"),
+                         ("after=not-a-cursor", "'after' is not a valid cursor")]:
+
+        response = client.get(f"/get/song?{query}")
+
+        assert response.status_code == 400
+
+        data = json.loads(response.data)
+
+        assert data['status'] == 400
+        assert data['message'] == f"Bad Request"
+        assert data['error'] == error
+
+
+def test_Get_all_ndjson(client):
+    """
+    **GIVEN** a Flask application configured for testing\n
+    **WHEN** a valid endpoint for retrieving all files of a type is hit with a GET request
+    that accepts 'application/x-ndjson'\n
+    **THEN** check that the response is streamed as one JSON document per line and contains
+    the same files as the JSON response
+    """
+    for endpoint in ['Song', 'Podcast', 'Audiobook']:
+        response = client.get(f"/get/{endpoint}")
+        data = json.loads(response.data)
+
+        expected = sorted(doc['_id'] for doc in data['documents'])
+
+        response = client.get(f"/get/{endpoint}", headers={"Accept": "application/x-ndjson"})
+
+        assert response.status_code == 200
+        assert response.mimetype == "application/x-ndjson"
+        assert response.is_streamed
+
+        documents = [json.loads(line) for line in response.data.decode().splitlines()]
+
+        for doc in documents:
+            assert doc['type'] == endpoint
+
+        assert sorted(doc['_id'] for doc in documents) == expected
+
+
+def test_Get_all_ndjson_pages(client):
+    """
+    **GIVEN** a Flask application configured for testing\n
+    **WHEN** a valid endpoint for retrieving all files of a type is hit with GET requests
+    that accept 'application/x-ndjson' with a 'limit' and the 'after' cursor of the previous page\n
+    **THEN** check that every page has at most 'limit' lines, that the pages contain the same files
+    as the JSON response in the order of their IDs and that invalid parameters are rejected
+    """
+    response = client.get("/get/Song")
+    expected = sorted(doc['_id'] for doc in json.loads(response.data)['documents'])
+
+    headers = {"Accept": "application/x-ndjson"}
+    documents, url = [], "/get/Song?limit=2"
+
+    while url is not None:
+        response = client.get(url, headers=headers)
+
+        assert response.status_code == 200
+        assert response.mimetype == "application/x-ndjson"
+
+        page = [json.loads(line) for line in response.data.decode().splitlines()]
+        assert len(page) <= 2
+        documents.extend(page)
+
+        cursor = response.headers.get('X-Next-Cursor')
+        url = f"/get/Song?limit=2&after={cursor}" if cursor else None
+
+    assert [doc['_id'] for doc in documents] == expected
+
+    for query, error in [("limit=0", "'limit' must be between 1 and 1000"),
+                         ("after=%%%", "'after' is not a valid cursor")]:
+        response = client.get(f"/get/Song?{query}", headers=headers)
+        data = json.loads(response.data)
+
+        assert response.status_code == 400
+        assert data['error'] == error
+
+
+def test_Get_many_valid(client):
+    """
+    **GIVEN** a Flask application configured for testing\n
+    **WHEN** a valid endpoint for retrieving all files of a type is hit with a GET request
+    with an 'ids' parameter\n
+    **THEN** check that the response is valid for a 200 response (OK), that the files are
+    returned in the requested order and that unknown IDs are listed as missing
+    """
+    for endpoint in ['Song', 'Podcast', 'Audiobook']:
+        response = client.get(f"/get/{endpoint}")
+        data = json.loads(response.data)
+
+        IDs = [doc['_id'] for doc in data['documents']][:3][::-1]
+        query = ",".join(str(ID) for ID in IDs + [0])
+
+        response = client.get(f"/get/{endpoint}?ids={query}")
+
+        assert response.status_code == 200
+
+        data = json.loads(response.data)
+
+        assert data['status'] == 200
+        assert data['message'] == f"Get Complete"
+        assert data['result'] == f"{len(IDs)} result(s) found"
+        assert data['matches'] == len(IDs)
+        assert [doc['_id'] for doc in data['documents']] == IDs
+        assert data['missing'] == [0]
+
+
+def test_Get_many_invalid(client):
+    """
+    **GIVEN** a Flask application configured for testing\n
+    **WHEN** a valid endpoint for retrieving all files of a type is hit with a GET request
+    with an invalid 'ids' parameter\n
+    **THEN** check that the response is valid for a 400 response (Bad Request)
+    """
+    for query in ["ids=1,two,3", "ids=", "ids=1,,2"]:
+        response = client.get(f"/get/song?{query}")
+
+        assert response.status_code == 400
+
+        data = json.loads(response.data)
+
+        assert data['status'] == 400
+        assert data['message'] == f"Bad Request"
+        assert data['error'] == f"'ids' must be a comma separated list of int"
+
+
+def test_Get_fields_valid(client):
+    """
+    **GIVEN** a Flask application configured for testing\n
+    **WHEN** a valid endpoint for retrieving files is hit with a GET request with a 'fields'
+    parameter\n
+    **THEN** check that the response is valid for a 200 response (OK) and that the documents
+    only contain the requested fields and the '_id'
+    """
+    for endpoint, fields in [('Song', ['name', 'duration']),
+                             ('Podcast', ['name', 'host']),
+                             ('Audiobook', ['author', 'narrator'])]:
+
+        response = client.get(f"/get/{endpoint}?fields={','.join(fields)}")
+
+        assert response.status_code == 200
+
+        data = json.loads(response.data)
+
+        for doc in data['documents']:
+            assert set(doc) == {'_id', *fields}
+
+        for ID in [doc['_id'] for doc in data['documents']][:3]:
+            response = client.get(f"/get/{endpoint}/{ID}?fields={','.join(fields)}")
+
+            assert response.status_code == 200
+
+            data = json.loads(response.data)
+
+            assert data['matches'] == 1
+            assert set(data['documents'][0]) == {'_id', *fields}
+
+
+def test_Get_fields_invalid(client):
+    """
+    **GIVEN** a Flask application configured for testing\n
+    **WHEN** a valid endpoint for retrieving files is hit with a GET request with a 'fields'
+    parameter that contains a field not defined for the type\n
+    **THEN** check that the response is valid for a 400 response (Bad Request)
+    """
+    for endpoint, field in [('Song', 'host'), ('Podcast', 'author'), ('Audiobook', 'participants')]:
+        response = client.get(f"/get/{endpoint}?fields=name,{field}")
+
+        assert response.status_code == 400
+
+        data = json.loads(response.data)
+
+        assert data['status'] == 400
+        assert data['message'] == f"Bad Request"
+        assert data['error'] == f"'{field}' is not a field of {endpoint}"
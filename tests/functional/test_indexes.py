@@ -0,0 +1,21 @@
+"""
+Functional Test Module for the index management of the AudioServer
+Test Framework: pyTest
+"""
+import audioserver
+
+
+def test_ensureIndexes():
+    """
+    **GIVEN** an AudioServer connected to its database\n
+    **WHEN** the indexes are ensured more than once\n
+    **THEN** check that every index is reported with the query shapes it covers each time
+    """
+    for _ in range(2):
+        report = audioserver.ensureIndexes()
+
+        assert len(report) == len(audioserver.INDEXES)
+
+        for line, index in zip(report, audioserver.INDEXES):
+            assert line.startswith(f"index '{index['name']}'")
+            assert "covers" in line
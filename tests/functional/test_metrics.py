@@ -0,0 +1,38 @@
+"""
+Functional Test Module for the Metrics resource of the AudioServer
+Test Framework: pyTest
+"""
+import audioserver
+
+
+def test_metrics(client):
+    """
+    **GIVEN** an AudioServer that has served requests\n
+    **WHEN** the '/metrics' endpoint is requested\n
+    **THEN** check that the metrics are served in the Prometheus text format
+    """
+    get_count = audioserver.requestLatency.count("get", "GET")
+    documents = audioserver.documentCount.value("json")
+
+    response = client.get('/get/song')
+    assert response.status_code == 200
+    matches = response.get_json()['matches']
+
+    response = client.post('/create', json={"audioFileType": "Song"})
+    assert response.status_code == 400
+
+    assert audioserver.requestLatency.count("get", "GET") == get_count + 1
+    assert audioserver.documentCount.value("json") == documents + matches
+
+    response = client.get('/metrics')
+    assert response.status_code == 200
+    assert response.content_type == "text/plain; version=0.0.4; charset=utf-8"
+
+    text = response.get_data(as_text=True)
+
+    assert '# TYPE audioserver_request_duration_seconds histogram' in text
+    assert 'audioserver_phase_duration_seconds_count{endpoint="get",method="GET",phase="storage"}' in text
+    assert 'audioserver_phase_duration_seconds_count{endpoint="get",method="GET",phase="serialize"}' in text
+    assert 'audioserver_phase_duration_seconds_count{endpoint="create",method="POST",phase="validate"}' in text
+    assert 'audioserver_responses_total{endpoint="create",method="POST",status="400"}' in text
+    assert 'audioserver_cache_size ' in text
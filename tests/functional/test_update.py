@@ -376,3 +376,82 @@ def test_Update_badURL(client):
 
     response = client.post(f"/update/song/something")
     assert response.status_code == 404
+
+
+def test_Update_patch_Podcast(client):
+    """
+    **GIVEN** a Flask application configured for testing and a Podcast file has been created\n
+    **WHEN** the update endpoint is hit with a PATCH request with some of the Podcast fields\n
+    **THEN** check that the response is valid for a 200 response (OK), check if only the given
+    fields of the document were updated and delete the created file.
+    """
+    # Create a Podcast file
+    name = f"test-podcast-{random.randint(100, 999)}"
+    request = {"audioFileType": "Podcast",
+               "audioFileMetadata": {"name": f"{name}", "duration": 45,
+                                     "host": "host1", "participants": ["cast1", "cast2"]}}
+    response = client.post(f"/create", json=request)
+
+    assert response.status_code == 200
+
+    docID = json.loads(response.data)['document']
+
+    # Patch the file
+    new_name = f"test-podcast-{random.randint(100, 999)}"
+    request = {"audioFileType": "Podcast", "audioFileMetadata": {"name": f"{new_name}", "duration": 2}}
+    response = client.patch(f"/update/podcast/{docID}", json=request)
+
+    assert response.status_code == 200
+
+    data = json.loads(response.data)
+
+    assert data['status'] == 200
+    assert data['message'] == f"Update Complete"
+    assert data['result'] == f"Podcast file with ID {docID} has been updated"
+    assert data['updated'] == {"name": new_name, "duration": 2}
+    assert data['document'] == docID
+
+    # Retrieve document and check its values
+    response = client.get(f"/get/podcast/{docID}")
+    test_data = json.loads(response.data)
+
+    assert test_data['documents'][0]['name'] == new_name
+    assert test_data['documents'][0]['duration'] == 2
+    assert test_data['documents'][0]['host'] == "host1"
+    assert test_data['documents'][0]['participants'] == ["cast1", "cast2"]
+
+    # Cleanup - Delete the added test file
+    response = client.get(f"/delete/podcast/{docID}")
+    assert response.status_code == 200
+
+
+def test_Update_patch_invalid(client):
+    """
+    **GIVEN** a Flask application configured for testing\n
+    **WHEN** the update endpoint is hit with a PATCH request with invalid fields or for a
+    file that does not exist\n
+    **THEN** check that the response is valid for a 400 response (Bad Request)
+    """
+    for metadata, error in [({"host": "host1"}, "'host' is not a field of Song"),
+                            ({"_id": 10}, "'_id' cannot be updated"),
+                            ({"duration": -1}, "metadata value is invalid for 'duration' - not positive"),
+                            ({"name": 45}, "metadata value is invalid for 'name' - not an str"),
+                            ({}, "'audioFileMetadata' must not be empty"),
+                            ({"name": "test-song"}, "No document found for ID - 101010")]:
+
+        request = {"audioFileType": "song", "audioFileMetadata": metadata}
+        response = client.patch(f"/update/song/101010", json=request)
+
+        assert response.status_code == 400
+
+        data = json.loads(response.data)
+
+        assert data['status'] == 400
+        assert data['message'] == f"Bad Request"
+        assert data['error'] == error
+
+    request = {"audioFileType": "podcast", "audioFileMetadata": {"participants": "cast1"}}
+    response = client.patch(f"/update/podcast/101010", json=request)
+
+    assert response.status_code == 400
+    assert json.loads(response.data)['error'] == "metadata value is invalid for 'participants' - not a list"
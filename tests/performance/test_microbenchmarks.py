@@ -0,0 +1,39 @@
+"""
+Performance Test Module for the microbenchmarks of the audiofiles package
+Test Framework: pyTest
+
+The benchmarks are compared with the baseline in benchmarks/baseline.json and fail when
+they regress by more than AUDIOFILESBENCHTOLERANCE percent (default 20). They only run
+when AUDIOFILESBENCH is set, because their timings depend on the machine, and only with
+the minor version of Python that the baseline was measured with.
+
+    AUDIOFILESBENCH=1 python -m pytest tests/performance
+"""
+import os
+import pytest
+
+from benchmarks.micro import BENCHMARKS, DEFAULT_TOLERANCE, loadBaseline, checkBenchmark
+from benchmarks.micro import baselineVersion, pythonVersion, sameMinorVersion
+
+pytestmark = [
+    pytest.mark.skipif(not os.environ.get('AUDIOFILESBENCH'),
+                       reason="set AUDIOFILESBENCH to run the microbenchmark regression gate"),
+    pytest.mark.skipif(not sameMinorVersion(baselineVersion(), pythonVersion()),
+                       reason=f"the baseline was measured with Python {baselineVersion()}")
+]
+
+
+@pytest.mark.parametrize("name", list(BENCHMARKS))
+def test_microbenchmark(name):
+    """
+    **GIVEN** a microbenchmark of the audiofiles package and its baseline\n
+    **WHEN** the benchmark is run\n
+    **THEN** check that it has not regressed by more than the tolerance
+    """
+    baseline = loadBaseline()
+    assert name in baseline, f"'{name}' has no baseline, run python -m benchmarks.micro --update-baseline"
+
+    tolerance = float(os.environ.get('AUDIOFILESBENCHTOLERANCE', DEFAULT_TOLERANCE))
+    result, regressions = checkBenchmark(name, baseline[name], tolerance)
+
+    assert not regressions, f"{name} regressed - {'; '.join(regressions)}"
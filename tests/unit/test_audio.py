@@ -2,9 +2,10 @@
 Unit Test Module for the class Audio in the audiofiles package
 Test Framework: pyTest
 """
+import json
 import pytest
 import datetime
-from audiofiles import Audio
+from audiofiles import Audio, Song, Podcast, Audiobook, set_encoder
 from audiofiles import MetadataValueError
 
 
@@ -23,7 +24,7 @@ def test_Audio():
     assert isinstance(audio.metadata, dict)
     assert isinstance(audio.uploadtime, datetime.datetime)
 
-    assert audio.ID == abs(hash(f"sample-audio-45-{audio.uploadtime.isoformat()}"))
+    assert 0 < audio.ID < 2 ** 63
     assert audio.name == "sample-audio"
     assert audio.duration == 45
 
@@ -101,7 +102,7 @@ def test_Audio_extra_uploadtime():
     assert isinstance(audio.metadata, dict)
     assert isinstance(audio.uploadtime, datetime.datetime)
 
-    assert audio.ID == abs(hash(f"sample-audio-45-2021-01-01T00:00:00"))
+    assert 0 < audio.ID < 2 ** 63
     assert audio.name == "sample-audio"
     assert audio.duration == 45
     assert audio.uploadtime == datetime.datetime.fromisoformat("2021-01-01")
@@ -162,7 +163,7 @@ def test_Audio_extra_type():
     assert isinstance(audio.metadata, dict)
     assert isinstance(audio.uploadtime, datetime.datetime)
 
-    assert audio.ID == abs(hash(f"sample-audio-45-{audio.uploadtime.isoformat()}"))
+    assert 0 < audio.ID < 2 ** 63
     assert audio.name == "sample-audio"
     assert audio.duration == 45
 
@@ -178,7 +179,7 @@ def test_Audio_extra_type():
     assert isinstance(audio.metadata, dict)
     assert isinstance(audio.uploadtime, datetime.datetime)
 
-    assert audio.ID == abs(hash(f"sample-audio-45-{audio.uploadtime.isoformat()}"))
+    assert 0 < audio.ID < 2 ** 63
     assert audio.name == "sample-audio"
     assert audio.duration == 45
 
@@ -196,3 +197,113 @@ def test_Audio_extra_type():
         Audio(metadata={"name": "sample-audio", "duration": 45, "type": 342})
 
     assert str(error.value) == "metadata value is invalid for 'type' - not an str"
+
+
+def test_Audio_slots():
+    """
+    **GIVEN** a valid metadata dictionary for Audio with an additional field\n
+    **WHEN** a new Audio is created\n
+    **THEN** check that the Audio has no instance dict, that the input metadata is not
+    modified and that the generated metadata contains every field.
+    """
+    metadata = {"name": "sample-audio", "duration": 45, "extra": "value"}
+    audio = Audio(metadata=metadata)
+
+    assert not hasattr(audio, '__dict__')
+    assert metadata == {"name": "sample-audio", "duration": 45, "extra": "value"}
+
+    assert audio.metadata == {"_id": audio.ID, "type": "Audio", "name": "sample-audio",
+                              "duration": 45, "uploadtime": audio.uploadtime.isoformat(),
+                              "extra": "value"}
+
+    # Generated metadata is a new dict every time
+    audio.metadata['name'] = "changed"
+    assert audio.metadata['name'] == "sample-audio"
+
+    assert Audio(metadata=audio.metadata) == audio
+
+
+def test_Audio_str():
+    """
+    **GIVEN** an Audio and a custom JSON encoder\n
+    **WHEN** the Audio is serialized repeatedly and its attributes are changed\n
+    **THEN** check that the JSON is cached until an attribute changes and uses the encoder.
+    """
+    calls = []
+
+    def encoder(metadata: dict) -> bytes:
+        calls.append(metadata)
+        return json.dumps(metadata).encode()
+
+    set_encoder(encoder)
+
+    try:
+        audio = Audio(metadata={"name": "sample-audio", "duration": 45})
+
+        assert json.loads(str(audio)) == audio.metadata
+        assert str(audio) == str(audio)
+        assert len(calls) == 1
+
+        audio.name = "changed"
+        assert json.loads(str(audio))['name'] == "changed"
+        assert len(calls) == 2
+
+        audio.duration = 1
+        str(audio)
+        audio.duration = True
+        assert json.loads(str(audio))['duration'] is True
+        assert len(calls) == 4
+
+        podcast = Podcast(metadata={"name": "sample-podcast", "duration": 45, "host": "host1"})
+        str(podcast)
+        podcast.participants.append("cast1")
+        assert json.loads(str(podcast))['participants'] == ["cast1"]
+        assert len(calls) == 6
+
+    finally:
+        set_encoder(None)
+
+
+def test_Audio_validate_classmethods():
+    """
+    **GIVEN** valid and invalid values for the fields of an Audio\n
+    **WHEN** they are checked with the validate classmethods\n
+    **THEN** check that a validity bool and an error str are returned like the constructor checks.
+    """
+    assert Audio.validate_string("sample-audio") == (True, "null")
+    assert Audio.validate_string(45) == (False, "not an str")
+    assert Audio.validate_string("a" * 101) == (False, "str too long")
+
+    assert Audio.validate_duration(45) == (True, "null")
+    assert Audio.validate_duration("45") == (False, "not an int")
+    assert Audio.validate_duration(-1) == (False, "not positive")
+
+    assert Podcast.validate_participants([]) == (True, "null")
+    assert Podcast.validate_participants(["cast1"]) == (True, "null")
+    assert Podcast.validate_participants(None) == (False, "not a list")
+    assert Podcast.validate_participants(["cast1"] * 11) == (False, "too many participants")
+    assert Podcast.validate_participants(["cast1", 40]) == (False, "participant 2 - not an str")
+
+
+def test_Audio_str_baseline():
+    """
+    **GIVEN** metadata dicts of every Audio type class without an 'uploadtime' or '_id'\n
+    **WHEN** audio files are created from them and serialized\n
+    **THEN** check that the str is the JSON of the metadata dict that the constructors used to
+    fill in, with the 'type', 'uploadtime' and '_id' added after the passed fields.
+    """
+    for audioclass, metadata in [(Song, {"name": "sample-song", "duration": 45}),
+                                 (Podcast, {"name": "sample-podcast", "duration": 45, "host": "host1"}),
+                                 (Podcast, {"name": "sample-podcast", "duration": 45, "host": "host1",
+                                            "participants": []}),
+                                 (Audiobook, {"name": "sample-book", "duration": 45,
+                                              "author": "author1", "narrator": "narrator1"})]:
+        audiofile = audioclass(dict(metadata))
+        baseline = {**metadata, "type": audioclass.__name__, "uploadtime": audiofile.uploadtime.isoformat(),
+                    "_id": audiofile.ID}
+
+        assert str(audiofile) == json.dumps(baseline)
+        assert list(audiofile.metadata) == list(baseline)
+
+    audio = Audio({"name": "sample-audio", "duration": 45})
+    assert list(audio.metadata) == ["name", "duration", "uploadtime", "_id", "type"]
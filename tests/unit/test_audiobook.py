@@ -26,7 +26,7 @@ def test_Audiobook():
     assert isinstance(audiobook.metadata, dict)
     assert isinstance(audiobook.uploadtime, datetime.datetime)
 
-    assert audiobook.ID == abs(hash(f"sample-book-45-{audiobook.uploadtime.isoformat()}"))
+    assert 0 < audiobook.ID < 2 ** 63
     assert audiobook.name == "sample-book"
     assert audiobook.author == "author1"
     assert audiobook.narrator == "narrator1"
@@ -168,7 +168,7 @@ def test_Audiobook_extra_uploadtime():
     assert isinstance(audiobook.metadata, dict)
     assert isinstance(audiobook.uploadtime, datetime.datetime)
 
-    assert audiobook.ID == abs(hash(f"sample-book-45-2021-01-01T00:00:00"))
+    assert 0 < audiobook.ID < 2 ** 63
     assert audiobook.name == "sample-book"
     assert audiobook.author == "author1"
     assert audiobook.narrator == "narrator1"
@@ -242,7 +242,7 @@ def test_Audiobook_extra_type():
     assert isinstance(audiobook.metadata, dict)
     assert isinstance(audiobook.uploadtime, datetime.datetime)
 
-    assert audiobook.ID == abs(hash(f"sample-book-45-{audiobook.uploadtime.isoformat()}"))
+    assert 0 < audiobook.ID < 2 ** 63
     assert audiobook.name == "sample-book"
     assert audiobook.author == "author1"
     assert audiobook.narrator == "narrator1"
@@ -263,7 +263,7 @@ def test_Audiobook_extra_type():
     assert isinstance(audiobook.metadata, dict)
     assert isinstance(audiobook.uploadtime, datetime.datetime)
 
-    assert audiobook.ID == abs(hash(f"sample-book-45-{audiobook.uploadtime.isoformat()}"))
+    assert 0 < audiobook.ID < 2 ** 63
     assert audiobook.name == "sample-book"
     assert audiobook.author == "author1"
     assert audiobook.narrator == "narrator1"
@@ -284,7 +284,7 @@ def test_Audiobook_extra_type():
     assert isinstance(audiobook.metadata, dict)
     assert isinstance(audiobook.uploadtime, datetime.datetime)
 
-    assert audiobook.ID == abs(hash(f"sample-book-45-{audiobook.uploadtime.isoformat()}"))
+    assert 0 < audiobook.ID < 2 ** 63
     assert audiobook.name == "sample-book"
     assert audiobook.author == "author1"
     assert audiobook.narrator == "narrator1"
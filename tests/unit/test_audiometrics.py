@@ -0,0 +1,86 @@
+"""
+Unit Test Module for the metric classes of the AudioServer
+Test Framework: pyTest
+"""
+import threading
+
+from audiometrics import MetricsRegistry, Counter, Histogram, Gauge
+
+
+def test_Counter():
+    """
+    **GIVEN** a Counter with labels\n
+    **WHEN** it is incremented from several threads\n
+    **THEN** check that no increments are lost and that it renders every label set.
+    """
+    counter = Counter("requests", "Requests.", ["method", "status"])
+
+    def work():
+        for _ in range(1000):
+            counter.inc("GET", "200")
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    counter.inc("POST", "400", amount=2)
+
+    assert counter.value("GET", "200") == 4000
+    assert counter.value("POST", "400") == 2
+    assert counter.value("PATCH", "200") == 0
+
+    assert counter.render() == ['# HELP requests_total Requests.',
+                                '# TYPE requests_total counter',
+                                'requests_total{method="GET",status="200"} 4000',
+                                'requests_total{method="POST",status="400"} 2']
+
+
+def test_Histogram():
+    """
+    **GIVEN** a Histogram with three buckets\n
+    **WHEN** values are observed\n
+    **THEN** check that the buckets are rendered as cumulative counts with the sum and count.
+    """
+    histogram = Histogram("latency", "Latency.", ["phase"], buckets=[0.1, 1, 0.5])
+
+    for value in (0.05, 0.1, 0.3, 2):
+        histogram.observe(value, "parse")
+
+    with histogram.time("storage"):
+        pass
+
+    assert histogram.count("parse") == 4
+    assert histogram.count("storage") == 1
+
+    lines = histogram.render()
+
+    assert lines[:2] == ['# HELP latency Latency.', '# TYPE latency histogram']
+    assert lines[2:8] == ['latency_bucket{phase="parse",le="0.1"} 2',
+                          'latency_bucket{phase="parse",le="0.5"} 3',
+                          'latency_bucket{phase="parse",le="1.0"} 3',
+                          'latency_bucket{phase="parse",le="+Inf"} 4',
+                          'latency_sum{phase="parse"} 2.45',
+                          'latency_count{phase="parse"} 4']
+    assert lines[-1] == 'latency_count{phase="storage"} 1'
+
+
+def test_MetricsRegistry_render():
+    """
+    **GIVEN** a MetricsRegistry with a Counter and a Gauge\n
+    **WHEN** it is rendered\n
+    **THEN** check that the label values are escaped and the gauge is read from its function.
+    """
+    registry = MetricsRegistry()
+    counter = registry.register(Counter("errors", "Errors.", ["error"]))
+    registry.register(Gauge("size", "Size.", lambda: 3))
+
+    counter.inc('a "quoted"\nerror\\')
+
+    assert registry.render() == ('# HELP errors_total Errors.\n'
+                                 '# TYPE errors_total counter\n'
+                                 'errors_total{error="a \\"quoted\\"\\nerror\\\\"} 1\n'
+                                 '# HELP size Size.\n'
+                                 '# TYPE size gauge\n'
+                                 'size 3\n')
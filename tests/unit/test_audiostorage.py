@@ -0,0 +1,111 @@
+"""
+Unit Test Module for the class MemoryStorage
+Test Framework: pyTest
+"""
+import pytest
+from audiostorage import StorageBackend, MemoryStorage, DuplicateDocumentError
+
+
+def sample(audioID: int, audiotype: str = "Song") -> dict:
+    """ A function that returns a sample document """
+    return {"_id": audioID, "type": audiotype, "name": f"sample-{audioID}", "duration": 45}
+
+
+def test_MemoryStorage_insert():
+    """
+    **GIVEN** an empty MemoryStorage\n
+    **WHEN** documents are inserted\n
+    **THEN** check that they can be found by type and ID and that IDs are unique across types.
+    """
+    storage = MemoryStorage()
+
+    assert storage.insert(sample(1)) == 1
+    assert storage.find_one("Song", 1) == sample(1)
+    assert storage.find_one("Podcast", 1) is None
+    assert storage.find_one("Song", 2) is None
+
+    with pytest.raises(DuplicateDocumentError):
+        storage.insert(sample(1, "Podcast"))
+
+    failures = storage.insert_many([sample(2), sample(1), sample(3)])
+
+    assert failures.keys() == {1}
+    assert len(storage) == 3
+
+
+def test_MemoryStorage_isolation():
+    """
+    **GIVEN** a MemoryStorage with a document\n
+    **WHEN** the inserted or returned document is modified\n
+    **THEN** check that the stored document is unchanged.
+    """
+    storage = MemoryStorage()
+    document = {**sample(1, "Podcast"), "participants": ["cast1"]}
+    storage.insert(document)
+
+    document['participants'].append("cast2")
+    storage.find_one("Podcast", 1)['participants'].append("cast3")
+
+    assert storage.find_one("Podcast", 1)['participants'] == ["cast1"]
+
+
+def test_MemoryStorage_find():
+    """
+    **GIVEN** a MemoryStorage with documents of several types\n
+    **WHEN** documents are found by a list of IDs, by type and by pages of a type\n
+    **THEN** check that the correct documents are returned in ID order and projected.
+    """
+    storage = MemoryStorage()
+    storage.insert_many([sample(ID) for ID in [5, 3, 9, 1, 7]] + [sample(4, "Podcast")])
+
+    assert [doc['_id'] for doc in storage.find_many("Song", [9, 4, 1])] == [9, 1]
+    assert [doc['_id'] for doc in storage.find_by_type("Song")] == [1, 3, 5, 7, 9]
+    assert [doc['_id'] for doc in storage.find_by_type("Song", limit=2)] == [1, 3]
+    assert [doc['_id'] for doc in storage.find_by_type("Song", after=3, limit=2)] == [5, 7]
+    assert [doc['_id'] for doc in storage.find_by_type("Song", after=4)] == [5, 7, 9]
+    assert [doc['_id'] for doc in storage.find_by_type("Audiobook")] == []
+
+    assert storage.find_one("Song", 1, {"name": 1}) == {"_id": 1, "name": "sample-1"}
+    assert list(storage.find_by_type("Podcast", {"duration": 1})) == [{"_id": 4, "duration": 45}]
+
+
+def test_MemoryStorage_write():
+    """
+    **GIVEN** a MemoryStorage with a document\n
+    **WHEN** the document is replaced, updated and deleted\n
+    **THEN** check that the previous documents are returned and the changes are applied.
+    """
+    storage = MemoryStorage()
+    storage.insert_many([sample(1), sample(2)])
+
+    assert storage.replace("Song", 1, {**sample(1), "name": "replaced"}) == sample(1)
+    assert storage.replace("Song", 10, sample(10)) is None
+    assert storage.find_one("Song", 1)['name'] == "replaced"
+
+    assert storage.update("Song", 1, {"duration": 2}) is True
+    assert storage.update("Podcast", 1, {"duration": 2}) is False
+    assert storage.find_one("Song", 1) == {**sample(1), "name": "replaced", "duration": 2}
+
+    assert storage.delete("Song", 1)['_id'] == 1
+    assert storage.delete("Song", 1) is None
+    assert storage.find_one("Song", 1) is None
+    assert [doc['_id'] for doc in storage.find_by_type("Song")] == [2]
+
+
+def test_StorageBackend_abstract():
+    """
+    **GIVEN** the StorageBackend base class\n
+    **WHEN** it or a subclass that does not implement every operation is instantiated\n
+    **THEN** check that a TypeError is raised and that MemoryStorage implements every operation.
+    """
+    class PartialStorage(StorageBackend):
+        def insert(self, document: dict) -> int:
+            return document['_id']
+
+    with pytest.raises(TypeError):
+        StorageBackend()
+
+    with pytest.raises(TypeError):
+        PartialStorage()
+
+    assert isinstance(MemoryStorage(), StorageBackend)
@@ -0,0 +1,134 @@
+"""
+Unit Test Module for the class AudioTable in the audiofiles package
+Test Framework: pyTest
+"""
+import pytest
+from audiofiles import AudioTable, Audio, Song, Podcast, Audiobook
+from audiofiles import MetadataValueError
+
+
+def sample_metadata() -> list:
+    """ A function that returns the metadata of a Song, a Podcast and an Audiobook """
+    return [
+        Song(metadata={"name": "sample-song", "duration": 45}).metadata,
+        Podcast(metadata={"name": "sample-podcast", "duration": 30, "host": "host1",
+                          "participants": ["cast1", "host1"]}).metadata,
+        Podcast(metadata={"name": "sample-podcast", "duration": 20, "host": "host1"}).metadata,
+        Audiobook(metadata={"name": "sample-book", "duration": 60,
+                            "author": "author1", "narrator": "host1"}).metadata,
+    ]
+
+
+def test_AudioTable():
+    """
+    **GIVEN** a list of valid metadata dictionaries of every type\n
+    **WHEN** a new AudioTable is created from them\n
+    **THEN** check the columns, the string pool and that the metadata round trips.
+    """
+    metadata = sample_metadata()
+    table = AudioTable.from_metadata(metadata)
+
+    assert len(table) == 4
+    assert list(table.ids) == [meta['_id'] for meta in metadata]
+    assert list(table.durations) == [45, 30, 20, 60]
+    assert list(table.offsets) == [0, 0, 2, 2, 2]
+    assert list(table.listed) == [1, 1, 0, 1]
+
+    # Repeated strings are stored once
+    assert sorted(table.strings) == ["author1", "cast1", "host1", "sample-book",
+                                     "sample-podcast", "sample-song"]
+
+    assert table.to_dicts() == metadata
+    assert table.metadata(1) == metadata[1]
+
+
+def test_AudioTable_rows():
+    """
+    **GIVEN** an AudioTable with a row of every type\n
+    **WHEN** the rows are accessed\n
+    **THEN** check that Song, Podcast and Audiobook objects equal to the originals are returned.
+    """
+    metadata = sample_metadata()
+    table = AudioTable.from_cursor(iter(metadata))
+
+    assert [type(row) for row in table] == [Song, Podcast, Podcast, Audiobook]
+    assert table[0] == Song(metadata=metadata[0])
+    assert table[-1] == Audiobook(metadata=metadata[3])
+    assert table[1].participants == ["cast1", "host1"]
+    assert table[2].participants == []
+
+    with pytest.raises(IndexError):
+        table[4]
+
+
+def test_AudioTable_invalid():
+    """
+    **GIVEN** a list of metadata dictionaries with an invalid row\n
+    **WHEN** a new AudioTable is created from them\n
+    **THEN** check that a MetadataValueError is raised.
+    """
+    with pytest.raises(MetadataValueError) as error:
+        AudioTable.from_metadata([{"name": "sample-song", "duration": 45}])
+
+    assert str(error.value) == "metadata value is invalid for 'type' - not supported"
+
+    with pytest.raises(MetadataValueError) as error:
+        AudioTable.from_metadata([{"type": "Song", "name": "sample-song", "duration": -1}])
+
+    assert str(error.value) == "metadata value is invalid for 'duration' - not positive"
+
+    with pytest.raises(MetadataValueError) as error:
+        AudioTable.from_metadata([{"type": "Song", "name": "sample-song", "duration": 45, "_id": 2 ** 63}])
+
+    assert str(error.value) == "metadata value is invalid for '_id' - out of the int64 range"
+
+    with pytest.raises(MetadataValueError) as error:
+        AudioTable.from_metadata([{"type": "Song", "name": "sample-song", "duration": 2 ** 64}])
+
+    assert str(error.value) == "metadata value is invalid for 'duration' - out of the int64 range"
+
+    table = AudioTable.from_metadata([{"type": "Song", "name": "sample-song", "duration": 45, "_id": -2 ** 63}])
+    assert table.metadata(0)["_id"] == -2 ** 63
+
+
+def test_AudioTable_append_failure():
+    """
+    **GIVEN** an AudioTable with a row and a Song with an upload time that cannot be parsed\n
+    **WHEN** the Song is appended to the table\n
+    **THEN** check that the error is raised and that every column still has one row.
+    """
+    table = AudioTable.from_metadata(sample_metadata()[:1])
+    song = Song.from_document({"_id": 5, "name": "sample-song", "duration": 45, "uploadtime": "2021-13-01T00:00:00"})
+
+    with pytest.raises(ValueError):
+        table.append(song)
+
+    assert len(table) == 1
+
+    for column in (table.types, table.ids, table.durations, table.uploadtimes, table.names,
+                   table.hosts, table.authors, table.narrators):
+        assert len(column) == 1
+
+    assert list(table.offsets) == [0, 0]
+
+
+def test_AudioTable_frozen():
+    """
+    **GIVEN** frozen audio files of every type and an Audio\n
+    **WHEN** they are appended to an AudioTable\n
+    **THEN** check that the frozen audio files are added as their mutable class and the Audio is rejected.
+    """
+    metadata = sample_metadata()
+    table = AudioTable()
+
+    for audiofile in AudioTable.from_metadata(metadata):
+        table.append(audiofile.freeze())
+
+    assert [type(row) for row in table] == [Song, Podcast, Podcast, Audiobook]
+    assert table.to_dicts() == metadata
+
+    with pytest.raises(MetadataValueError) as error:
+        table.append(Audio(metadata={"name": "sample-audio", "duration": 45}))
+
+    assert str(error.value) == "'Audio' is not supported"
+    assert len(table) == 4
@@ -0,0 +1,82 @@
+"""
+Unit Test Module for the module codec
+Test Framework: pyTest
+"""
+import pytest
+from audiofiles import Audio, Song, Podcast, Audiobook
+from audiofiles import MetadataValueError
+from audiofiles.codec import pack, unpack, pack_batch, unpack_batch
+
+
+AUDIOFILES = [
+    Song(metadata={"name": "sample-song", "duration": 45}),
+    Song.from_document({"_id": -5, "type": "Song", "name": "söng", "duration": 0,
+                        "uploadtime": "1960-01-01T00:00:00.000001-03:00"}),
+    Song(metadata={"_id": 1 << 70, "name": "sample-song", "duration": 1 << 65}),
+    Podcast(metadata={"name": "sample-podcast", "duration": 45, "host": "host1",
+                      "participants": ["cast1", "cast2"], "uploadtime": "2021-01-01T10:00:00+05:30"}),
+    Podcast(metadata={"name": "sample-podcast", "duration": 45, "host": "host1"}),
+    Audiobook(metadata={"name": "sample-book", "duration": 45, "author": "author1",
+                        "narrator": "narrator1", "genre": ["fiction"]}),
+]
+
+
+@pytest.mark.parametrize("audiofile", AUDIOFILES)
+def test_codec_roundtrip(audiofile):
+    """
+    **GIVEN** a Song, Podcast or Audiobook\n
+    **WHEN** it is packed and unpacked\n
+    **THEN** check that the decoded object and its metadata are equal to the original.
+    """
+    encoded = pack(audiofile)
+    decoded = unpack(encoded)
+
+    assert type(decoded) is type(audiofile)
+    assert decoded == audiofile
+    assert decoded.metadata == audiofile.metadata
+    assert len(encoded) < len(str(audiofile))
+
+
+def test_codec_batch():
+    """
+    **GIVEN** a list of Songs, Podcasts and Audiobooks\n
+    **WHEN** they are packed into a single buffer and unpacked from a memoryview of it\n
+    **THEN** check that the decoded objects are equal to the originals.
+    """
+    encoded = pack_batch(AUDIOFILES)
+
+    assert unpack_batch(memoryview(encoded)) == AUDIOFILES
+    assert unpack_batch(pack_batch([])) == []
+
+
+def test_codec_invalid():
+    """
+    **GIVEN** objects and buffers that cannot be encoded or decoded\n
+    **WHEN** they are packed or unpacked\n
+    **THEN** check that a MetadataValueError is raised with the appropriate error.
+    """
+    encoded = pack(AUDIOFILES[3])
+
+    with pytest.raises(MetadataValueError) as error:
+        pack(Audio(metadata={"name": "sample-audio", "duration": 45}))
+    assert str(error.value) == "'Audio' is not supported"
+
+    with pytest.raises(MetadataValueError) as error:
+        unpack(encoded[:10])
+    assert str(error.value) == "encoded metadata is invalid - truncated header"
+
+    with pytest.raises(MetadataValueError) as error:
+        unpack(encoded[:-1])
+    assert str(error.value) == "encoded metadata is invalid - str out of range"
+
+    with pytest.raises(MetadataValueError) as error:
+        unpack(encoded + b"\x00")
+    assert str(error.value) == "encoded metadata is invalid - trailing bytes"
+
+    with pytest.raises(MetadataValueError) as error:
+        unpack(b"\x02" + encoded[1:])
+    assert str(error.value) == "encoded metadata is invalid - unsupported version 2"
+
+    with pytest.raises(MetadataValueError) as error:
+        unpack(encoded[:1] + b"\x09" + encoded[2:])
+    assert str(error.value) == "encoded metadata is invalid - unsupported type code 9"
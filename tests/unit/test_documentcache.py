@@ -0,0 +1,113 @@
+"""
+Unit Test Module for the class DocumentCache
+Test Framework: pyTest
+"""
+from documentcache import DocumentCache
+
+
+class FakeTimer:
+    """ A manually advanced clock for testing expiry """
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_DocumentCache_fetch():
+    """
+    **GIVEN** an empty DocumentCache\n
+    **WHEN** a document is fetched twice\n
+    **THEN** check that the loader is only called once and that the counters are updated.
+    """
+    cache = DocumentCache(maxsize=2, ttl=10)
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return {"_id": 1, "type": "Song"}
+
+    assert cache.fetch(("Song", 1), loader) == {"_id": 1, "type": "Song"}
+    assert cache.fetch(("Song", 1), loader) == {"_id": 1, "type": "Song"}
+
+    assert len(calls) == 1
+    assert cache.stats() == {"size": 1, "maxsize": 2, "hits": 1, "misses": 1,
+                             "evictions": 0, "expirations": 0}
+
+    # Documents that are not found are not cached
+    assert cache.fetch(("Song", 2), lambda: None) is None
+    assert len(cache) == 1
+
+
+def test_DocumentCache_lru_eviction():
+    """
+    **GIVEN** a full DocumentCache\n
+    **WHEN** a new document is cached\n
+    **THEN** check that the least recently used document is evicted.
+    """
+    cache = DocumentCache(maxsize=2, ttl=10)
+
+    cache.put(("Song", 1), {"_id": 1})
+    cache.put(("Song", 2), {"_id": 2})
+    assert cache.get(("Song", 1)) == {"_id": 1}
+
+    cache.put(("Song", 3), {"_id": 3})
+
+    assert cache.get(("Song", 2)) is None
+    assert cache.get(("Song", 1)) == {"_id": 1}
+    assert cache.get(("Song", 3)) == {"_id": 3}
+    assert cache.evictions == 1
+
+
+def test_DocumentCache_ttl():
+    """
+    **GIVEN** a DocumentCache with a cached document\n
+    **WHEN** the TTL of the document passes\n
+    **THEN** check that the document is treated as a miss and dropped.
+    """
+    timer = FakeTimer()
+    cache = DocumentCache(maxsize=2, ttl=10, timer=timer)
+
+    cache.put(("Podcast", 1), {"_id": 1})
+
+    timer.now = 9.9
+    assert cache.get(("Podcast", 1)) == {"_id": 1}
+
+    timer.now = 10.0
+    assert cache.get(("Podcast", 1)) is None
+    assert cache.expirations == 1
+    assert len(cache) == 0
+
+
+def test_DocumentCache_invalidate():
+    """
+    **GIVEN** a DocumentCache with a cached document\n
+    **WHEN** the document is invalidated, including while it is being loaded\n
+    **THEN** check that the document is removed and that the racing load is not cached.
+    """
+    cache = DocumentCache(maxsize=2, ttl=10)
+
+    cache.put(("Audiobook", 1), {"_id": 1})
+    cache.invalidate(("Audiobook", 1))
+
+    assert cache.get(("Audiobook", 1)) is None
+
+    def racing_loader():
+        cache.invalidate(("Audiobook", 1))
+        return {"_id": 1, "name": "stale"}
+
+    assert cache.fetch(("Audiobook", 1), racing_loader) == {"_id": 1, "name": "stale"}
+    assert len(cache) == 0
+
+
+def test_DocumentCache_disabled():
+    """
+    **GIVEN** a DocumentCache with a maxsize of 0\n
+    **WHEN** a document is cached\n
+    **THEN** check that nothing is stored.
+    """
+    cache = DocumentCache(maxsize=0, ttl=10)
+    cache.put(("Song", 1), {"_id": 1})
+
+    assert len(cache) == 0
+    assert cache.get(("Song", 1)) is None
@@ -0,0 +1,85 @@
+"""
+Unit Test Module for the frozen variants of the Audio type classes
+Test Framework: pyTest
+"""
+import copy
+import pickle
+
+import pytest
+from audiofiles import Song, Podcast, Audiobook
+from audiofiles import FrozenSong, FrozenPodcast, FrozenAudiobook
+from audiofiles import pack, unpack
+
+
+def test_Frozen():
+    """
+    **GIVEN** a valid Podcast\n
+    **WHEN** it is frozen\n
+    **THEN** check that the frozen copy has the same metadata, tuple participants and cannot be changed.
+    """
+    podcast = Podcast(metadata={"name": "sample-podcast", "duration": 45, "host": "host1",
+                                "participants": ["cast1", "cast2"]})
+    frozen = podcast.freeze()
+
+    assert isinstance(frozen, FrozenPodcast)
+    assert isinstance(frozen, Podcast)
+    assert frozen.participants == ("cast1", "cast2")
+    assert frozen.metadata == podcast.metadata
+    assert frozen.freeze() is frozen
+    assert frozen.thaw() == podcast
+
+    with pytest.raises(AttributeError):
+        frozen.name = "changed"
+
+    with pytest.raises(AttributeError):
+        del frozen.host
+
+    assert unpack(pack(frozen)) == podcast
+
+
+def test_Frozen_hash():
+    """
+    **GIVEN** frozen audio files created in different ways\n
+    **WHEN** they are hashed, compared and deduplicated with a set\n
+    **THEN** check that equal validated fields give equal frozen audio files.
+    """
+    metadata = {"_id": 23214241, "name": "sample-song", "duration": 45, "uploadtime": "2021-01-01T00:00:00"}
+
+    first = Song(metadata=metadata).freeze()
+    second = FrozenSong(metadata=metadata)
+    third = FrozenSong.from_document({**metadata, "type": "Song", "genre": "jazz"})
+    other = FrozenSong(metadata={**metadata, "duration": 46})
+
+    assert first == second == third
+    assert hash(first) == hash(second) == hash(third)
+    assert first != other
+    assert len({first, second, third, other}) == 2
+
+    book = FrozenAudiobook(metadata={**metadata, "author": "author1", "narrator": "narrator1"})
+    assert book != first
+    assert {first: 1, book: 2}[second] == 1
+
+    with pytest.raises(TypeError):
+        hash(Song(metadata=metadata))
+
+
+@pytest.mark.parametrize("frozen", [
+    FrozenSong({"name": "sample-song", "duration": 45}),
+    FrozenPodcast({"name": "sample-podcast", "duration": 45, "host": "host1", "participants": ["cast1"]}),
+    FrozenPodcast({"name": "sample-podcast", "duration": 45, "host": "host1"}),
+    FrozenAudiobook({"name": "sample-book", "duration": 45, "author": "author1", "narrator": "narrator1",
+                     "uploadtime": "2021-01-01T10:00:00+05:30", "genre": ["fiction"]}),
+])
+def test_Frozen_copy(frozen):
+    """
+    **GIVEN** a frozen audio file of every type\n
+    **WHEN** it is pickled, copied and deep copied\n
+    **THEN** check that every copy is a frozen audio file of the same class that is equal, has the
+    same hash and the same metadata.
+    """
+    for duplicate in [pickle.loads(pickle.dumps(frozen)), copy.copy(frozen), copy.deepcopy(frozen)]:
+        assert type(duplicate) is type(frozen)
+        assert duplicate == frozen
+        assert hash(duplicate) == hash(frozen)
+        assert duplicate.metadata == frozen.metadata
+        assert str(duplicate) == str(frozen)
@@ -0,0 +1,126 @@
+"""
+Unit Test Module for the class IDGenerator
+Test Framework: pyTest
+"""
+import os
+import socket
+import pytest
+from audiofiles.idgenerator import IDGenerator, EPOCH, MAX_SEQUENCE, MAX_WORKER
+from audiofiles.idgenerator import configured_worker, host_worker
+
+
+class Clock:
+    """ A settable clock in nanoseconds """
+    def __init__(self, millis: int):
+        self.millis = millis
+
+    def __call__(self) -> int:
+        return self.millis * 1000000
+
+
+def test_IDGenerator_layout():
+    """
+    **GIVEN** an IDGenerator with a fixed clock and worker\n
+    **WHEN** IDs are generated\n
+    **THEN** check that they are made up of the timestamp, worker and sequence.
+    """
+    generator = IDGenerator(worker=5, clock=Clock(EPOCH + 1000))
+
+    assert generator.next_id() == (1000 << 22) | (5 << 12) | 0
+    assert generator.next_id() == (1000 << 22) | (5 << 12) | 1
+    assert IDGenerator(worker=6, clock=Clock(EPOCH + 1000)).next_id() == (1000 << 22) | (6 << 12)
+
+    with pytest.raises(ValueError):
+        IDGenerator(worker=1024)
+
+
+def test_IDGenerator_monotonic():
+    """
+    **GIVEN** an IDGenerator with a clock that stops and goes backwards\n
+    **WHEN** more IDs than the sequence holds are generated\n
+    **THEN** check that the IDs are unique and strictly increasing.
+    """
+    clock = Clock(EPOCH + 1000)
+    generator = IDGenerator(worker=1, clock=clock)
+
+    ids = [generator.next_id() for _ in range(MAX_SEQUENCE + 10)]
+    clock.millis -= 500
+    ids += [generator.next_id() for _ in range(10)]
+
+    assert ids == sorted(set(ids))
+    assert all(0 < ID < 2 ** 63 for ID in ids)
+
+
+def test_IDGenerator_next_ids():
+    """
+    **GIVEN** an IDGenerator with a fixed clock\n
+    **WHEN** blocks of IDs are reserved between single IDs\n
+    **THEN** check that all IDs are unique, strictly increasing and of the requested count.
+    """
+    generator = IDGenerator(worker=2, clock=Clock(EPOCH + 1000))
+
+    ids = [generator.next_id()]
+    ids += generator.next_ids(3 * MAX_SEQUENCE)
+    ids += [generator.next_id()]
+    ids += generator.next_ids(5)
+
+    assert len(ids) == 3 * MAX_SEQUENCE + 7
+    assert ids == sorted(set(ids))
+    assert generator.next_ids(0) == []
+
+
+def test_IDGenerator_default_worker(monkeypatch):
+    """
+    **GIVEN** an IDGenerator without a worker number\n
+    **WHEN** the AUDIOSERVERWORKERID environment variable and the host name are changed\n
+    **THEN** check that the worker number is configured, derived from the host and process or fails loudly.
+    """
+    monkeypatch.setenv("AUDIOSERVERWORKERID", "17")
+    assert configured_worker() == 17
+    assert IDGenerator().worker == 17
+
+    for value in ("1024", "-1", "worker"):
+        monkeypatch.setenv("AUDIOSERVERWORKERID", value)
+
+        with pytest.raises(ValueError):
+            IDGenerator()
+
+    monkeypatch.delenv("AUDIOSERVERWORKERID")
+    assert configured_worker() is None
+
+    monkeypatch.setattr(socket, "gethostname", lambda: "host-a")
+    first = IDGenerator().worker
+    assert first == (host_worker() + os.getpid()) & MAX_WORKER
+
+    monkeypatch.setattr(socket, "gethostname", lambda: "host-b")
+    assert IDGenerator().worker != first
+
+    monkeypatch.setattr(socket, "gethostname", lambda: "")
+
+    with pytest.raises(RuntimeError):
+        IDGenerator()
+
+    assert IDGenerator(worker=3).worker == 3
+
+
+def test_IDGenerator_lazy(monkeypatch):
+    """
+    **GIVEN** a lazy IDGenerator without a worker number
+
+    **WHEN** it is created with an invalid AUDIOSERVERWORKERID and used after the variable is changed
+
+    **THEN** check that it is created and only resolves its worker number on first use.
+    """
+    monkeypatch.setenv("AUDIOSERVERWORKERID", "worker")
+    generator = IDGenerator(clock=Clock(EPOCH + 1000), lazy=True)
+
+    with pytest.raises(ValueError):
+        generator.next_id()
+
+    monkeypatch.setenv("AUDIOSERVERWORKERID", "9")
+    assert generator.next_ids(2) == [(1000 << 22) | (9 << 12), (1000 << 22) | (9 << 12) | 1]
+    assert generator.worker == 9
+
+    generator._after_fork()
+    monkeypatch.setenv("AUDIOSERVERWORKERID", "10")
+    assert generator.worker == 10
@@ -0,0 +1,74 @@
+"""
+Unit Test Module for the class StringPool and the interning of audio file fields
+Test Framework: pyTest
+"""
+import pytest
+from audiofiles import Song, Podcast, Audiobook
+from audiofiles import StringPool, enable_interning, disable_interning
+from audiofiles import pack, unpack
+
+
+@pytest.fixture
+def pool():
+    """ A fixture that enables interning with a new pool for a test """
+    yield enable_interning(maxsize=16)
+    disable_interning()
+
+
+def test_StringPool():
+    """
+    **GIVEN** a StringPool with a maximum size\n
+    **WHEN** strings are interned\n
+    **THEN** check that equal strings return the same object and the pool evicts the least recently used.
+    """
+    pool = StringPool(maxsize=2)
+    first = "".join(["ho", "st"])
+    second = "".join(["ho", "st"])
+
+    assert first is not second
+    assert pool.intern(first) is first
+    assert pool.intern(second) is first
+    assert pool.intern_all(["a", second]) == ["a", "host"]
+
+    pool.intern("b")
+
+    assert len(pool) == 2
+    assert pool.stats() == {"size": 2, "maxsize": 2, "hits": 2, "misses": 3, "evictions": 1}
+
+    # The least recently interned string was evicted, not the first one that was pooled
+    assert pool.intern("".join(["ho", "st"])) is first
+    assert pool.intern("a") == "a"
+    assert pool.stats()["evictions"] == 2
+    assert pool.intern("host") is first
+
+    pool.clear()
+    assert len(pool) == 0
+
+
+def test_interning(pool):
+    """
+    **GIVEN** interning is enabled\n
+    **WHEN** Podcasts and Audiobooks are created, loaded and decoded with equal field values\n
+    **THEN** check that they share a single object for every repeated value.
+    """
+    host = "".join(["host", "1"])
+    podcasts = [
+        Podcast(metadata={"name": "sample-podcast", "duration": 45, "host": "".join(["host", "1"]),
+                          "participants": ["".join(["cast", "1"])]}),
+        Podcast.from_document({"_id": 1, "type": "Podcast", "name": "sample-podcast", "duration": 45,
+                               "uploadtime": "2021-01-01T00:00:00", "host": host, "participants": ["cast1"]}),
+    ]
+    podcasts.append(unpack(pack(podcasts[0])))
+
+    assert all(podcast.host is podcasts[0].host for podcast in podcasts)
+    assert all(podcast.participants[0] is podcasts[0].participants[0] for podcast in podcasts)
+
+    books = [Audiobook(metadata={"name": "sample-book", "duration": 45, "author": "".join(["auth", "or"]),
+                                 "narrator": "".join(["auth", "or"])}) for _ in range(2)]
+
+    assert books[0].author is books[1].author is books[0].narrator
+    assert pool.stats()['hits'] == 7
+
+    # Songs have no interned fields and other fields are never interned
+    song = Song(metadata={"name": "".join(["host", "1"]), "duration": 45})
+    assert song.name is not podcasts[0].host
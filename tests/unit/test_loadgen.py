@@ -0,0 +1,176 @@
+"""
+Unit Test Module for the load generator of the benchmarks package
+Test Framework: pyTest
+"""
+import pytest
+import threading
+
+from benchmarks import LoadGenerator, parseMix, percentile
+from benchmarks.__main__ import parseArguments, gunicornWorkers
+
+
+class FakeTransport:
+    """ A transport that answers every request like the AudioServer and records it. The files
+    in 'missing' are answered as not found. """
+    def __init__(self, missing=()):
+        self.requests = []
+        self.lock = threading.Lock()
+        self.nextID = 0
+        self.missing = set(missing)
+
+    def request(self, method, path, body=None):
+        with self.lock:
+            self.requests.append((method, path))
+
+            if path == "/create/batch":
+                self.nextID += len(body)
+                results = [{"status": 200, "document": self.nextID - index} for index in range(len(body))]
+                return 200, {"results": results}
+
+            if path == "/create":
+                self.nextID += 1
+                return 200, {"document": self.nextID}
+
+        action, _, audioID = path.rsplit('/', 2)
+        audioID = int(audioID) if audioID.isdigit() else None
+
+        if audioID in self.missing:
+            if action == "/update":
+                return 400, {"status": 400, "error": f"No document found for ID - {audioID}"}
+
+            if action == "/delete":
+                return 200, {"status": 200, "result": "No document deleted"}
+
+            return 200, {"status": 200, "documents": [], "matches": 0}
+
+        if action == "/get":
+            return 200, {"status": 200, "documents": [{"_id": audioID}], "matches": 1}
+
+        return 200, {"status": 200, "document": audioID}
+
+    def close(self):
+        pass
+
+
+def test_parseMix():
+    """
+    **GIVEN** a str of operation weights\n
+    **WHEN** it is parsed as a mix\n
+    **THEN** check that the weights are parsed and invalid mixes are rejected.
+    """
+    assert parseMix("create=1,get-one=8.5,delete") == {"create": 1.0, "get-one": 8.5, "delete": 1.0}
+
+    with pytest.raises(ValueError):
+        parseMix("create=1,search=2")
+
+    with pytest.raises(ValueError):
+        parseMix("create=-1")
+
+    with pytest.raises(ValueError):
+        parseMix("create=0,update=0")
+
+
+def test_percentile():
+    """
+    **GIVEN** a sorted list of latencies\n
+    **WHEN** its percentiles are computed\n
+    **THEN** check that the nearest-rank values are returned.
+    """
+    latencies = [float(value) for value in range(1, 101)]
+
+    assert percentile(latencies, 50) == 50.0
+    assert percentile(latencies, 95) == 95.0
+    assert percentile(latencies, 99) == 99.0
+    assert percentile(latencies, 100) == 100.0
+    assert percentile([3.0], 99) == 3.0
+    assert percentile([], 50) == 0.0
+
+
+def test_LoadGenerator_run():
+    """
+    **GIVEN** a LoadGenerator with a mix of operations\n
+    **WHEN** it is seeded and run with several threads\n
+    **THEN** check that every request is sent and reported by operation.
+    """
+    transport = FakeTransport()
+    generator = LoadGenerator(transport, {"create": 1, "get-one": 2, "update": 1, "delete": 1, "get-all": 1},
+                              concurrency=4, seed=1)
+
+    generator.seed(50)
+    report = generator.run(300)
+
+    assert len(transport.requests) == 301
+    assert report["requests"] == 300
+    assert report["errors"] == 0
+    assert sum(stats["requests"] for stats in report["operations"].values()) == 300
+
+    for stats in report["operations"].values():
+        assert stats["p50_ms"] <= stats["p95_ms"] <= stats["p99_ms"] <= stats["max_ms"]
+
+    methods = {method for method, _ in transport.requests}
+    assert methods == {"GET", "POST", "PATCH"}
+
+
+@pytest.mark.parametrize("operation", ["get-one", "update", "delete"])
+def test_LoadGenerator_missing(operation):
+    """
+    **GIVEN** a LoadGenerator over files that the server does not find\n
+    **WHEN** it is run with a get-one, update or delete operation\n
+    **THEN** check that every request is counted as an error, even when the server answers with a 200.
+    """
+    transport = FakeTransport(missing=range(1, 11))
+    generator = LoadGenerator(transport, {operation: 1}, concurrency=2, seed=1)
+
+    generator.seed(10)
+    report = generator.run(5)
+
+    assert report["errors"] == 5
+    assert report["operations"][operation]["errors"] == 5
+
+
+@pytest.mark.parametrize("operation", ["get-one", "update", "delete"])
+def test_LoadGenerator_skipped(operation):
+    """
+    **GIVEN** a LoadGenerator that knows no IDs
+
+    **WHEN** it is run with a get-one, update or delete operation
+
+    **THEN** check that no request is sent and the operations are skipped instead of counted as errors.
+    """
+    transport = FakeTransport()
+    generator = LoadGenerator(transport, {operation: 1, "get-all": 1}, concurrency=2, seed=1)
+
+    report = generator.run(20)
+    stats = report["operations"][operation]
+
+    assert (stats["requests"], stats["errors"], stats["max_ms"]) == (0, 0, 0.0)
+    assert stats["skipped"] == report["skipped"] > 0
+    assert report["requests"] == len(transport.requests) == 20 - report["skipped"]
+    assert report["errors"] == 0
+
+
+def test_gunicornWorkers(monkeypatch):
+    """
+    **GIVEN** the arguments of a local gunicorn server\n
+    **WHEN** its number of workers is read and a load test is configured with them\n
+    **THEN** check that the workers are read from every form of the option or the WORKERS variable and
+    that the in-memory storage backend is refused with more than one worker.
+    """
+    monkeypatch.delenv('WORKERS', raising=False)
+
+    assert gunicornWorkers("--threads 4") == 1
+    assert gunicornWorkers("--workers 3 --threads 4") == 3
+    assert gunicornWorkers("-w 2") == 2
+    assert gunicornWorkers("-w4") == 4
+    assert gunicornWorkers("--workers=5") == 5
+
+    monkeypatch.setenv('WORKERS', "2")
+    assert gunicornWorkers("--config gunicorn.conf.py") == 2
+    assert gunicornWorkers("--workers 1") == 1
+
+    assert parseArguments(["--gunicorn", "--workers 1"]).storage == "memory"
+    assert parseArguments(["--storage", "mongo", "--gunicorn", "--workers 2"]).storage == "mongo"
+
+    for arguments in ["--workers 2", "--threads 8", "--workers two"]:
+        with pytest.raises(SystemExit):
+            parseArguments(["--gunicorn", arguments])
@@ -0,0 +1,44 @@
+"""
+Unit Test Module for the microbenchmarks of the benchmarks package
+Test Framework: pyTest
+"""
+from benchmarks.micro import compareResults, bestResult, runBenchmark, BENCHMARKS
+
+
+def test_compareResults():
+    """
+    **GIVEN** the baseline of a benchmark\n
+    **WHEN** results are compared with it\n
+    **THEN** check that only changes beyond the tolerance are reported as regressions.
+    """
+    baseline = {"ops_per_sec": 1000, "allocations": 2.0, "bytes": 100.0}
+
+    assert compareResults(baseline, {"ops_per_sec": 850, "allocations": 2.0, "bytes": 100.0}, 20) == []
+    assert compareResults(baseline, {"ops_per_sec": 2000, "allocations": 1.0, "bytes": 50.0}, 20) == []
+
+    regressions = compareResults(baseline, {"ops_per_sec": 700, "allocations": 4.0, "bytes": 150.0}, 20)
+    assert len(regressions) == 3
+    assert regressions[0] == "ops_per_sec 700 is 30.0% below the baseline 1000"
+
+    # Memory near zero is allowed some slack
+    assert compareResults({"ops_per_sec": 1, "allocations": 0.0, "bytes": 0.1},
+                          {"ops_per_sec": 1, "allocations": 0.02, "bytes": 8.0}, 20) == []
+
+
+def test_runBenchmark():
+    """
+    **GIVEN** the microbenchmarks of the audiofiles package\n
+    **WHEN** a construction benchmark is run twice\n
+    **THEN** check that it reports speed and memory and that the best of its results is kept.
+    """
+    assert {"Song", "Podcast", "Audiobook", "validate_string", "validate_duration", "validate_participants",
+            "validate_song", "validate_podcast", "validate_audiobook", "str"} <= set(BENCHMARKS)
+
+    first, second = runBenchmark("Song"), runBenchmark("Song")
+    best = bestResult([first, second])
+
+    assert first["ops_per_sec"] > 0
+    assert first["allocations"] >= 1
+    assert first["bytes"] > 0
+    assert best["ops_per_sec"] == max(first["ops_per_sec"], second["ops_per_sec"])
+    assert best["bytes"] == min(first["bytes"], second["bytes"])
@@ -25,7 +25,7 @@ def test_Podcast():
     assert isinstance(podcast.metadata, dict)
     assert isinstance(podcast.uploadtime, datetime.datetime)
 
-    assert podcast.ID == abs(hash(f"sample-podcast-45-{podcast.uploadtime.isoformat()}"))
+    assert 0 < podcast.ID < 2 ** 63
     assert podcast.name == "sample-podcast"
     assert podcast.host == "Manish"
     assert podcast.participants == []
@@ -50,7 +50,7 @@ def test_Podcast_participants():
     assert isinstance(podcast.metadata, dict)
     assert isinstance(podcast.uploadtime, datetime.datetime)
 
-    assert podcast.ID == abs(hash(f"sample-podcast-45-{podcast.uploadtime.isoformat()}"))
+    assert 0 < podcast.ID < 2 ** 63
     assert podcast.name == "sample-podcast"
     assert podcast.host == "host1"
     assert podcast.participants == ["cast1", "cast2"]
@@ -196,7 +196,7 @@ def test_Podcast_extra_uploadtime():
     assert isinstance(podcast.metadata, dict)
     assert isinstance(podcast.uploadtime, datetime.datetime)
 
-    assert podcast.ID == abs(hash(f"sample-podcast-45-2021-01-01T00:00:00"))
+    assert 0 < podcast.ID < 2 ** 63
     assert podcast.name == "sample-podcast"
     assert podcast.host == "host1"
     assert podcast.participants == []
@@ -269,7 +269,7 @@ def test_Podcast_extra_type():
     assert isinstance(podcast.metadata, dict)
     assert isinstance(podcast.uploadtime, datetime.datetime)
 
-    assert podcast.ID == abs(hash(f"sample-podcast-45-{podcast.uploadtime.isoformat()}"))
+    assert 0 < podcast.ID < 2 ** 63
     assert podcast.name == "sample-podcast"
     assert podcast.host == "host1"
     assert podcast.participants == []
@@ -288,7 +288,7 @@ def test_Podcast_extra_type():
     assert isinstance(podcast.metadata, dict)
     assert isinstance(podcast.uploadtime, datetime.datetime)
 
-    assert podcast.ID == abs(hash(f"sample-podcast-45-{podcast.uploadtime.isoformat()}"))
+    assert 0 < podcast.ID < 2 ** 63
     assert podcast.name == "sample-podcast"
     assert podcast.host == "host1"
     assert podcast.participants == []
@@ -307,9 +307,26 @@ def test_Podcast_extra_type():
     assert isinstance(podcast.metadata, dict)
     assert isinstance(podcast.uploadtime, datetime.datetime)
 
-    assert podcast.ID == abs(hash(f"sample-podcast-45-{podcast.uploadtime.isoformat()}"))
+    assert 0 < podcast.ID < 2 ** 63
     assert podcast.name == "sample-podcast"
     assert podcast.duration == 45
 
     assert isinstance(podcast.metadata['type'], str)
     assert podcast.metadata['type'] == "Podcast"
+
+
+def test_Podcast_from_document():
+    """
+    **GIVEN** stored documents of a Podcast with and without participants\n
+    **WHEN** Podcasts are created from them with from_document\n
+    **THEN** check that they equal validated Podcasts.
+    """
+    document = {"_id": 23214241, "type": "Podcast", "name": "sample-podcast", "duration": 45,
+                "uploadtime": "2021-01-01T00:00:00", "host": "host1", "participants": ["cast1"]}
+
+    assert Podcast.from_document(document) == Podcast(metadata=document)
+    assert Podcast.from_document(document).metadata == document
+
+    del document['participants']
+    assert Podcast.from_document(document).participants == []
+    assert Podcast.from_document(document) == Podcast(metadata=document)
@@ -0,0 +1,70 @@
+"""
+Unit Test Module for the module schema
+Test Framework: pyTest
+"""
+import pytest
+from datetime import datetime
+from audiofiles import Field, SCHEMAS, MetadataValueError
+from audiofiles.schema import compile_validator, compile_dumper, ISOFORMAT
+
+
+class Record:
+    """ A plain class to hold the attributes set by a compiled validator """
+    pass
+
+
+@pytest.mark.parametrize("field, value, result", [
+    (Field("name", "str", maxlength=5), "abc", (True, "null")),
+    (Field("name", "str", maxlength=5), "abcdef", (False, "str too long")),
+    (Field("name", "str", maxlength=5), 5, (False, "not an str")),
+    (Field("duration", "int", minimum=0), -1, (False, "not positive")),
+    (Field("duration", "int", minimum=0), 10, (True, "null")),
+])
+def test_Field_check(field, value, result):
+    """
+    **GIVEN** a Field declaration\n
+    **WHEN** a value is checked\n
+    **THEN** check that the validity bool and error str are correct.
+    """
+    assert field.check(value) == result
+
+
+def test_compile_validator():
+    """
+    **GIVEN** the Podcast schema\n
+    **WHEN** a validator and a dumper are compiled from it\n
+    **THEN** check that metadata is validated, converted and dumped in field order.
+    """
+    validate = compile_validator(SCHEMAS["Podcast"], "validate_podcast")
+    dump = compile_dumper(SCHEMAS["Podcast"], "dump_podcast")
+
+    record = Record()
+    validate(record, {"name": "sample", "duration": 45, "host": "host1",
+                      "uploadtime": "2021-03-04T12:00:00", "_id": 7})
+
+    assert record._uploadtime == datetime(2021, 3, 4, 12)
+    assert record.participants == []
+    assert record.type == "Podcast"
+    assert record._omitted == ("participants",)
+    assert list(dump(record)) == ["name", "duration", "host", "type", "uploadtime", "_id"]
+
+    record.participants.append("cast1")
+    assert list(dump(record)) == ["name", "duration", "host", "participants", "type", "uploadtime", "_id"]
+
+    with pytest.raises(MetadataValueError, match="metadata value is missing for 'host'"):
+        validate(Record(), {"name": "sample", "duration": 45})
+
+
+@pytest.mark.parametrize("value", [
+    "2021-01-01T00:00:00", "2021-01-01T10:11:12.123456", "2021-01-01T10:11:12+05:30",
+    "2021-01-01T10:11:12.000001-08:00", "2021-01-01T10:11:12+00:00:30.500000", "2021-01-01",
+    "2021-01-01 00:00:00", "2021-01-01T00:00", "2021-01-01T00:00:00.000000", "2021-01-01T00:00:00.123",
+    "2021-01-01T00:00:00-00:00", "2021-01-01T00:00:00+05:30:00",
+])
+def test_ISOFORMAT(value):
+    """
+    **GIVEN** an ISO8601 str\n
+    **WHEN** it is matched with the ISOFORMAT pattern\n
+    **THEN** check that it only matches strs that datetime.isoformat returns unchanged.
+    """
+    assert bool(ISOFORMAT.fullmatch(value)) == (datetime.fromisoformat(value).isoformat() == value)
@@ -0,0 +1,266 @@
+"""
+Unit Test Module for the class SlowOperationLog
+Test Framework: pyTest
+"""
+import os
+import json
+import threading
+
+import pytest
+
+from slowlog import SlowOperationLog, planStages, processPath
+from audiostorage import MongoStorage
+
+PLAN = {"queryPlanner": {"winningPlan": {"stage": "FETCH", "inputStage": {"stage": "COLLSCAN"}}}}
+
+
+class FakeTimer:
+    """ A manually advanced clock for testing the rate limit """
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeDatabase:
+    """ A database that answers explain commands with a fixed plan """
+    def __init__(self):
+        self.commands = []
+
+    def command(self, name, command, verbosity):
+        self.commands.append((name, command, verbosity))
+        return PLAN
+
+
+class FakeCursor:
+    """ A cursor over a list of documents """
+    def __init__(self, documents):
+        self.documents = iter(documents)
+        self.closed = False
+
+    def __next__(self):
+        return next(self.documents)
+
+    def sort(self, key, direction):
+        return self
+
+    def limit(self, limit):
+        return self
+
+    def close(self):
+        self.closed = True
+
+
+class FakeCollection:
+    """ A collection with a few documents of a single type """
+    name = "audiofiles"
+
+    def __init__(self):
+        self.database = FakeDatabase()
+        self.documents = [{"_id": 1, "type": "Song"}, {"_id": 2, "type": "Song"}]
+
+    def find(self, search, projection=None):
+        return FakeCursor(self.documents)
+
+    def find_one(self, search, projection=None):
+        return self.documents[0]
+
+    def find_one_and_replace(self, search, replacement):
+        raise TimeoutError("operation exceeded time limit")
+
+    def find_one_and_delete(self, search):
+        return None
+
+
+def readRecords(path) -> list:
+    """ A function that reads the records of a slow operation log written by this process """
+    with open(processPath(str(path), os.getpid())) as file:
+        return [json.loads(line) for line in file]
+
+
+def test_planStages():
+    """
+    **GIVEN** a query plan with nested input stages\n
+    **WHEN** its stages are listed\n
+    **THEN** check that they are listed from the root stage to the leaf stages.
+    """
+    plan = {"stage": "SORT_MERGE", "inputStages": [{"stage": "IXSCAN"}, {"stage": "FETCH", "inputStage": {"stage": "IXSCAN"}}]}
+
+    assert planStages(plan) == ["SORT_MERGE", "IXSCAN", "FETCH", "IXSCAN"]
+    assert planStages({}) == []
+
+
+def test_processPath():
+    """
+    **GIVEN** the path of a slow operation log
+
+    **WHEN** the path of the log file of a process is built
+
+    **THEN** check that the pid of the process is inserted before the extension.
+    """
+    assert processPath("/var/log/slow.log", 1234) == "/var/log/slow.1234.log"
+    assert processPath("slow", 1234) == "slow.1234"
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="os.fork is not available")
+def test_SlowOperationLog_fork(tmp_path):
+    """
+    **GIVEN** a SlowOperationLog that recorded an operation
+
+    **WHEN** a forked process records an operation
+
+    **THEN** check that each process writes its records to its own log file.
+    """
+    slowlog = SlowOperationLog(str(tmp_path / "slow.log"), threshold=0, interval=0)
+    assert slowlog.observe("find", {"type": "Song"}, 0.2, 1, lambda: PLAN)
+    slowlog.flush()
+
+    pid = os.fork()
+    if pid == 0:
+        try:
+            slowlog.observe("find", {"type": "Podcast"}, 0.2, 1, lambda: PLAN)
+            slowlog.close()
+        finally:
+            os._exit(0)
+
+    os.waitpid(pid, 0)
+    slowlog.close()
+
+    assert [record["filter"] for record in readRecords(tmp_path / "slow.log")] == [{"type": "Song"}]
+    with open(processPath(str(tmp_path / "slow.log"), pid)) as file:
+        assert [json.loads(line)["filter"] for line in file] == [{"type": "Podcast"}]
+
+
+def test_SlowOperationLog_observe(tmp_path):
+    """
+    **GIVEN** a SlowOperationLog with a threshold and an interval\n
+    **WHEN** fast and slow operations are observed\n
+    **THEN** check that only slow operations outside the interval are recorded with their plan.
+    """
+    timer = FakeTimer()
+    explains = []
+
+    def explain():
+        explains.append(1)
+        return PLAN
+
+    slowlog = SlowOperationLog(str(tmp_path / "slow.log"), threshold=0.1, interval=1.0,
+                               context=lambda: "get", timer=timer)
+
+    assert not slowlog.observe("find", {"type": "Song"}, 0.05, 10, explain)
+    assert slowlog.observe("find", {"type": "Song"}, 0.25, 10, explain)
+
+    # Slow operations within the interval are suppressed without an explain
+    timer.now = 0.5
+    assert not slowlog.observe("find", {"type": "Song"}, 0.3, 10, explain)
+
+    timer.now = 1.5
+    assert slowlog.observe("find_one_and_delete", {"type": "Song", "_id": 1}, 0.2, 1, lambda: 1 / 0)
+    slowlog.close()
+
+    assert len(explains) == 1
+    assert (slowlog.recorded, slowlog.suppressed) == (2, 1)
+
+    first, second = readRecords(tmp_path / "slow.log")
+
+    assert first["operation"] == "find"
+    assert first["endpoint"] == "get"
+    assert first["filter"] == {"type": "Song"}
+    assert first["duration_ms"] == 250.0
+    assert first["documents"] == 10
+    assert first["stages"] == ["FETCH", "COLLSCAN"]
+    assert first["suppressed"] == 0
+
+    assert second["operation"] == "find_one_and_delete"
+    assert second["suppressed"] == 1
+    assert second["plan"] is None
+    assert second["error"].startswith("explain failed")
+
+
+def test_MongoStorage_slowlog(tmp_path):
+    """
+    **GIVEN** a MongoStorage with a SlowOperationLog that records every operation\n
+    **WHEN** documents are found and deleted\n
+    **THEN** check that the operations are recorded with their documents and queryPlanner explain.
+    """
+    slowlog = SlowOperationLog(str(tmp_path / "slow.log"), threshold=0, interval=0)
+    collection = FakeCollection()
+    storage = MongoStorage(collection, slowlog)
+
+    assert storage.find_one("Song", 1) == {"_id": 1, "type": "Song"}
+    assert storage.delete("Song", 3) is None
+
+    cursor = storage.find_by_type("Song", after=0, limit=5)
+    assert len(list(cursor)) == 2
+    cursor.close()
+    slowlog.close()
+
+    records = readRecords(tmp_path / "slow.log")
+
+    assert [(record["operation"], record["documents"]) for record in records] == \
+        [("find", 1), ("find_one_and_delete", 0), ("find", 2)]
+    assert records[2]["filter"] == {"type": "Song", "_id": {"$gt": 0}}
+
+    name, command, verbosity = collection.database.commands[-1]
+    assert (name, verbosity) == ("explain", "queryPlanner")
+    assert command == {"find": "audiofiles", "filter": {"type": "Song", "_id": {"$gt": 0}},
+                       "sort": {"_id": 1}, "limit": 5}
+
+
+def test_SlowOperationLog_background(tmp_path):
+    """
+    **GIVEN** a SlowOperationLog with an explain that blocks\n
+    **WHEN** a slow operation and a fast failed operation are observed\n
+    **THEN** check that observe returns before the explain and the failed operation is recorded with its exception.
+    """
+    release = threading.Event()
+
+    def explain():
+        release.wait(5)
+        return PLAN
+
+    slowlog = SlowOperationLog(str(tmp_path / "slow.log"), threshold=0.1, interval=0)
+
+    assert slowlog.observe("find", {"type": "Song"}, 0.2, 1, explain)
+    assert slowlog.observe("find", {"type": "Song"}, 0.01, 0, explain, TimeoutError("timed out"))
+    assert not release.is_set()
+
+    release.set()
+    slowlog.flush()
+
+    first, second = readRecords(tmp_path / "slow.log")
+    slowlog.close()
+
+    assert "exception" not in first
+    assert second["exception"] == "TimeoutError - timed out"
+    assert second["stages"] == ["FETCH", "COLLSCAN"]
+
+
+def test_MongoStorage_slowlog_errors(tmp_path):
+    """
+    **GIVEN** a MongoStorage with a SlowOperationLog and a collection whose replace and cursor fail\n
+    **WHEN** a document is replaced and the documents are read\n
+    **THEN** check that the exceptions are raised and the failed operations are recorded with them.
+    """
+    def failing():
+        yield {"_id": 1, "type": "Song"}
+        raise ConnectionError("connection reset")
+
+    slowlog = SlowOperationLog(str(tmp_path / "slow.log"), threshold=10, interval=0)
+    collection = FakeCollection()
+    collection.find = lambda search, projection=None: FakeCursor(failing())
+    storage = MongoStorage(collection, slowlog)
+
+    with pytest.raises(TimeoutError):
+        storage.replace("Song", 1, {"_id": 1, "type": "Song"})
+
+    with pytest.raises(ConnectionError):
+        list(storage.find_by_type("Song"))
+
+    slowlog.close()
+    records = readRecords(tmp_path / "slow.log")
+
+    assert [(record["operation"], record["documents"], record["exception"]) for record in records] == \
+        [("find_one_and_replace", 0, "TimeoutError - operation exceeded time limit"),
+         ("find", 1, "ConnectionError - connection reset")]
@@ -23,7 +23,7 @@ def test_Song():
     assert isinstance(song.metadata, dict)
     assert isinstance(song.uploadtime, datetime.datetime)
 
-    assert song.ID == abs(hash(f"sample-song-45-{song.uploadtime.isoformat()}"))
+    assert 0 < song.ID < 2 ** 63
     assert song.name == "sample-song"
     assert song.duration == 45
     assert song.metadata['type'] == 'Song'
@@ -102,7 +102,7 @@ def test_Song_extra_uploadtime():
     assert isinstance(song.metadata, dict)
     assert isinstance(song.uploadtime, datetime.datetime)
 
-    assert song.ID == abs(hash(f"sample-song-45-2021-01-01T00:00:00"))
+    assert 0 < song.ID < 2 ** 63
     assert song.name == "sample-song"
     assert song.duration == 45
     assert song.uploadtime == datetime.datetime.fromisoformat("2021-01-01")
@@ -163,7 +163,7 @@ def test_Song_extra_type():
     assert isinstance(song.metadata, dict)
     assert isinstance(song.uploadtime, datetime.datetime)
 
-    assert song.ID == abs(hash(f"sample-song-45-{song.uploadtime.isoformat()}"))
+    assert 0 < song.ID < 2 ** 63
     assert song.name == "sample-song"
     assert song.duration == 45
 
@@ -179,7 +179,7 @@ def test_Song_extra_type():
     assert isinstance(song.metadata, dict)
     assert isinstance(song.uploadtime, datetime.datetime)
 
-    assert song.ID == abs(hash(f"sample-song-45-{song.uploadtime.isoformat()}"))
+    assert 0 < song.ID < 2 ** 63
     assert song.name == "sample-song"
     assert song.duration == 45
 
@@ -195,9 +195,43 @@ def test_Song_extra_type():
     assert isinstance(song.metadata, dict)
     assert isinstance(song.uploadtime, datetime.datetime)
 
-    assert song.ID == abs(hash(f"sample-song-45-{song.uploadtime.isoformat()}"))
+    assert 0 < song.ID < 2 ** 63
     assert song.name == "sample-song"
     assert song.duration == 45
 
     assert isinstance(song.metadata['type'], str)
     assert song.metadata['type'] == "Song"
+
+
+def test_Song_from_document():
+    """
+    **GIVEN** a stored document of a Song\n
+    **WHEN** a Song is created from it with from_document\n
+    **THEN** check that it equals a validated Song and that the upload time is normalized and parsed on access.
+    """
+    document = {"_id": 23214241, "type": "Song", "name": "sample-song", "duration": 45,
+                "uploadtime": "2021-01-01T00:00:00", "genre": "jazz"}
+    song = Song.from_document(document)
+
+    assert song._uploadtime == "2021-01-01T00:00:00"
+    assert song.metadata == document
+    assert song == Song(metadata=document)
+
+    assert song.uploadtime == datetime.datetime(2021, 1, 1)
+    assert song.metadata == document
+
+    with pytest.raises(MetadataValueError) as error:
+        Song.from_document({"_id": 23214241, "name": "sample-song", "duration": 45})
+
+    assert str(error.value) == "metadata value is missing for 'uploadtime'"
+
+    document = {"_id": 23214241, "name": "sample-song", "duration": 45, "uploadtime": "2021-01-01"}
+    song = Song.from_document(document)
+
+    assert song._uploadtime == "2021-01-01T00:00:00"
+    assert song == Song(metadata=document)
+
+    with pytest.raises(MetadataValueError) as error:
+        Song.from_document({**document, "uploadtime": "01/01/2021"})
+
+    assert str(error.value) == "metadata value is invalid for 'uploadtime' - not ISO8601"
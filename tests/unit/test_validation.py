@@ -0,0 +1,65 @@
+"""
+Unit Test Module for the function validate_batch in the audiofiles package
+Test Framework: pyTest
+"""
+import pytest
+from audiofiles import validate_batch, Podcast
+from audiofiles import MetadataValueError
+
+
+def test_validate_batch():
+    """
+    **GIVEN** a list of valid and invalid metadata dictionaries for Podcast\n
+    **WHEN** the list is validated with validate_batch\n
+    **THEN** check that every row has the errors that the Podcast constructor raises.
+    """
+    metadatas = [
+        {"name": "sample-podcast", "duration": 45, "host": "host1"},
+        {"name": "sample-podcast", "duration": 45, "host": "host1", "participants": ["cast1"],
+         "uploadtime": "2021-03-01T10:00:00", "_id": 10},
+        {"duration": -1, "host": 10},
+        {"name": "sample-podcast", "duration": 45, "host": "host1", "participants": "cast1",
+         "uploadtime": "yesterday", "_id": "10"},
+        ["sample-podcast"],
+    ]
+
+    errors = validate_batch("podcast", metadatas)
+
+    assert errors == [
+        [],
+        [],
+        ["metadata value is missing for 'name'",
+         "metadata value is invalid for 'duration' - not positive",
+         "metadata value is invalid for 'host' - not an str"],
+        ["metadata value is invalid for 'uploadtime' - not ISO8601",
+         "metadata value is invalid for '_id' - not an int",
+         "metadata value is invalid for 'participants' - not a list"],
+        ["metadata is invalid - not a dict"],
+    ]
+
+    # The first error of a row is the error raised by the constructor
+    for metadata, row_errors in zip(metadatas[2:4], errors[2:4]):
+        with pytest.raises(MetadataValueError) as error:
+            Podcast(metadata=metadata)
+
+        assert str(error.value) == row_errors[0]
+
+
+def test_validate_batch_types():
+    """
+    **GIVEN** a metadata dictionary that is only valid for Song\n
+    **WHEN** it is validated with validate_batch for every type\n
+    **THEN** check the missing fields of every type and that invalid types raise.
+    """
+    metadata = [{"name": "sample", "duration": 45}]
+
+    assert validate_batch("Song", metadata) == [[]]
+    assert validate_batch("Podcast", metadata) == [["metadata value is missing for 'host'"]]
+    assert validate_batch("AUDIOBOOK", metadata) == [["metadata value is missing for 'author'",
+                                                      "metadata value is missing for 'narrator'"]]
+    assert validate_batch("Song", []) == []
+
+    with pytest.raises(MetadataValueError) as error:
+        validate_batch("Album", metadata)
+
+    assert str(error.value) == "'Album' is not supported"